@@ -0,0 +1,307 @@
+#-------------------------------------------------------------------------------
+#!/usr/bin/env python
+# ========= SELECTION 2 BILL OF MATERIALS - BENCHMARK ==========================
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+
+# ------- DESCRIPTION ----------------------------------------------------------
+#
+# Generates a synthetic assembly scene and times act() in each mode.
+#
+# blender -b --factory-startup --python benchmark/benchmark_selection2bom.py -- \
+#       --depth 3 --fan-out 4 --instances 20 --mesh-density 8 --out benchmark.json
+#
+# The scene: The groups of the deepest level contain mesh parts, the groups of
+# every further level contain instances of groups of the level below. The scene
+# itself contains instances of the top level groups, some of them scaled and
+# rotated. A share of the group instances is atomar, a share of the parts and
+# group instances is optional (by name, see PATTERN_ATOM and PATTERN_OPTIONAL).
+#
+# Per mode the wall time, the count of bpy operator calls and the peak python
+# memory are written as JSON (plus the peak resident set size of the process),
+# thus regressions can be tracked across versions.
+#
+# ------------------------------------------------------------------------------
+
+
+
+#------- IMPORTS --------------------------------------------------------------#
+import bpy
+import os
+import sys
+import json
+import math
+import time
+import random
+import argparse
+import tempfile
+import tracemalloc
+
+from collections import OrderedDict
+
+from mathutils import Matrix
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import object_selection2bom
+
+
+
+#------- GLOBALS --------------------------------------------------------------#
+LIBRARY_SCENE_NAME = 'Selection2BoM-Benchmark-Library'
+SCALES = [1.0, 1.0, 1.0, 2.0, 0.5]
+MATERIALS = ['Steel', 'Aluminium', 'Wood', 'Brass']
+
+
+
+#------- GENERATOR ------------------------------------------------------------#
+#
+# A box of the given dimensions, every face subdivided into density x density quads.
+#
+def create_box_mesh(name, dimensions, density):
+    vertices = []
+    faces = []
+    # For each axis both sides, (u, v) spanning the face, oriented outwards:
+    for axis in range(3):
+        u_axis = (axis + 1) % 3
+        v_axis = (axis + 2) % 3
+        for side in (-1, 1):
+            start = len(vertices)
+            for i in range(density + 1):
+                for j in range(density + 1):
+                    co = [0.0, 0.0, 0.0]
+                    co[axis] = side * dimensions[axis] / 2
+                    co[u_axis] = (i / density - 0.5) * dimensions[u_axis]
+                    co[v_axis] = (j / density - 0.5) * dimensions[v_axis]
+                    vertices.append(co)
+            for i in range(density):
+                for j in range(density):
+                    a = start + i * (density + 1) + j
+                    b = a + density + 1
+                    if side > 0:
+                        faces.append((a, b, b + 1, a + 1))
+                    else:
+                        faces.append((a, a + 1, b + 1, b))
+    mesh = bpy.data.meshes.new(name)
+    mesh.from_pydata(vertices, [], faces)
+    mesh.update()
+    return mesh
+
+
+
+def get_name(base, rnd, atomar_share, optional_share):
+    if rnd.random() < atomar_share:
+        base += '_atom'
+    if rnd.random() < optional_share:
+        base += '_optional'
+    return base
+
+
+
+def create_group_instance(name, group):
+    o = bpy.data.objects.new(name, None)
+    o.dupli_type = 'GROUP'
+    o.dupli_group = group
+    return o
+
+
+
+#
+# @return The statistics of the generated scene.
+#
+def generate_scene(arguments):
+    rnd = random.Random(arguments.seed)
+    scene = bpy.context.scene
+    library_scene = bpy.data.scenes.get(LIBRARY_SCENE_NAME)
+    if library_scene is None:
+        library_scene = bpy.data.scenes.new(LIBRARY_SCENE_NAME)
+
+    vertex_count = 0
+    object_count = 0
+    groups = []
+    for level in range(arguments.depth):
+        level_groups = []
+        for variant in range(arguments.variants):
+            group = bpy.data.groups.new('Assembly_L%d_%d' % (level, variant))
+            for child_index in range(arguments.fan_out):
+                location = (child_index * 2.0, 0.0, 0.0)
+                if level == 0:
+                    dimensions = [rnd.choice([0.01, 0.02, 0.05, 0.1]) for axis in range(3)]
+                    mesh = create_box_mesh('Part_%d_%d_mesh' % (variant, child_index), dimensions, arguments.mesh_density)
+                    o = bpy.data.objects.new(get_name('Part_%d_%d' % (variant, child_index), rnd, 0.0, arguments.optional_share), mesh)
+                    o.active_material = bpy.data.materials.get(MATERIALS[child_index % len(MATERIALS)]) or bpy.data.materials.new(MATERIALS[child_index % len(MATERIALS)])
+                    vertex_count += len(mesh.vertices)
+                else:
+                    o = create_group_instance(get_name('Assembly_L%d_%d_%d' % (level, variant, child_index), rnd, arguments.atomar_share, arguments.optional_share),
+                            rnd.choice(groups[level - 1]))
+                o.location = location
+                library_scene.objects.link(o)
+                group.objects.link(o)
+                object_count += 1
+            level_groups.append(group)
+        groups.append(level_groups)
+    library_scene.update()
+
+    instances = []
+    for instance_index in range(arguments.instances):
+        o = create_group_instance(get_name('Machine_%d' % instance_index, rnd, arguments.atomar_share, arguments.optional_share),
+                rnd.choice(groups[-1]))
+        scale = rnd.choice(SCALES)
+        o.matrix_world = Matrix.Translation((0.0, instance_index * 10.0, 0.0)) * Matrix.Rotation(rnd.choice([0, math.pi / 2]), 4, 'Z') * Matrix.Scale(scale, 4)
+        scene.objects.link(o)
+        instances.append(o)
+        object_count += 1
+    scene.update()
+
+    return instances, OrderedDict([
+            ('objects', object_count),
+            ('groups', arguments.depth * arguments.variants),
+            ('group_instances', object_count - arguments.variants * arguments.fan_out),
+            ('mesh_vertices', vertex_count)
+    ])
+
+
+
+#------- MEASUREMENT ----------------------------------------------------------#
+#
+# The bpy.ops calls of a run are counted by the add-on itself, see RunStatistics.
+#
+# The resident set size is a high-water mark of the whole process (including the
+# scene generation and all previous runs), thus it is reported once, not per mode.
+#
+def get_process_max_rss_kb():
+    if resource is None:
+        return None
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+
+#
+# As tracing allocations slows down python, the memory is measured in a run of its own.
+#
+def run_mode(context, mode, instances, trace_memory=False, show_output=False):
+    context.scene.selection2bom_in_mode = mode
+    for o in context.scene.objects:
+        o.select = o in instances
+    context.scene.objects.active = instances[0]
+    # Cold run, i.e. the dupli group caches of previous runs are not reused:
+    object_selection2bom.cache_resolved_dupli_group_dimensions_map = None
+
+    stdout = sys.stdout
+    if not show_output:
+        sys.stdout = open(os.devnull, 'w')
+    peak_python_memory = None
+    if trace_memory:
+        tracemalloc.start()
+    time_start = time.perf_counter()
+    try:
+        object_selection2bom.act(context)
+    finally:
+        wall_seconds = time.perf_counter() - time_start
+        if trace_memory:
+            peak_python_memory = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+        if not show_output:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    operator_call_count_map = object_selection2bom.run_statistics.call_count_map
+    return OrderedDict([
+            ('mode', mode),
+            ('wall_seconds', round(wall_seconds, 4)),
+            ('operator_calls', sum(operator_call_count_map.values())),
+            ('operator_calls_by_name', OrderedDict(sorted(operator_call_count_map.items()))),
+            ('peak_python_memory_bytes', peak_python_memory),
+            ('bom_entries', len(object_selection2bom.bom_entry_count_map)),
+            ('bom_part_count', sum(object_selection2bom.bom_entry_count_map.values()))
+    ])
+
+
+
+#------- COMMAND LINE ---------------------------------------------------------#
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(prog='blender -b --factory-startup --python benchmark/benchmark_selection2bom.py --',
+            description='Times the Selection 2 BoM add-on on a synthetic assembly scene.')
+    parser.add_argument('--depth', type=int, default=3, help='Levels of nested groups. Default: 3')
+    parser.add_argument('--fan-out', type=int, default=4, help='Objects per group. Default: 4')
+    parser.add_argument('--variants', type=int, default=3, help='Distinct groups per level. Default: 3')
+    parser.add_argument('--instances', type=int, default=20, help='Top level group instances in the scene. Default: 20')
+    parser.add_argument('--mesh-density', type=int, default=4, help='Quads per box face edge. Default: 4')
+    parser.add_argument('--atomar-share', type=float, default=0.1, help='Share of atomar group instances. Default: 0.1')
+    parser.add_argument('--optional-share', type=float, default=0.1, help='Share of optional parts and group instances. Default: 0.1')
+    parser.add_argument('--modes', default='0,1,2', help='Comma separated modes to time. Default: 0,1,2')
+    parser.add_argument('--repeat', type=int, default=1, help='Runs per mode, the fastest is reported. Default: 1')
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--out', default=None, help='JSON result file. Default: stdout')
+    parser.add_argument('--show-output', action='store_true', help='Do not silence the add-on\'s prints.')
+    return parser.parse_args(argv)
+
+
+
+def main(argv):
+    arguments = parse_arguments(argv)
+    context = bpy.context
+    if not hasattr(bpy.types.Scene, 'selection2bom_in_mode'):
+        object_selection2bom.register()
+    # Keep the generated BoMs out of the way:
+    object_selection2bom.output_directory = tempfile.mkdtemp(prefix='selection2bom-benchmark-')
+
+    time_start = time.perf_counter()
+    instances, scene_statistics = generate_scene(arguments)
+    generation_seconds = time.perf_counter() - time_start
+
+    results = []
+    for mode in arguments.modes.split(','):
+        mode = mode.strip()
+        runs = [run_mode(context, mode, instances, show_output=arguments.show_output) for i in range(max(1, arguments.repeat))]
+        result = min(runs, key=lambda run: run['wall_seconds'])
+        memory_run = run_mode(context, mode, instances, trace_memory=True, show_output=arguments.show_output)
+        result['peak_python_memory_bytes'] = memory_run['peak_python_memory_bytes']
+        results.append(result)
+
+    report = OrderedDict([
+            ('addon_version', list(object_selection2bom.bl_info['version'])),
+            ('blender_version', bpy.app.version_string),
+            ('python_version', sys.version.split()[0]),
+            ('parameters', OrderedDict(sorted(vars(arguments).items()))),
+            ('scene', scene_statistics),
+            ('generation_seconds', round(generation_seconds, 4)),
+            ('results', results),
+            ('process_max_rss_kb', get_process_max_rss_kb())
+    ])
+    if arguments.out:
+        with open(arguments.out, 'w') as f:
+            json.dump(report, f, indent=2)
+        print('Benchmark results written to: ', arguments.out)
+    else:
+        print(json.dumps(report, indent=2))
+    return 0
+
+
+
+#------- PROCEDURAL -----------------------------------------------------------#
+if __name__ == "__main__":
+    argv = []
+    if '--' in sys.argv:
+        argv = sys.argv[sys.argv.index('--') + 1:]
+    sys.exit(main(argv))
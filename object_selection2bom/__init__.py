@@ -0,0 +1,4215 @@
+#-------------------------------------------------------------------------------
+#!/usr/bin/env python
+# ========= BLENDER ADD-ON =====================================================
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+bl_info = {
+    "name":         "Selection 2 Bill of Materials",
+    "author":       "macouno, Yorik van Havre, Jan R.I.B.-Wein, worlddevelopment",
+    "version":      (2, 0),
+    "blender":      (2, 7, 3),
+    "location":     "View3D > Tool Shelf > Misc > Selection to Bill of Materials",
+    "description":  "Either creates a Bill of Materials out of selected objects"
+            " (including group instances). Or selects all objects of the current"
+            " scene that are not hidden automatically while sorting out rendering-"
+            " or animation-related objects like lighting, cameras and armatures."
+            "\r\n'Material:<Material>' in the object name overrides material(s)."
+            "\r\nBy default group instances are resolved to the objects of the group"
+            " i.e. a group or instance thereof is no individual standalone part."
+            "\r\nAn option to consider group instances as complete independent"
+            " standalone parts exists. The objects are not resolved and a BoM entry"
+            " for each group instance is created!"
+            "\r\nIn the hybrid mode the group instances and count are listed as part."
+            " In addition every assembly and the objects it is made from are listed."
+            " Nevertheless each of these 'assemblies' is resolved if the same group +"
+            " delta transform combination of the instance empty has not occurred before"
+            " influencing the resulting dimensions."
+            "\r\nObject label, material, dimensions distinguish parts."
+            "\r\nUsage: Hide objects that shall be excluded from the BoM or select"
+            " objects to be included in the BoM explicitely. If no selection is given"
+            " then all the not hidden objects and group instances are examined."
+            "\r\nThe dimensions are calculated from group instance inherited total scale"
+            " times the object dimensions. => Model measurements need to be in real"
+            " world size/units or at least have to be scaled to the desired units!",
+    "wiki_url":     "http://github.com/faerietree/selection2bom",
+    "tracker_url":  "https://projects.blender.org/tracker/index.php?"
+                    "func=detail&aid=",
+    "category":     "Object"
+    #,"warning":      ""
+}
+
+
+# ------- DESCRIPTION ----------------------------------------------------------
+#
+# """PURPOSE"""
+# CREATING A BILL OF MATERIALS OUT OF SELECTED OBJECTS.
+#
+#
+# """WHAT IT DOES"""
+# Depending on settings: (default setting is to resolve selected groups)
+#
+# - either iterate selected objects only and create a bom entry
+#   where the dimensions are calculated from the scale.
+#
+# - or the above and additionally resolve groups and sort out rendering-related
+#   objects like lighting, cameras and armatures (animation related objects).
+
+# ------- LICENSING ------------------------------------------------------------
+# Created by FarieTree Productions (i@ciry.at)
+# It's free, as is, open source and property to the World. But without warranty.
+# Thus use it, improve it, recreate it and please at least keep the
+# origin as in usual citation, i.e. include this Copyright note.
+# LICENSE: creative commons, non-commercial, share-alike.
+#
+# ------------------------------------------------------------------------------
+
+
+
+#------- IMPORTS --------------------------------------------------------------#
+import bpy
+import re
+import os
+import sys
+import json
+import math
+import hashlib
+import time
+import argparse
+import subprocess
+import traceback
+
+from array import array
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+from bpy.props import IntProperty, StringProperty, BoolProperty, EnumProperty
+from bpy.app.handlers import persistent
+
+
+from mathutils import Vector, Matrix
+
+# The part that does not depend on blender:
+from .selection2bom_core import (
+        parse_name, name_table, is_object_atomar, get_entry_label_and_material, is_object_optional, BomKey,
+        add_count, group_instance_contribution_recorders, pop_contribution_recorder, subtract_contributions,
+        TransformChains, LRUCache, PREPEND_IF_OPTIONAL, APPEND_IF_OPTIONAL,
+        BomExporter, build_blueprint_filelink, CsvBomExporter, JsonLinesBomExporter, MarkdownBomExporter, HtmlBomExporter)
+
+# NumPy is bundled with blender, nevertheless fall back to plain python if missing:
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+#------- GLOBALS --------------------------------------------------------------#
+# Messages are shown in the blender console (that is the not python console!) up to this level:
+LOG_LEVELS = ('ERROR', 'WARNING', 'INFO', 'DEBUG')
+LOG_LEVEL_ERROR = 0
+LOG_LEVEL_WARNING = 1
+LOG_LEVEL_INFO = 2
+LOG_LEVEL_DEBUG = 3
+log_level = LOG_LEVEL_INFO
+# Show debug messages. Guard debug output with 'if debug:', thus at lower levels
+# not even the arguments of the message are evaluated.
+debug = False
+
+# Derive group instance (assembly) dimensions analytically from the bounding boxes
+# of the group's objects instead of resolving and joining them via operators.
+# (If blueprints shall be generated the objects are still joined, though only as the
+# geometry of the engineering drawing, the BoM entries keep the analytic dimensions.)
+# NOTE The analytic dimensions are measured along the group instance's scaled axes,
+# the joined object along the axes of the join target (one of the group's objects).
+# Both agree only if the join target is not rotated relative to the group instance.
+use_analytic_dimensions = True
+
+# Compare the analytic group instance dimensions with the join path's and log deviations.
+# NOTE The join path adds and removes temporary objects, thus use this for checking regressions only.
+check_analytic_dimensions_regression = False
+
+# Compare the dimensions the owning group instances' scale is inherited to with the
+# legacy path (temporary object, applied scale, edit mode toggle) and log deviations.
+# NOTE The legacy path adds and removes temporary objects, thus use this for checking regressions only.
+check_scale_inheritance_regression = False
+
+# Where to write the BoM files to instead of next to the .blend file, and what to
+# prepend to their names (set by the command line interface):
+output_directory = None
+output_filename_prepend = ''
+
+
+
+#------- LOGGING --------------------------------------------------------------#
+#
+# @param level One of LOG_LEVELS or its index.
+#
+def set_log_level(level):
+    global log_level
+    global debug
+    if (level in LOG_LEVELS):
+        level = LOG_LEVELS.index(level)
+    log_level = level
+    debug = (log_level >= LOG_LEVEL_DEBUG)
+
+
+
+#
+# The message parts are converted and joined (like print does) only if the level is enabled.
+#
+def log_error(*message_parts):
+    if (log_level >= LOG_LEVEL_ERROR):
+        print(*message_parts)
+
+def log_warning(*message_parts):
+    if (log_level >= LOG_LEVEL_WARNING):
+        print(*message_parts)
+
+def log_info(*message_parts):
+    if (log_level >= LOG_LEVEL_INFO):
+        print(*message_parts)
+
+
+
+#------- INSTRUMENTATION ------------------------------------------------------#
+#
+# Where a run spends its time: Each phase gets the time spent in it, excluding
+# the time of the phases nested in it, thus the phases do not overlap.
+# Additionally the calls of bpy operators (e.g. object.resolve_and_join) are counted.
+#
+PANEL_CALL_COUNT_MAX = 8
+# 'naming' is the name parsing, label and material of the entries:
+PHASES = ('selection', 'snapshot', 'traversal', 'naming', 'dimensions', 'volume', 'blueprints', 'write')
+class RunStatistics:
+
+    def __init__(self):
+        self.phase_seconds = OrderedDict([(phase, 0.0) for phase in PHASES])
+        self.call_count_map = {}
+        self.phase_stack = []
+        self.time_last = time.perf_counter()
+        self.time_last_resumed = self.time_last
+        self.total_seconds = 0.0
+        self.restore_operator_call = None # Not None while running.
+
+    def begin_phase(self, phase):
+        now = time.perf_counter()
+        if (len(self.phase_stack) > 0):
+            self.phase_seconds[self.phase_stack[-1]] += now - self.time_last
+        self.phase_stack.append(phase)
+        self.time_last = now
+
+    # Continues the current phase as the given phase.
+    def switch_phase(self, phase):
+        self.end_phase()
+        self.begin_phase(phase)
+
+    def end_phase(self):
+        now = time.perf_counter()
+        self.phase_seconds[self.phase_stack.pop()] += now - self.time_last
+        self.time_last = now
+
+    def count_call(self, name):
+        self.call_count_map[name] = self.call_count_map.get(name, 0) + 1
+
+    #
+    # A modal run pauses between its time slices, thus neither the time nor the
+    # operator calls of the user interface are attributed to the run.
+    #
+    def resume(self):
+        if (self.restore_operator_call is not None):
+            return
+        self.time_last = time.perf_counter()
+        self.time_last_resumed = self.time_last
+        self.restore_operator_call = install_operator_call_counter()
+
+    def pause(self):
+        if (self.restore_operator_call is None):
+            return
+        now = time.perf_counter()
+        if (len(self.phase_stack) > 0):
+            self.phase_seconds[self.phase_stack[-1]] += now - self.time_last
+        self.total_seconds += now - self.time_last_resumed
+        self.time_last = now
+        self.restore_operator_call()
+        self.restore_operator_call = None
+
+    def finish(self):
+        self.pause()
+
+    def to_dict(self):
+        return OrderedDict([
+                ('total_seconds', round(self.total_seconds, 4)),
+                ('phase_seconds', OrderedDict([(phase, round(seconds, 4)) for phase, seconds in self.phase_seconds.items()])),
+                ('calls', OrderedDict(sorted(self.call_count_map.items(), key=lambda item: -item[1])))
+        ])
+
+
+
+#
+# Function decorator: The function call is a phase of its own.
+#
+def measured_phase(phase):
+    def decorate(function):
+        def measured(*args, **kwargs):
+            # Called outside of a run?
+            if (run_statistics is None):
+                return function(*args, **kwargs)
+            run_statistics.begin_phase(phase)
+            try:
+                return function(*args, **kwargs)
+            finally:
+                run_statistics.end_phase()
+        measured.__name__ = function.__name__
+        measured.__doc__ = function.__doc__
+        return measured
+    return decorate
+
+
+
+#
+# Counts the bpy operator calls while the returned restore function is not called.
+# (All operators share one callable type.)
+#
+def install_operator_call_counter():
+    operator_type = type(bpy.ops.object.select_all)
+    call = operator_type.__call__
+
+    def counting_call(self, *args, **kwargs):
+        run_statistics.count_call(self.idname_py())
+        return call(self, *args, **kwargs)
+
+    operator_type.__call__ = counting_call
+    def restore():
+        operator_type.__call__ = call
+    return restore
+
+
+
+def write_run_statistics(context, filelink):
+    statistics = run_statistics.to_dict()
+    statistics['mode'] = context.scene.selection2bom_in_mode
+    statistics['bom_entry_count'] = len(bom_entry_count_map)
+    statistics['assembly_bom_entry_cache_hit_count'] = assembly_bom_entry_cache_hit_count
+    statistics['dupli_group_dimensions_cache'] = cache_resolved_dupli_group_dimensions_map.get_statistics()
+    statistics['dupli_group_volume_cache'] = cache_resolved_dupli_group_volume_map.get_statistics()
+    statistics_filelink = os.path.splitext(filelink)[0] + '.statistics.json'
+    with open(statistics_filelink, 'w') as f:
+        json.dump(statistics, f, indent=2)
+    return statistics_filelink
+
+
+
+#------- FUNCTIONS ------------------------------------------------------------#
+#
+# Guarantuee a valid initial state.
+#
+def initaddon(context):
+    global bom_entry_count_map
+    global bom_entry_info_map
+    global bom_entry_variant_map
+    global assembly_count_map
+    global assembly_bom_entry_count_map
+    bom_entry_count_map = {}
+    bom_entry_info_map = {}  # url, part id, ...
+    bom_entry_variant_map = {}  # apply modifiers, then different volume => different postprocessing/part/variant ...
+    assembly_count_map = {}
+    assembly_bom_entry_count_map = {}
+
+    global entry_count_highest_digit_count
+    entry_count_highest_digit_count = 0
+    global object_longest_label_len
+    object_longest_label_len = 0
+    global material_longest_label_len
+    material_longest_label_len = 0
+
+    init_live(context)
+    init_run(context)
+
+
+
+#
+# The state of a single run. A live update keeps the BoM maps, see init_live.
+#
+def init_run(context):
+    set_log_level(context.scene.selection2bom_in_log_level)
+
+    global bom_filelinks
+    bom_filelinks = []
+
+    load_persistent_caches(context)
+    global group_content_hash_map
+    group_content_hash_map = {}
+    global mesh_content_hash_map
+    mesh_content_hash_map = {}
+    global mesh_volume_map
+    mesh_volume_map = {}
+
+    global group_instance_contributions_cache
+    group_instance_contributions_cache = {}
+    del group_instance_contribution_recorders[:]
+
+    global assembly_bom_entry_cache
+    assembly_bom_entry_cache = {}
+    global assembly_bom_entry_cache_hit_count
+    assembly_bom_entry_cache_hit_count = 0
+    global transform_chains
+    transform_chains = TransformChains(Matrix.Identity(3), lambda o: to_matrix(o.matrix_basis).to_3x3(), is_object_optional)
+    global candidate_index
+    candidate_index = None
+    name_table.clear()
+
+    global run_statistics
+    run_statistics = RunStatistics()
+
+
+#
+# The scene objects read once per run: the visibility of each scene object, the
+# candidates of the automatic selection. Both the automatic selection and the traversal (via the
+# snapshot) read this index instead of the objects.
+#
+class CandidateIndex:
+    __slots__ = ('objects', 'visibility_map')
+
+    def __init__(self, objects, visibility_map):
+        self.objects = objects
+        self.visibility_map = visibility_map
+
+
+
+#
+# Hidden objects are skipped no matter the settings as this way one has the choice
+# to either include objects via selecting or exclude objects by hiding those.
+#
+def is_candidate_object(o):
+    # dupli group can theoretically be attached to any object, but we only consider those:
+    return not o.hide and o.type is not None and is_object_type_considered(o.type)
+
+
+
+candidate_index = None
+@measured_phase('selection')
+def build_candidate_index(context):
+    scene = context.scene
+    candidate_objects = []
+    visibility_map = {}
+    for o in scene.objects:
+        visibility_map[o] = is_object_visible(context, o)
+        if (is_candidate_object(o)):
+            candidate_objects.append(o)
+
+    if debug:
+        print('Candidate index built: ', len(candidate_objects), ' candidates of ', len(visibility_map), ' scene objects.')
+    return CandidateIndex(tuple(candidate_objects), visibility_map)
+
+
+
+#
+# Guess visible, compatible objects automatically. Neither the selection nor the
+# active object is changed.
+#
+# @return The objects to create the BoM of.
+#
+@measured_phase('selection')
+def select_automagically(context):
+    #if debug:
+    log_info('No selection! Automatically guessing what to select. (hidden objects are not selected)')
+    # Select depending on if it is a mechanical object. TODO Improve decision taking.
+    for o in candidate_index.objects:
+        # Increase the counter for this object as another reference was found?
+        object_reference_count[o] = object_reference_count.get(o, 0) + 1
+        is_longest_object_label_then_store_len(o)  # keep track of longest label length
+        is_longest_material_then_store_len(material=o.active_material)
+        if debug:
+            print('Auto-selection: ', o)
+    return list(candidate_index.objects)
+
+
+
+#
+# Selects exactly the given objects again.
+#
+def restore_selection(context, selected_objects, active_object):
+    for o in context.selected_objects:
+        o.select = False
+    for o in selected_objects:
+        o.select = True
+    context.scene.objects.active = active_object
+
+
+
+#
+# Whether objects on hidden layers are examined as if all layers were visible (to
+# prevent resolved objects (from group instances) not being listed in the BoM).
+# The layers are not switched for this because that re-evaluates everything on the
+# hidden layers, see is_object_visible. Only the operators need visible layers.
+#
+are_hidden_layers_included = False
+scene_layers_to_restore = None
+def is_object_visible(context, o):
+    if (are_hidden_layers_included):
+        # As Object.is_visible(scene) if all layers of the scene were visible:
+        return not o.hide and any(o.layers)
+    return o.is_visible(context.scene)
+
+
+
+#
+# Makes all layers visible until restore_layers() is called, if required by a run.
+#
+def show_all_layers(context):
+    global scene_layers_to_restore
+    if (not are_hidden_layers_included or scene_layers_to_restore is not None):
+        return
+    if debug:
+        print('Making all layers visible for the operators.')
+    scene_layers_to_restore = list(context.scene.layers) # get a copy.
+    context.scene.layers = (True, True, True, True, True,  True, True, True, True, True,  True,
+            True, True, True, True, True,  True, True, True, True)
+
+
+
+def restore_layers(context):
+    global scene_layers_to_restore
+    if (scene_layers_to_restore is not None):
+        context.scene.layers = scene_layers_to_restore
+        scene_layers_to_restore = None
+
+
+
+#
+# ACT
+# @return always returns True or False
+object_reference_count = {}
+run_statistics = None
+def act(context):
+    run = act_incrementally(context)
+    while True:
+        try:
+            next(run)
+        except StopIteration as stop:
+            return stop.value
+
+
+
+#
+# The run as a generator: Yields once the run is set up and then the progress
+# (work items done, work items total) after each work item of the traversal, thus
+# the caller decides how much is done at a time. Closing the generator cancels the run.
+#
+def act_incrementally(context):
+    global is_run_active
+    if (is_live_update_possible(context)):
+        init_run(context)
+        run = update_bill_of_materials(context)
+    else:
+        initaddon(context)
+        run = create_bill_of_materials(context)
+    is_run_active = True
+    is_completed = False
+    run_statistics.resume()
+    try:
+        # The run is set up:
+        yield (0, 1)
+        result = yield from run
+        is_completed = True
+        return result
+    finally:
+        is_run_active = False
+        remove_scratch_objects()
+        # The live BoM is inconsistent if the run did not complete:
+        if (not is_completed):
+            clear_live()
+        else:
+            save_persistent_caches()
+        run_statistics.finish()
+        log_info('Time per phase: ', run_statistics.to_dict())
+        if (len(bom_filelinks) > 0):
+            log_info('Run statistics written to: ', write_run_statistics(context, bom_filelinks[0]))
+
+
+
+def create_bill_of_materials(context):
+    global bom_entry_count_map
+    global bom_entry_info_map
+    global assembly_count_map
+    global assembly_bom_entry_count_map
+
+    if debug:
+        print('Engine started ... (acting according to setting)')
+    ############
+    #preparation - selection
+    ############
+    selected_objects_to_restore = list(context.selected_objects)
+    active_object_to_restore = context.scene.objects.active
+
+    #----------#
+    # At this point a selection must have been made either using
+    # 'select by pattern' add-on or by manually selecting the objects/items.
+    #----------#
+    objects = list(context.selected_objects)
+    # Examine the objects on all layers to prevent resolved objects (from group instances) not
+    # being listed in the BoM:
+    global are_hidden_layers_included
+    are_hidden_layers_included = len(objects) > 0
+    global live_are_hidden_layers_included
+    live_are_hidden_layers_included = are_hidden_layers_included
+    global candidate_index
+    candidate_index = build_candidate_index(context)
+    # Otherwise an effort is undertaken to automatically select mechanical parts.(visible only)
+    if (len(objects) == 0):
+        objects = select_automagically(context)
+
+    ############
+    # Now there must be a selection or we abort the mission.
+    ############
+    #Now at last we have a selection? Either set up manually or selected automatically.
+    if (len(objects) == 0):
+        if debug:
+            print('Selection is still empty! Mission aborted.')
+        return {'CANCELLED'}
+
+    ############
+    # Filelink attribute to be determined according to scene label
+    # or active object or selection object at position 0:
+    ############
+    filelink = build_filelink(context)
+
+    ############
+    # Copy the selected scene graph once, the traversal then reads the snapshot only:
+    ############
+    global scene_snapshot
+    scene_snapshot = take_scene_snapshot(context, objects)
+    if (live_contributions_map is not None):
+        index_live_dependencies(context, scene_snapshot)
+
+
+    ##########
+    # OBJECTS (including group instances as those are attached to objects, see dupligroup
+    #          http://wiki.blender.org/index.php/Doc:2.7/Manual/Modeling/Objects/Duplication/DupliGroup)
+    ##########
+    # The scene layers (if made visible for operators) are restored even if a group cycle aborts the traversal:
+    try:
+        result = yield from create_bom_entries_incrementally(context, scene_snapshot.selected_objects, [], filelink=filelink)#the snapshot objects
+                                                               #still reference the live objects, which is required
+                                                               #because we have to create new temporary selections
+                                                               #later on while diving deep in the
+                                                               #create_bom_entry_recursion adventure!
+        #Something went wrong?
+        if (result is None or not result):
+            if debug:
+                print('creating bom entry not successful => aborting')
+            #return False#selection_result
+        else:
+            global bom_filelinks
+            bom_filelinks = write2file(context, bom_entry_count_map, bom_entry_info_map, assembly_count_map, assembly_bom_entry_count_map, filelink)
+        log_info('Assembly BoM entries reused from cache: ', assembly_bom_entry_cache_hit_count)
+        log_info('Dupli group dimensions cache: ', cache_resolved_dupli_group_dimensions_map.get_statistics())
+        log_info('Dupli group volume cache: ', cache_resolved_dupli_group_volume_map.get_statistics())
+
+    finally:
+        # Leave the selection as it was before the run, also because the next run
+        # compares it to decide whether a live update is possible (see get_live_settings):
+        restore_selection(context, selected_objects_to_restore, active_object_to_restore)
+        restore_layers(context)
+
+
+    return {'FINISHED'} # Because groups itself not yet are supported and are a distinct mode in itself.
+
+
+
+    ##########
+    # GROUPS (not group instances, those are attached to objects and therefore already handled above when iterating the scene objects!)
+    ##########
+    #Groups are not represented by any data in a scene. As such it's no problem if the objects in a scene are wildly grouped.
+    #Those groups will have no influence on the generated Bill of Materials (BoM). Only instances have an effect.
+    #The effect of group instances is twofold:
+    #1) Instances are high level parts, containing objects, i.e. other parts.
+    #2) Instances are self-contained standalone parts.
+
+    #(And should not be resolved. => Here the material has to be specified explicitely or will be stated as mixed.)
+
+    #global bom_entry_count_map
+    #bom_entry_count_map = {}    #clear the map/dictionary --> now appending to the already created BoM for objects/group instances.
+    append_to_file(context, "\r\n\n\nGROUPS OF SCENE\r\n")
+    #TODO Create separate bom_entry_count_map for groups, because until now here several lines are added redundantly!
+
+
+    for g in bpy.data.groups:#bpy.types.BlendData.groups:
+
+        #examine if all objects are in the current context scene
+        are_all_objects_in_context_scene = True
+        for o in g.objects:
+            if not o.is_visible(context.scene):
+                are_all_objects_in_context_scene = False
+                break#cancel further examination
+
+        #Is this group not completely in the current/context scene?
+        if (not are_all_objects_in_context_scene):
+            if debug:
+                print('Not all objects of this group ', g, ' are (visible) in this scene: ', context.scene)
+            continue#next Group within the blend file
+
+        #Add this group to the bill of materials as standalone complete part on its own (not resolving to objects)?
+        if (not context.scene.selection2bom_in_mode == '0'):#not resolve_groups):
+            #group has a partname identifier and this hopefully contains a material:<material>,
+            # => try to compile a bom entry out of this, if not possible then lookup the material from the objects,
+            # => i.e. either compose a list of materials being used in the group (Aluminium, Stainless Steel, Diamond)
+            #         or give a label like 'mixed'.
+            # If no material can be resolved then use 'undefined' or rather '-'.
+            bom_entry = build_and_store_bom_entry_out_of_group(context, g)
+            append_to_file(context, bom_entry)
+            #resolve all group instances created out of this group:
+            for o_g in g.users_dupli_group:
+                #examine group instance
+                if o_g.dupli_group is None or len(o_g.dupli_group.objects) == 0:
+                    if debug:
+                        print('dupli group/group instance was None/null or no objects'
+                                'were contained. Object count: ', len(o_g.dupli_group.objects))
+                    continue
+
+                bom_entry = build_and_store_bom_entry(context, o_g, filelink=filelink)
+                #build_bom_entry() is not enough as we have to keep track of the occurence counts => and store
+                append_bom_entry_to_file(context, bom_entry)
+
+
+            continue#no further examination of the group's objects
+
+        #######
+        # RESOLVE GROUP TO OBJECTS
+        #######
+        #Then in this mode all the objects that make up the group are put into the bill of materials separately.
+        for o in g.objects:
+            bom_entry = build_and_store_bom_entry(context, o, filelink=filelink)
+            #build_bom_entry() is not enough as we have to keep track of the occurence counts => and store
+            append_bom_entry_to_file(context, bom_entry)
+
+
+
+
+
+    #Everything was fine then!
+    return True#selection_result
+
+    ############
+    #act-furthermore
+    ############
+    #nothing so far ..
+    #but a smiley :) highly underestimated
+
+
+
+#
+#
+#
+object_longest_label_len = 0
+def is_longest_object_label_then_store_len(o):
+    global object_longest_label_len
+    #keep track of the longest object name to fill up with zeros not to break the bill of materials structure:
+    o_label = getBaseName(o.name)
+    letter_count = len(o_label)
+    if (letter_count > object_longest_label_len):
+        object_longest_label_len = letter_count
+        if debug:
+            print("Keeping track of longest object label's length. New longest length: ", object_longest_label_len)
+    #elif debug:
+    #    print("Keeping track of longest object label's length. Longest length (no change): ", object_longest_label_len)
+
+
+
+#
+#
+#
+material_longest_label_len = 0
+#def is_longest_material_then_store_len(material):
+def is_longest_material_then_store_len(material_label='', material=None):
+    global material_longest_label_len
+    if (material is None and material_label == ''):
+        return False
+    #keep track of the longest material name to fill up with zeros not to break the bill of materials structure:
+    m_label = '-'
+    if (material is None):
+        m_label = getBaseName(material_label)
+    else :
+        m_label = getBaseName(material.name)
+
+    letter_count = len(m_label)
+    if (letter_count > material_longest_label_len):
+        material_longest_label_len = letter_count
+        if debug:
+            print('Keeping track of longest material label\'s length. Longest length: ', material_longest_label_len)
+    #elif debug:
+    #    print('Keeping track of longest material label\'s length. Longest length (no change): ', material_longest_label_len)
+
+
+
+#
+#
+#
+entry_count_highest_digit_count = 0
+def is_longest_entry_count_then_store_len(entry_count):
+    global entry_count_highest_digit_count
+    count = len(str(entry_count))
+    if (count > entry_count_highest_digit_count):
+        entry_count_highest_digit_count = count
+        if debug:
+            print("Keeping track of longest entry count, i.e. highest digit count: ", entry_count_highest_digit_count)
+    #elif debug:
+    #    print("Keeping track of longest entry count, i.e. highest digit count (no change): ", entry_count_highest_digit_count)
+
+
+
+
+
+
+
+
+
+
+#------- SCENE SNAPSHOT -------------------------------------------------------#
+#
+# The selected scene graph is copied once into plain python records, so that the
+# traversal and the derivation of BoM entries neither depend on nor pay for RNA
+# attribute access (every access is a round trip from python to C). Names are
+# interned, matrices and bounding boxes are flat float tuples (row-major) and
+# dupli groups are referenced by index.
+#
+# Only operator based code paths (e.g. joining) and the live mode use the live
+# object and group references.
+#
+class SnapshotObject:
+    __slots__ = ('index', 'name', 'type', 'group_index', 'matrix_basis', 'matrix_world',
+            'scale', 'delta_scale', 'dimensions', 'bound_box', 'material', 'data_name',
+            'modifier_count', 'is_visible', 'hide', 'object')
+
+    def __init__(self, **kwargs):
+        for attribute in SnapshotObject.__slots__:
+            object.__setattr__(self, attribute, kwargs.get(attribute))
+
+    def __setattr__(self, attribute, value):
+        raise AttributeError('Snapshot objects are immutable.')
+
+    def __repr__(self):
+        return '<SnapshotObject %d %s>' % (self.index, self.name)
+
+
+
+class SnapshotGroup:
+    __slots__ = ('index', 'name', 'dupli_offset', 'objects', 'group')
+
+    def __init__(self, **kwargs):
+        for attribute in SnapshotGroup.__slots__:
+            object.__setattr__(self, attribute, kwargs.get(attribute))
+
+    def __setattr__(self, attribute, value):
+        raise AttributeError('Snapshot groups are immutable.')
+
+    def __repr__(self):
+        return '<SnapshotGroup %d %s>' % (self.index, self.name)
+
+
+
+class SceneSnapshot:
+    __slots__ = ('objects', 'groups', 'selected_objects')
+
+    def __init__(self, objects, groups, selected_objects):
+        object.__setattr__(self, 'objects', objects)
+        object.__setattr__(self, 'groups', groups)
+        object.__setattr__(self, 'selected_objects', selected_objects)
+
+    def __setattr__(self, attribute, value):
+        raise AttributeError('Scene snapshots are immutable.')
+
+
+
+def flatten(rows):
+    return tuple([float(v) for row in rows for v in row])
+
+
+
+#
+# Row-major flat 4x4 float tuple to matrix.
+#
+def to_matrix(matrix_flat):
+    return Matrix([matrix_flat[0:4], matrix_flat[4:8], matrix_flat[8:12], matrix_flat[12:16]])
+
+
+
+#
+# Flat bounding box float tuple to its 8 corners.
+#
+def to_corners(bound_box_flat):
+    return [bound_box_flat[i:i + 3] for i in range(0, 24, 3)]
+
+
+
+#
+# Copies the given objects and all (nested) dupli groups and their objects
+# reachable from them into a SceneSnapshot. Each object and group is read once.
+#
+@measured_phase('snapshot')
+def take_scene_snapshot(context, objects):
+    object_indices = {}
+    group_indices = {}
+    objects_ordered = []
+    groups_ordered = []
+
+    # Discover all reachable objects and groups:
+    stack = list(objects)
+    stack.reverse()
+    while len(stack) > 0:
+        o = stack.pop()
+        if o in object_indices:
+            continue
+        object_indices[o] = len(objects_ordered)
+        objects_ordered.append(o)
+        group = o.dupli_group
+        if group is None or group in group_indices:
+            continue
+        group_indices[group] = len(groups_ordered)
+        groups_ordered.append(group)
+        group_objects = list(group.objects)
+        group_objects.reverse()
+        stack.extend(group_objects)
+
+    # The visibility of the scene objects is known from the candidate index:
+    visibility_map = {}
+    if (candidate_index is not None):
+        visibility_map = candidate_index.visibility_map
+    snapshot_objects = []
+    for o in objects_ordered:
+        is_visible = visibility_map.get(o)
+        if (is_visible is None):
+            is_visible = is_object_visible(context, o)
+        group_index = -1
+        if o.dupli_group is not None:
+            group_index = group_indices[o.dupli_group]
+        material = None
+        if o.active_material is not None:
+            material = sys.intern(o.active_material.name)
+        data_name = None
+        if o.data is not None:
+            data_name = sys.intern(o.data.name)
+        snapshot_objects.append(SnapshotObject(
+                index = len(snapshot_objects),
+                name = sys.intern(o.name),
+                type = sys.intern(o.type),
+                group_index = group_index,
+                matrix_basis = flatten(o.matrix_basis),
+                matrix_world = flatten(o.matrix_world),
+                scale = tuple(o.scale),
+                delta_scale = tuple(o.delta_scale),
+                dimensions = tuple(o.dimensions),
+                bound_box = flatten(o.bound_box),
+                material = material,
+                data_name = data_name,
+                modifier_count = len(o.modifiers),
+                is_visible = is_visible,
+                hide = o.hide,
+                object = o
+        ))
+    snapshot_objects = tuple(snapshot_objects)
+
+    snapshot_groups = []
+    for group in groups_ordered:
+        snapshot_groups.append(SnapshotGroup(
+                index = len(snapshot_groups),
+                name = sys.intern(group.name),
+                dupli_offset = tuple(group.dupli_offset),
+                objects = tuple([snapshot_objects[object_indices[group_object]] for group_object in group.objects]),
+                group = group
+        ))
+    snapshot_groups = tuple(snapshot_groups)
+
+    selected_objects = tuple([snapshot_objects[object_indices[o]] for o in objects])
+    if debug:
+        print('Scene snapshot taken: ', len(snapshot_objects), ' objects, ', len(snapshot_groups), ' groups.')
+    return SceneSnapshot(snapshot_objects, snapshot_groups, selected_objects)
+
+
+
+#
+# @return the SnapshotGroup attached to the snapshot object or None.
+#
+scene_snapshot = None
+def get_dupli_group(o):
+    if o.group_index == -1:
+        return None
+    return scene_snapshot.groups[o.group_index]
+
+
+
+#
+# @return group index -> count of the work items of resolving an instance of the
+# group, i.e. of all the (nested) objects. A cycle is counted once.
+#
+def count_group_work_items(groups):
+    counts = {}
+    for group in groups:
+        # Depth first, a group is counted after its nested groups:
+        stack = [(group, False)]
+        in_progress = set()
+        while (len(stack) > 0):
+            g, is_expanded = stack.pop()
+            if (is_expanded):
+                in_progress.discard(g.index)
+                counts[g.index] = sum([1 + counts.get(o.group_index, 0) for o in g.objects])
+                continue
+            if (g.index in counts or g.index in in_progress):
+                continue
+            in_progress.add(g.index)
+            stack.append((g, True))
+            for o in g.objects:
+                if (o.group_index != -1 and o.group_index not in counts and o.group_index not in in_progress):
+                    stack.append((groups[o.group_index], False))
+    return counts
+
+
+
+def count_work_items(o_bjects, group_work_item_counts):
+    if (type(o_bjects) is SnapshotObject):
+        return 1 + group_work_item_counts.get(o_bjects.group_index, 0)
+    return 1 + sum([count_work_items(o, group_work_item_counts) for o in o_bjects])
+
+
+
+#
+# Raised if a group (indirectly) contains an instance of itself.
+#
+class GroupCycleError(Exception):
+    pass
+
+
+
+def format_group_chain(groups):
+    return ' -> '.join([group.name for group in groups])
+
+
+
+#CREATE BOM ENTRY FROM OBJECT
+# Work stack actions:
+ACTION_CREATE_BOM_ENTRY = 0
+ACTION_GROUP_INSTANCE_DONE = 1
+ACTION_LIVE_OBJECT_DONE = 2
+#
+# Walks the objects and the resolved group instances depth first. An explicit work
+# stack is used instead of recursion, thus deep hierarchies neither pay python frame
+# overhead nor hit the interpreter recursion limit.
+# @raise GroupCycleError if a group instance is encountered within its own group.
+#
+# A generator: Yields the progress (work items done, work items total) after each
+# work item, see act_incrementally. The total is estimated from the snapshot. A group
+# instance that is not resolved (atomar, replayed, ...) accounts for its whole subtree.
+#
+group_instance_contributions_cache = {}
+def create_bom_entries_incrementally(context, o_bjects, owning_group_instance_objects, recursion_depth=0, filelink=None):
+    if debug:
+        print(str(recursion_depth) + ' Creating BoM entry recursively ...')
+
+    group_work_item_counts = count_group_work_items(scene_snapshot.groups)
+    work_done = 0
+    work_total = count_work_items(o_bjects, group_work_item_counts)
+
+    run_statistics.begin_phase('traversal')
+    try:
+        work_stack = [(ACTION_CREATE_BOM_ENTRY, o_bjects, recursion_depth)]
+        while (len(work_stack) > 0):
+            action, item, depth = work_stack.pop()
+            if (action == ACTION_GROUP_INSTANCE_DONE):
+                finish_group_instance(item, owning_group_instance_objects)
+                continue
+            if (action == ACTION_LIVE_OBJECT_DONE):
+                finish_live_object(item)
+                continue
+            # Record the contributions of each top level object for live updates:
+            if (live_contributions_map is not None and type(item) is SnapshotObject and len(owning_group_instance_objects) == 0):
+                group_instance_contribution_recorders.append([])
+                work_stack.append((ACTION_LIVE_OBJECT_DONE, item, depth))
+            work_stack_size = len(work_stack)
+            create_bom_entry(context, item, owning_group_instance_objects, work_stack, recursion_depth=depth, filelink=filelink)
+            work_done += 1
+            if (type(item) is SnapshotObject and len(work_stack) == work_stack_size):
+                work_done += group_work_item_counts.get(item.group_index, 0)
+            yield (work_done, work_total)
+    finally:
+        run_statistics.end_phase()
+
+    return {'FINISHED'}
+
+
+
+#
+# All objects of a resolved group instance are done (the work stack is LIFO).
+#
+def finish_group_instance(group_instance, owning_group_instance_objects):
+    o_bjects, signature, contributions, owning_group_instance_objects_key = group_instance
+    group_instance_contributions_cache[signature] = pop_contribution_recorder()
+
+    # The assembly entry is not required anymore as all objects of this group instance are done:
+    assembly_bom_entry_cache.pop(owning_group_instance_objects_key, None)
+    transform_chains.discard(owning_group_instance_objects_key)
+    owning_group_instance_objects.pop()
+
+
+
+#
+# Creates the BoM entry of a single object. The objects a group instance resolves to
+# are not examined here but pushed onto the work stack.
+#
+def create_bom_entry(context, o_bjects, owning_group_instance_objects, work_stack, recursion_depth=0, filelink=None):
+
+    if (recursion_depth > context.scene.after_how_many_create_bom_entry_recursions_to_abort):
+        if debug:
+            print('Failed creating bom entries in time. Recursion limit exceeded: '
+                    , recursion_depth)
+        return {'CANCELLED'}
+
+
+
+    if debug:
+        print(str(recursion_depth) + ' Encountered: ', o_bjects, ' type: ', type(o_bjects))
+
+
+
+    #termination condition will be checked here:
+    #-------
+    # OBJECT?
+    #-------
+    if type(o_bjects) is SnapshotObject:
+
+        is_longest_object_label_then_store_len(o_bjects)
+        if debug:
+            print(str(recursion_depth) + ' Encountered an object: ', o_bjects, ' blender-Type: ', o_bjects.type)
+
+
+        #Is object type considered? (not considered are e.g. armatures.)
+        #dupligroup/groupinstance can theoretically be attached to any object, but we only consider those:
+        if (is_object_type_considered(o_bjects.type)):#(o_bjects has to be an object for type to exist)
+
+            #is_to_be_listed_into_bom = False
+            # Evaluate the object type and current mode:
+            dupli_group = get_dupli_group(o_bjects)
+
+            #Is not a group instance?
+            if (dupli_group is None):
+                    #or o_bjects.dupli_type is not 'GROUP'<--TODO:superfluous? What effects does changing the duplitype setting have?
+                if (not o_bjects.is_visible):
+                    if debug:
+                        print('Object ', o_bjects,' is not visible in the current scene: ', context.scene)
+                    return {'CANCELLED'}
+
+                # This object is not functioning as a group instance container!
+                # In all modes, these objects get an entry in the BoM.
+                if (not build_and_store_bom_entry(context, o_bjects, owning_group_instance_objects, filelink=filelink)):
+                    if debug:
+                        print('Failed to write bom entry to file. ', o_bjects, recursion_depth)
+                    return {'CANCELLED'}
+
+                return {'FINISHED'}
+
+
+            #NOTE: PAY ATTENTION TO BLANK LINES - COMPILER COULD ASSUME THE ELIF STATEMENT IS ALREADY DONE.
+
+            #Is a group instance?
+            elif (dupli_group is not None
+                    #and o_bjects.dupli_type is 'GROUP'<--TODO:superfluous? What effects does changing the duplitype setting have?
+                    #THE DUPLI_TYPE IS ONLY RELEVANT FOR NEWLY CREATED DUPLICATIONS/REFERENCES FROM THE OBJECT!
+                    #THE TYPE OF THE GROUP (o_bjects.dupli_group:bpy.types.Group) IS INTERESTING BUT IS 'GROUP' ANYWAY ELSE IT WERE NO GROUP!
+                    #Is a group but has no objects in the group?
+                    and (len(dupli_group.objects) > 0)): # If no objects are linked here the creation of a BoM entry is pointless.
+                if debug:
+                    print('It\'s a Group instance! Attached dupli group: ', dupli_group)
+
+                bom_entry = None
+                #Resolving groups is not desired?
+                if (context.scene.selection2bom_in_mode == '0'):
+                    if debug:
+                        print('Group shall not be resolved. Is considered a standalone complete part on its own.')
+                    #This object is functioning as a group instance container and resembles a standalone mechanical part!
+                    #is_to_be_listed_in_bom = True
+                    if (not o_bjects.is_visible):
+                        if debug:
+                            print('Object ', o_bjects,' is not visible in the current scene: ', context.scene)
+                        return {'CANCELLED'}
+                    if (not build_and_store_bom_entry(context, o_bjects, owning_group_instance_objects, filelink=filelink)): #<-- still attach it to a possible parent group instance.
+                        if debug:
+                            print('Failed to write bom entry of group instance to file: ', o_bjects, '\t dupli group: ', dupli_group)
+                        return {'CANCELLED'}
+                    return {'FINISHED'}
+
+                # Hybrid mode? i.e. list in bom and resolve objects too?
+                elif (context.scene.selection2bom_in_mode == '2'):
+                    if debug:
+                        print('Hybrid Mode: Group instances/assemblies are both listed in the bom and resolved.')#,
+                        #' A tree is the desired result, i.e. This assembly exists x times and it is assembled',
+                        #' using the following parts.')
+                    #is_to_be_listed_in_bom = True
+                    #is_group_instance_and_needs_to_be_resolved = True
+                    if (not o_bjects.is_visible):
+                        if debug:
+                            print('Object ', o_bjects,' is not visible in the current scene: ', context.scene)
+                        return {'CANCELLED'}
+                    bom_entry = build_and_store_bom_entry(context, o_bjects, owning_group_instance_objects, filelink=filelink)
+                    if (not bom_entry):
+                        if debug:
+                            print('Failed to write bom entry of group instance to file: ', o_bjects, '\t dupli group: ', dupli_group)
+                # Both mode 1 and 2 need to resolve the group into its objects (if they are not atomar):
+                if (is_object_atomar(o_bjects)):
+                    return {'FINISHED'}
+
+                # Attempt to resolve the group instance into the objects the group contains:
+                resolve_group_result = dupli_group.objects#resolve_group(group)
+
+                #if (context.scene.selection2bom_in_mode == '2'):
+                #    build_and_store_bom_entry(context, '------- Parts of assembly `' + o_bjects.dupli_group.name + '`: -------')
+                #    #more generic as not every group instance may be a coherent assembly: build_and_store_bom_entry(context, '------- Grouped Parts `' + o_bjects.dupli_group.name + '`: -------')
+                if (resolve_group_result is None or (len(resolve_group_result) < 1)):
+                    #Group was not resolved successfully!
+                    if debug:
+                        print('Failed to resolve a group or group was empty. ', str(dupli_group))
+                    return {'CANCELLED'}
+
+                # Group resolved into objects!
+                if debug:
+                    print('Resolved a group. Count of objects in group: ', len(resolve_group_result))
+
+                # Fail fast if this group instance is nested within an instance of the same group:
+                for owning_group_instance_object in owning_group_instance_objects:
+                    if (owning_group_instance_object.group_index == o_bjects.group_index):
+                        groups = [get_dupli_group(ogio) for ogio in owning_group_instance_objects]
+                        groups.append(dupli_group)
+                        raise GroupCycleError('Group contains an instance of itself: ' + format_group_chain(groups[groups.index(dupli_group):]))
+
+                owning_group_instance_objects.append(o_bjects)
+                owning_group_instance_objects_key = tuple(owning_group_instance_objects)
+                if (bom_entry):
+                    # This also is the assembly entry of all the objects of this group instance, except that
+                    # the assembly entry (see get_assembly_bom_entry) inherits the group instance's own optional flag:
+                    if (not bom_entry.is_optional and is_object_optional(o_bjects)):
+                        bom_entry = BomKey(bom_entry.label, bom_entry.material, bom_entry.dimensions, True)
+                    assembly_bom_entry_cache[owning_group_instance_objects_key] = bom_entry
+
+                # Already resolved a group instance of the same signature? Then reuse its counts:
+                signature = get_group_instance_signature(o_bjects, owning_group_instance_objects_key)
+                if (signature in group_instance_contributions_cache):
+                    if debug:
+                        print('Replaying the counts of an equal group instance instead of resolving: ', o_bjects)
+                    replay_contributions(group_instance_contributions_cache[signature])
+                    assembly_bom_entry_cache.pop(owning_group_instance_objects_key, None)
+                    transform_chains.discard(owning_group_instance_objects_key)
+                    owning_group_instance_objects.pop()
+                    return {'FINISHED'}
+
+                contributions = []
+                group_instance_contribution_recorders.append(contributions)
+                # Finish this group instance after all of its objects are done:
+                work_stack.append((ACTION_GROUP_INSTANCE_DONE, (o_bjects, signature, contributions, owning_group_instance_objects_key), recursion_depth))
+                for obj in reversed(resolve_group_result):
+                    if debug:
+                        print(obj, " ==? ", o_bjects)
+                    if obj == o_bjects:# or obj.name == o_bjects.name:
+                        if debug:
+                            print("Skipping resolved object because it is the given object itself: ", obj)
+                        continue
+                    work_stack.append((ACTION_CREATE_BOM_ENTRY, obj, recursion_depth + 1))
+
+                #if (context.scene.selection2bom_in_mode == '2'):
+                #    build_and_store_bom_entry(context, '------- Parts of assembly `' + o_bjects.dupli_group.name + '` -END -------')
+                return {'FINISHED'}
+
+            else:
+                #if no objects are linked here the creation of a BoM entry is pointless
+                if debug:
+                    print('It may be a group instance ', dupli_group, ' but has no objects: ', dupli_group.objects)
+                return {'CANCELLED'}
+
+
+
+        #Object type is not considered then:
+        else:
+            if (debug):
+                print(str(recursion_depth) + ' Object type ', o_bjects.type, ' is not considered (e.g. armatures are not considered a mechanical part).')
+            return {'CANCELLED'}
+
+
+
+    #-------
+    # LIST?
+    #-------
+    elif (o_bjects is list or type(o_bjects) is list or type(o_bjects) is tuple):
+        if debug:
+            print('>> Object is list: ' + str(o_bjects) + ' | type:' + str(type(o_bjects)))
+        for o in reversed(o_bjects):
+            work_stack.append((ACTION_CREATE_BOM_ENTRY, o, recursion_depth + 1))
+        return {'FINISHED'}
+
+
+
+
+    #this time none of the above conditions was met:
+    if debug:
+        print('Did not match any branch for creating a BoM entry:', o_bjects, ' type:', type(o_bjects))
+
+    return {'FINISHED'}
+
+
+
+#
+# If an object type is considered or rather if an object type is ignored, i.e. filtered out.
+# This is useful for skipping animation related objects which shall e.g. not occur in a BOM.
+#
+def is_object_type_considered(object_type):
+    #dupligroup/groupinstance can theoretically be attached to any object, but we only consider those:
+    return object_type == 'MESH' or object_type == 'EMPTY' or object_type == 'CURVE'
+            #TODO type is not related to being mechanical part or not!
+            #or not skip_non_mechanical_objects;#<- overwrites the above and renders all types valid
+    #EMPTY for group instances (even though instances can be attached to any other than empty object too!)
+
+
+
+#
+# Builds a BOM ENTRY from an object.
+# If a dupligroup/instance is attached to the object, this group is:
+#   1) either resolved to its original group and the objects within this group are put into the BoM,
+#   2) or the group instance's name is parsed for a assigned material (as a group does not have a material assigned directly)
+#      or the material is resolved from contained objects or a the material 'mixed' or 'undefined' is assigned.
+# It is being examined how often objects occur to calculate the part count.
+# ATTENTION: better don't use user_count blender python API variable because it's not sure that all those user references
+# were within the current scene or file or if it was selected anyways!
+
+
+#def write_bom_entry_to_file(context, o):
+#    bom_entry = build_bom_entry(context, o, filelink=filelink)
+#    return write2file(context, bom_entry)
+    #ATTENTION: BETTER FIRST CREATE ALL BOM ENTRIES, STORING THEM IN THE UNIQUE ENTRY LIST,
+    #INCREMENTING THE EQUAL BOM ENTRY COUNT AND ONLY THEN WRITE THIS TO FILE!
+
+
+
+bom_entry_count_map = {}
+bom_entry_info_map = {}  # url, part id, ...
+assembly_count_map = {}
+assembly_bom_entry_count_map = {}
+#def init_bom_entry_count_map():
+#   pass
+def build_and_store_bom_entry(context, o, owning_group_instance_objects, filelink=None):#http://docs.python.org/2/tutorial/datastructures.html#dictionaries =>iteritems()
+    global bom_entry_count_map
+    global bom_entry_info_map
+    global bom_entry_variant_map
+    global assembly_count_map
+    global assembly_bom_entry_count_map
+
+    # Also give parent group instance/assembly to allow to inherit its delta transforms:
+    bom_entry = build_bom_entry(context, o, owning_group_instance_objects, filelink=filelink, delete_join_result_if_differs=False)#http://docs.python.org/3/tutorial/datastructures.html#dictionaries => items()
+    resulting_o = context.scene.objects.active # for volume calculation.
+    dupli_group = get_dupli_group(o)
+
+    #if debug:
+    if debug:
+        print('Generated BoM entry: ', bom_entry)
+
+    # Store info like URL, part number, ...
+    if o.data_name:
+        bom_entry_info = getBaseName(o.data_name)  # Object data (e.g. mesh) makes sense as base parts, as modifiers operate on objects. i.e. if the mesh is equal, then the part to be ordered also probably is equal. e.g. Many things can be manufactured out of a metal block.
+        # Though if the size is different this requires to duplicate and change the data (scale the mesh). A workaround for this is to multiply by the object scale but that's not helping if the link is pointing to a too small/big part as the URI generally can't be corrected automatically.
+        # Upside is that the amount of data to maintain is less. Though as objects can be interlinked too, that may be true for objects too. Though often rotation and location is wanted separate which would lead to lots of redundant URLs, ... to adapt.
+        # Despite that issue, this approach is taken. The persuading argument is that often the link points to a page where the part can be bought from. These pages often let select a size, which obsoletes the issue as the link to several part sizes is the same. For part numbers this is not true. Though part numbers are discouraged as they are an artificial map between parts, introducing a new layer of things to lookup which is not helpful. A part is already completely identified by the function it fulfills and its dimension.
+        if not bom_entry in bom_entry_info_map:
+            bom_entry_info_map[bom_entry] = bom_entry_info
+        else:
+            if bom_entry_info_map[bom_entry] != bom_entry_info:
+                if debug:
+                   print('build_and_store_bom_entry(): Info already determined but the new information differs. current: ', bom_entry_info_map[bom_entry], ' vs. new: ', bom_entry_info)
+
+
+    # NOTE This may be moved to build_bom_entry once it is included in the bom entry itself. Currently volume is treated separately.
+    if (run_statistics):
+        run_statistics.begin_phase('volume')
+    volume = -1
+    global cache_resolved_dupli_group_volume_map
+    volume_cached = None
+    if dupli_group:
+        volume_cached = cache_resolved_dupli_group_volume_map.get(get_dupli_group_volume_cache_key(context, o))
+    if volume_cached is not None:
+        volume = volume_cached
+        if debug:
+            print("Using cached volume: ", volume)
+    elif (dupli_group and len(dupli_group.objects) > 0 and resulting_o == o.object
+            and is_dimension_derivation_analytic(context)):
+        # Not resolved and joined, thus sum up the volumes of the group's objects:
+        volume = calculate_dupli_group_volume(context, o)
+        volume = round(volume, context.scene.selection2bom_in_precision)
+        cache_resolved_dupli_group_volume_map.put(get_dupli_group_volume_cache_key(context, o), volume)
+    elif resulting_o.type != 'EMPTY':
+        # Used for distinguishing variants, e.g. different post-processing like different holes, cuts, edges, ...
+        if (resulting_o == o.object):
+            volume = calculate_object_volume(context, o, owning_group_instance_objects)
+        else:
+            # The temporary join result has a mesh of its own:
+            volume = calculate_volume(context, resulting_o)
+        volume = round(volume, context.scene.selection2bom_in_precision)
+        if dupli_group:# and len(dupli_group.objects) > 0:
+            cache_resolved_dupli_group_volume_map.put(get_dupli_group_volume_cache_key(context, o), volume)
+    else:
+        log_warning("Neither dupli group to resolve nor supported object type for volume calculation for object: ", resulting_o, " type: ", resulting_o.type, " dupli group:", resulting_o.dupli_group)
+    # The cached volume of a group instance does not depend on the owning group instances:
+    if (dupli_group and volume != -1):
+        volume = round(volume * get_inherited_volume_scale(o, owning_group_instance_objects), context.scene.selection2bom_in_precision)
+    if (run_statistics):
+        run_statistics.end_phase()
+
+    if volume != -1:
+        # First encountered this entry volume variant?
+        if not (bom_entry in bom_entry_variant_map.keys()):
+            bom_entry_variant_map[bom_entry] = {}
+            if debug:
+                print('Keeping track of new variant/kind/post-processing of bom_entry ', bom_entry, ': volume: ', volume)
+
+        if not (volume in bom_entry_variant_map[bom_entry].keys()):
+            add_count(bom_entry_variant_map[bom_entry], volume)
+            # Generate blueprint:
+            if context.scene.selection2bom_in_include_blueprints:
+                if bpy.types.Scene.blueprint_settings:
+                #    bpy.types.Scene.blueprint_settings.filelink = blueprint_filelink
+                    blueprint_filelink_relative = build_blueprint_filelink(filelink, bom_entry, volume, bpy.path.abspath('//'))
+                    # Using the filelink relative to the open .blend file.
+                    root = bpy.path.abspath('//')
+                    blueprint_filelink = root + blueprint_filelink_relative
+                    if debug:
+                        print("blueprint filelink previous: ", context.scene.blueprint_settings.filelink)
+                    filepath_old = context.scene.render.filepath
+                    context.scene.render.filepath = blueprint_filelink
+                    bpy.ops.scene.blueprint_filelink_set()
+                    context.scene.render.filepath = filepath_old
+                    # The dimensions of a group instance are derived analytically, the drawing
+                    # still needs the geometry of its joined objects:
+                    drawing_o = resulting_o
+                    if (drawing_o == o.object and dupli_group and len(dupli_group.objects) > 0):
+                        drawing_o = resolve_and_join_dupli_group(context, o)
+                    if debug:
+                        print("blueprint filelink new: ", context.scene.blueprint_settings.filelink, " <- object: ", drawing_o, " type: ", drawing_o.type)
+                    generate_engineering_drawing(context, drawing_o)
+                    if (drawing_o != resulting_o):
+                        delete_objects(context, [drawing_o])
+                        context.scene.objects.active = resulting_o
+                else:
+                    log_error("Error: Blender extension 'selection to blueprint' not installed or activated.")
+        # Follow-up encounter of this postprocessed/volume variant of the entry:
+        else:
+            add_count(bom_entry_variant_map[bom_entry], volume)
+
+    # Resulting object no longer is required as volume is calculated and the engineering drawings are generated too.
+    # TIDY UP:
+    # Delete the join target if it is not the object that has to be resolved itself, which must be handled by the calling function that gave this object as a parameter to this function.
+    if resulting_o != o.object:
+        # still valid?
+        if resulting_o:
+            if debug:
+                print("deleting resulting_o after volume and blueprint calculations: ", resulting_o)
+            delete_objects(context, [resulting_o])
+
+
+
+
+    # Keep track of how many BoM entries of same type have been found.
+    count_map = bom_entry_count_map
+    # In hybrid mode?
+    if (context.scene.selection2bom_in_mode == '2'):
+        # In hybrid mode the assemblies are listed separately.
+        # Should not occur in the global parts lists if they are not atomar.
+        if debug:
+            print('==========> dupli_group: ', dupli_group)
+        if (not (dupli_group is None) and len(dupli_group.objects) > 0):
+            if debug:
+                print('==========> is atomar: ', is_object_atomar(o))
+            if (not is_object_atomar(o)):
+                if debug:
+                    print('Assembly found: ', o, '\r\n=> Putting into assembly_count_map.')
+                count_map = assembly_count_map
+            #else:
+            #    # Both maps need to be incremented if atomar.
+            #    increment_entry_in_map(bom_entry, assembly_count_map)
+
+    increment_entry_in_map(bom_entry, count_map)
+
+    # Have to add assembly entry?
+    owning_group_instance_objects_length = len(owning_group_instance_objects)
+
+    if (owning_group_instance_objects_length > 0):
+    #for i in range(owning_group_instance_objects_length - 1, -1):
+        # Important Note: The last item of the list could be spliced out! It's not done for performance. It's tested if for equality and skipped instead - in build_bom_entry().
+        # Nevertheless if only one item is contained and it is the object itself, then a call to build_bom_entry() must be avoided because it else increments the variant count and thus also initiates the generation of another engineering drawing.
+        parent_group_instance = None
+        #if (owning_group_instance_objects_length > 0):
+        parent_group_instance = owning_group_instance_objects[owning_group_instance_objects_length - 1]
+        # Makes no sense to increment bom entry of an assembly if the assembly is the bom entry itself:
+        if owning_group_instance_objects_length > 1 or parent_group_instance != o:
+            if debug:
+                print('Assembly: Building bom entry ...')
+            assembly_bom_entry = get_assembly_bom_entry(context, owning_group_instance_objects, filelink=filelink)
+            # Keep track of how many BoM entries of the same type belong to this unique assembly:
+            if (not (assembly_bom_entry in assembly_bom_entry_count_map)):
+                if debug:
+                    print('Assembly: From now on keeping track of assembly: ', assembly_bom_entry)
+                assembly_bom_entry_count_map[assembly_bom_entry] = {}
+
+            if (not (bom_entry in assembly_bom_entry_count_map[assembly_bom_entry])):
+                if debug:
+                    print('Assembly: From now on keeping track of bom_entry count of ', bom_entry)
+
+            add_count(assembly_bom_entry_count_map[assembly_bom_entry], bom_entry)
+            if debug:
+                print('Assembly:', assembly_bom_entry, ' -> new part count: ', assembly_bom_entry_count_map[assembly_bom_entry][bom_entry], 'x ', bom_entry)
+
+    if debug:
+        print('----*done*,constructed and stored global Bill of materials and Assembly listing entries.')
+    return bom_entry
+
+
+
+#
+# The assembly entry of the owning group instance is equal for all of its objects,
+# thus it is built only once per owning group instance on the recursion path.
+#
+assembly_bom_entry_cache = {}
+assembly_bom_entry_cache_hit_count = 0
+def get_assembly_bom_entry(context, owning_group_instance_objects, filelink=None):
+    global assembly_bom_entry_cache_hit_count
+    owning_group_instance_objects_key = tuple(owning_group_instance_objects)
+    if (owning_group_instance_objects_key in assembly_bom_entry_cache):
+        assembly_bom_entry_cache_hit_count += 1
+        return assembly_bom_entry_cache[owning_group_instance_objects_key]
+
+    parent_group_instance = owning_group_instance_objects[len(owning_group_instance_objects) - 1]
+    assembly_bom_entry = build_bom_entry(context, parent_group_instance, owning_group_instance_objects, filelink=filelink)
+    assembly_bom_entry_cache[owning_group_instance_objects_key] = assembly_bom_entry
+    return assembly_bom_entry
+
+
+
+#
+# @see TransformChains
+#
+transform_chains = None
+def get_transform_chain(owning_group_instance_objects_key):
+    return transform_chains.get(owning_group_instance_objects_key)
+
+
+
+def increment_entry_in_map(bom_entry, count_map):
+    if (not (bom_entry in count_map)):
+        if debug:
+            print('From now on keeping track of bom_entry count of ', bom_entry)
+
+    add_count(count_map, bom_entry)
+    if debug:
+        print('-> new part count: ', count_map[bom_entry], 'x ', bom_entry)
+    # To know how much compensating whitespace to insert later:
+    is_longest_entry_count_then_store_len(count_map[bom_entry])
+
+
+
+#
+# The entries resulting from resolving a group instance only depend on the group,
+# the group instance's label (material override) and material, the inherited optional flag and
+# the inherited scale. The inherited scale is given by the metric C^T * C of the
+# chained owning group instance matrices C, which unlike C itself is invariant to
+# rotation. Thus group instances of equal signature contribute equal counts.
+# The chain is the one the dimensions are derived from, see get_transform_chain.
+# @param owning_group_instance_objects_key including the group instance itself (last).
+#
+def get_group_instance_signature(o, owning_group_instance_objects_key):
+    chain, is_optional = get_transform_chain(owning_group_instance_objects_key)
+    metric = chain.transposed() * chain
+    metric_quantized = tuple([round(metric[i][j], 6) for i in range(0, 3) for j in range(0, 3)])
+    return (o.group_index, getBaseName(o.name), o.material, is_optional, metric_quantized)
+
+
+
+#
+# Adds the contributions recorded for a group instance of equal signature again.
+#
+def replay_contributions(contributions):
+    for count_map, key, amount in contributions:
+        add_count(count_map, key, amount)
+        is_longest_entry_count_then_store_len(count_map[key])
+
+
+
+#
+#g: bpy.types.Group not a group instance, i.e. no object with dupli group bpy.types.Group attached
+def build_and_store_bom_entry_out_of_group(context, g):
+    if debug:
+        print('Encountered a group that should have been added to the BoM: ', g)
+    #return build_and_store_bom_entry_out_of_group(context, g)
+    return '\r\nBuilding bom entry out of group not supported yet. Possibly solve it analoguously to group instance dimension resolving.'
+
+
+def deselect_all(context):
+    if (not bpy.ops.object.select_all(action="DESELECT")):
+        if debug:
+            print('There seems to be already no selection - that may be interesting, but as we work with a copy it should not matter. Of importance is that now nothing is selected anymore.')
+    if (context.scene.objects.active):  # Because join operator seems to weirdly join into the wrong target object (the logging output did show that everything was fine (i.e. joining into <o>.002 as expected ... and yet the joined object was <o>.001.
+        context.scene.objects.active = None
+
+
+
+def normalize_matrix_3x3(rotation_matrix):
+    # column 0:
+    rot_x = Vector([rotation_matrix[0][0], rotation_matrix[0][1], rotation_matrix[0][2]])
+    # column 1:
+    rot_y = Vector([rotation_matrix[1][0], rotation_matrix[1][1], rotation_matrix[1][2]])
+    # column 2:
+    rot_z = Vector([rotation_matrix[2][0], rotation_matrix[2][1], rotation_matrix[2][2]])
+
+    # Extract the scale to allow to cancel it:
+    scale_x = rot_x.length
+    scale_y = rot_y.length
+    scale_z = rot_z.length
+
+    # Or rather just normalize and reconstruct the (bare) rotation matrix:
+    #rotation_matrix = Matrix(rot_x.normalize(), rot_y.normalize(), rot_z.normalize())
+    rot_x_normalized = rot_x.normalize()
+    # May be normalized already (or amount/length is zero) which leads to None as result):
+    if not rot_x_normalized:
+        rot_x_normalized = rot_x
+    rot_y_normalized = rot_y.normalize()
+    if not rot_y_normalized:
+        rot_y_normalized = rot_y
+    rot_z_normalized = rot_z.normalize()
+    if not rot_z_normalized:
+        rot_z_normalized = rot_z
+
+    rotation_matrix[0][0] = rot_x_normalized[0]
+    rotation_matrix[0][1] = rot_x_normalized[1]
+    rotation_matrix[0][2] = rot_x_normalized[2]
+
+    rotation_matrix[1][0] = rot_y_normalized[0]
+    rotation_matrix[1][1] = rot_y_normalized[1]
+    rotation_matrix[1][2] = rot_y_normalized[2]
+
+    rotation_matrix[2][0] = rot_z_normalized[0]
+    rotation_matrix[2][1] = rot_z_normalized[1]
+    rotation_matrix[2][2] = rot_z_normalized[2]
+
+
+
+#
+# Whether the dimensions (and volume) of group instances are derived analytically
+# or by resolving and joining the group instance's objects (legacy path).
+# Output options like the blueprints must not change the BoM entries, thus only
+# the module setting decides.
+#
+def is_dimension_derivation_analytic(context):
+    return use_analytic_dimensions
+
+
+
+#
+# Collects the mesh objects of a dupli group (and of nested dupli groups) together
+# with the matrix that transforms each from its local frame into the frame given.
+# This corresponds to what resolve_all_joinable_objects_recursively() makes real
+# and joins, though no operator is called and no temporary object is created.
+#
+def collect_dupli_group_mesh_objects(context, group, matrix, mesh_objects, recursion_depth=0):
+    # The groups on the path to a group are kept to detect cycles:
+    stack = [(group, matrix, recursion_depth, (group,))]
+    while (len(stack) > 0):
+        group, matrix, recursion_depth, group_path = stack.pop()
+        if (recursion_depth > context.scene.after_how_many_create_bom_entry_recursions_to_abort):
+            if debug:
+                print(str(recursion_depth) + ' Reached recursion depth limit while collecting group objects: ', group)
+            continue
+
+        # The group's objects are placed relative to the group's dupli offset:
+        matrix_group = matrix * Matrix.Translation(-Vector(group.dupli_offset))
+        for group_object in group.objects:
+            if (not is_object_type_considered(group_object.type)):
+                continue
+            matrix_group_object = matrix_group * to_matrix(group_object.matrix_world)
+            # Only mesh objects are joined, thus only those contribute:
+            if (group_object.type == 'MESH'):
+                mesh_objects.append((group_object, matrix_group_object))
+            # Further decomposition possible?
+            group_object_dupli_group = get_dupli_group(group_object)
+            if (group_object_dupli_group is None or group_object_dupli_group == group):
+                continue
+            if (group_object_dupli_group in group_path):
+                raise GroupCycleError('Group contains an instance of itself: '
+                        + format_group_chain(group_path[group_path.index(group_object_dupli_group):] + (group_object_dupli_group,)))
+            stack.append((group_object_dupli_group, matrix_group_object, recursion_depth + 1, group_path + (group_object_dupli_group,)))
+
+    return mesh_objects
+
+
+
+#
+# The matrix a group instance's objects are measured in, i.e. the axes of the
+# group instance scaled by its scale (as for the joined object). Neither location
+# nor rotation of the group instance influence the resulting dimensions.
+#
+def get_group_instance_measure_matrix(o):
+    scale = to_matrix(o.matrix_world).to_scale()
+    return Matrix([
+            [scale[0], 0, 0, 0],
+            [0, scale[1], 0, 0],
+            [0, 0, scale[2], 0],
+            [0, 0, 0, 1]
+    ])
+
+
+
+#
+# Dimensions of a group instance (assembly) derived from the local bounding box
+# corners of its objects transformed through the nested group instance matrices.
+#
+def calculate_dupli_group_dimensions(context, o):
+    mesh_objects = collect_dupli_group_mesh_objects(context, get_dupli_group(o), get_group_instance_measure_matrix(o), [])
+    if (len(mesh_objects) < 1):
+        if debug:
+            print('Found no mesh object within dupli group ', get_dupli_group(o), ' => adopting the dimensions of ', o)
+        return Vector(o.dimensions)
+
+    corner_min = None
+    corner_max = None
+    for group_object, matrix in mesh_objects:
+        for corner in to_corners(group_object.bound_box):
+            corner_transformed = matrix * Vector(corner)
+            if corner_min is None:
+                corner_min = Vector(corner_transformed)
+                corner_max = Vector(corner_transformed)
+                continue
+            for i in range(0, 3):
+                if corner_transformed[i] < corner_min[i]:
+                    corner_min[i] = corner_transformed[i]
+                elif corner_transformed[i] > corner_max[i]:
+                    corner_max[i] = corner_transformed[i]
+
+    if debug:
+        print('Derived dimensions of group instance ', o, ' analytically: ', corner_max - corner_min)
+    return corner_max - corner_min
+
+
+
+#
+# Volume of a group instance (assembly) as the sum of the volumes of its mesh objects,
+# each scaled by the determinant of its transformation into the group instance frame.
+#
+def calculate_dupli_group_volume(context, o):
+    volume = 0
+    for group_object, matrix in collect_dupli_group_mesh_objects(context, get_dupli_group(o), get_group_instance_measure_matrix(o), []):
+        group_object_volume = calculate_mesh_volume(context, group_object)
+        if group_object_volume == -1:
+            continue
+        volume += group_object_volume * abs(matrix.to_3x3().determinant())
+    return volume
+
+
+
+#
+# The volume of the object's mesh (in its local space, i.e. without the object's
+# transform) is evaluated once per mesh datablock and modifier stack and run.
+#
+mesh_volume_map = {}
+def calculate_mesh_volume(context, o):
+    if (o.type != 'MESH' or o.data_name is None):
+        return calculate_volume(context, o.object)
+    # The result of e.g. a boolean, shrinkwrap or object offset array modifier depends on
+    # where the object is relative to the referenced object, which the key does not cover:
+    if (len(get_modifier_referenced_objects(o)) > 0):
+        return calculate_volume(context, o.object)
+    key = (o.data_name, get_modifier_stack_fingerprint(o))
+    if not (key in mesh_volume_map):
+        mesh_volume_map[key] = calculate_volume(context, o.object)
+    return mesh_volume_map[key]
+
+
+
+#
+# The object's scale is applied through the determinant of its transform,
+# thus linked duplicates (e.g. a thousand bolts) cost one volume evaluation.
+#
+def calculate_object_volume(context, o, owning_group_instance_objects=()):
+    volume = calculate_mesh_volume(context, o)
+    if (volume == -1):
+        return volume
+    return volume * abs(to_matrix(o.matrix_world).to_3x3().determinant()) * get_inherited_volume_scale(o, owning_group_instance_objects)
+
+
+
+#
+# Like the dimensions, the volume inherits the owning group instances' scale:
+# The factor is the determinant of the same transform chain, see build_bom_entry.
+#
+def get_inherited_volume_scale(o, owning_group_instance_objects):
+    owning_group_instance_objects_key = tuple(owning_group_instance_objects)
+    # The object o itself might reside at the last position:
+    if (len(owning_group_instance_objects_key) > 0 and owning_group_instance_objects_key[-1] == o):
+        owning_group_instance_objects_key = owning_group_instance_objects_key[0:-1]
+    return abs(get_transform_chain(owning_group_instance_objects_key)[0].determinant())
+
+
+
+#
+# The dimensions (and volume) of a resolved group instance depend on the group and on
+# the transform of the group instance (its matrix_world, i.e. including delta transforms
+# and the transforms of its parents, but not the transforms of the owning group
+# instances: Their scale is inherited afterwards, see inherit_scale, thus the cached
+# values do not depend on them). The location does not matter, thus only the 3x3 part is
+# considered. The analytic derivation depends on the scale only, which allows
+# to reuse the results for rotated group instances too.
+# The group is identified by its content (see PERSISTENT CACHE), the key is a string.
+#
+def get_dupli_group_cache_key(context, o):
+    if is_dimension_derivation_analytic(context):
+        transform = to_matrix(o.matrix_world).to_scale()
+        transform_canonical = tuple([round(transform[i], 6) + 0.0 for i in range(0, 3)])
+    else:
+        transform = to_matrix(o.matrix_world).to_3x3()
+        transform_canonical = tuple([round(transform[i][j], 6) + 0.0 for i in range(0, 3) for j in range(0, 3)])
+    return get_group_content_hash(o.group_index) + ' ' + ' '.join([repr(v) for v in transform_canonical])
+
+
+
+#
+# The cached volumes are rounded to the scene's precision.
+#
+def get_dupli_group_volume_cache_key(context, o):
+    return get_dupli_group_cache_key(context, o) + ' ' + str(context.scene.selection2bom_in_precision)
+
+
+
+#------- PERSISTENT CACHE -----------------------------------------------------#
+#
+# The resolved dupli group dimensions and volumes outlive the run and the session:
+# They are kept in memory across runs and are stored in a sidecar file next to the
+# .blend file. The cache keys are content hashes of the groups (member meshes,
+# modifier stacks, transforms and nested groups) plus the transform of the group
+# instance, thus a changed group simply is not found anymore. Its stale entries are
+# evicted once the size cap (the scene's cache size) is reached.
+#
+PERSISTENT_CACHE_VERSION = 2
+PERSISTENT_CACHE_FILE_ENDING = '.selection2bom-cache.json'
+persistent_cache_filelink = None
+
+
+
+#
+# @return the sidecar file of the open .blend file or None if it is not saved yet.
+#
+def get_persistent_cache_filelink():
+    if (not bpy.data.filepath):
+        return None
+    return bpy.data.filepath + PERSISTENT_CACHE_FILE_ENDING
+
+
+
+#
+# Keeps the caches of the previous run unless another file is open or the size changed.
+#
+def load_persistent_caches(context):
+    global cache_resolved_dupli_group_dimensions_map
+    global cache_resolved_dupli_group_volume_map
+    global persistent_cache_filelink
+    size_max = context.scene.selection2bom_in_cache_size
+    filelink = get_persistent_cache_filelink()
+    if (cache_resolved_dupli_group_dimensions_map is not None and filelink == persistent_cache_filelink
+            and cache_resolved_dupli_group_dimensions_map.size_max == size_max):
+        cache_resolved_dupli_group_dimensions_map.reset_statistics()
+        cache_resolved_dupli_group_volume_map.reset_statistics()
+        return
+
+    cache_resolved_dupli_group_dimensions_map = LRUCache(size_max)
+    cache_resolved_dupli_group_volume_map = LRUCache(size_max)
+    persistent_cache_filelink = filelink
+    if (filelink is None or not os.path.isfile(filelink)):
+        return
+    try:
+        with open(filelink, 'r') as f:
+            cache = json.load(f)
+        if (cache.get('version') != PERSISTENT_CACHE_VERSION):
+            log_info('Ignoring the cache of another version: ', filelink)
+            return
+        # Least recently used first:
+        for key, dimensions in cache['dimensions']:
+            cache_resolved_dupli_group_dimensions_map.put(key, tuple(dimensions))
+        for key, volume in cache['volumes']:
+            cache_resolved_dupli_group_volume_map.put(key, volume)
+    except (IOError, ValueError, KeyError, TypeError) as e:
+        log_warning('Ignoring the unreadable cache ', filelink, ': ', e)
+        cache_resolved_dupli_group_dimensions_map = LRUCache(size_max)
+        cache_resolved_dupli_group_volume_map = LRUCache(size_max)
+        return
+    cache_resolved_dupli_group_dimensions_map.is_modified = False
+    cache_resolved_dupli_group_volume_map.is_modified = False
+    log_info('Cache loaded: ', len(cache_resolved_dupli_group_dimensions_map), ' dimensions, ',
+            len(cache_resolved_dupli_group_volume_map), ' volumes from ', filelink)
+
+
+
+def save_persistent_caches():
+    if (persistent_cache_filelink is None or cache_resolved_dupli_group_dimensions_map is None):
+        return
+    if (not cache_resolved_dupli_group_dimensions_map.is_modified and not cache_resolved_dupli_group_volume_map.is_modified):
+        return
+    cache = OrderedDict([
+            ('version', PERSISTENT_CACHE_VERSION),
+            ('dimensions', [[key, list(dimensions)] for key, dimensions in cache_resolved_dupli_group_dimensions_map.entries.items()]),
+            ('volumes', [[key, volume] for key, volume in cache_resolved_dupli_group_volume_map.entries.items()])
+    ])
+    # Replaced at once, thus an aborted write does not corrupt the cache:
+    filelink_temporary = persistent_cache_filelink + '.tmp'
+    try:
+        with open(filelink_temporary, 'w') as f:
+            json.dump(cache, f)
+        os.replace(filelink_temporary, persistent_cache_filelink)
+    except (IOError, OSError) as e:
+        log_warning('Could not save the cache ', persistent_cache_filelink, ': ', e)
+        return
+    cache_resolved_dupli_group_dimensions_map.is_modified = False
+    cache_resolved_dupli_group_volume_map.is_modified = False
+
+
+
+#
+# @return the content hash of the group, computed once per group and run.
+# A group nested in itself (see GroupCycleError) is represented by its name.
+#
+group_content_hash_map = {}
+def get_group_content_hash(group_index):
+    if (group_index in group_content_hash_map):
+        return group_content_hash_map[group_index]
+    groups = scene_snapshot.groups
+    # Depth first, a group is hashed after its nested groups:
+    stack = [(group_index, False)]
+    in_progress = set()
+    while (len(stack) > 0):
+        index, is_expanded = stack.pop()
+        group = groups[index]
+        if (is_expanded):
+            in_progress.discard(index)
+            content_hash = hashlib.sha1(repr(group.dupli_offset).encode())
+            for o in group.objects:
+                content_hash.update(get_object_content_fingerprint(o).encode())
+                if (o.group_index != -1):
+                    content_hash.update(group_content_hash_map.get(o.group_index, 'cycle ' + groups[o.group_index].name).encode())
+            group_content_hash_map[index] = content_hash.hexdigest()
+            continue
+        if (index in group_content_hash_map or index in in_progress):
+            continue
+        in_progress.add(index)
+        stack.append((index, True))
+        for o in group.objects:
+            if (o.group_index != -1 and not (o.group_index in group_content_hash_map) and not (o.group_index in in_progress)):
+                stack.append((o.group_index, False))
+    return group_content_hash_map[group_index]
+
+
+
+def get_object_content_fingerprint(o):
+    return repr((o.type, o.matrix_world, o.bound_box, o.dimensions, o.is_visible, o.hide,
+            get_mesh_content_hash(o), get_modifier_stack_fingerprint(o)))
+
+
+
+#
+# @return the hash of the vertex coordinates and polygons of the object's mesh,
+# computed once per mesh datablock and run.
+#
+mesh_content_hash_map = {}
+def get_mesh_content_hash(o):
+    if (o.type != 'MESH' or o.data_name is None):
+        return None
+    return get_mesh_datablock_content_hash(o.object.data)
+
+
+
+def get_mesh_datablock_content_hash(mesh):
+    if (mesh.name in mesh_content_hash_map):
+        return mesh_content_hash_map[mesh.name]
+    # foreach_get requires the item size of the RNA property (single precision):
+    coordinates = array('f', [0.0]) * (len(mesh.vertices) * 3)
+    mesh.vertices.foreach_get('co', coordinates)
+    loop_vertices = array('i', [0]) * len(mesh.loops)
+    mesh.loops.foreach_get('vertex_index', loop_vertices)
+    loop_totals = array('i', [0]) * len(mesh.polygons)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+    content_hash = hashlib.sha1(coordinates.tobytes())
+    content_hash.update(loop_vertices.tobytes())
+    content_hash.update(loop_totals.tobytes())
+    mesh_content_hash_map[mesh.name] = content_hash.hexdigest()
+    return mesh_content_hash_map[mesh.name]
+
+
+
+#
+# @return the objects the modifiers of the object reference (e.g. the boolean cutter).
+#
+def get_modifier_referenced_objects(o):
+    if (o.modifier_count == 0):
+        return []
+    referenced_objects = []
+    for modifier in o.object.modifiers:
+        for rna_property in modifier.bl_rna.properties:
+            if (rna_property.type != 'POINTER' or rna_property.identifier == 'rna_type'):
+                continue
+            value = getattr(modifier, rna_property.identifier)
+            if (isinstance(value, bpy.types.Object)):
+                referenced_objects.append(value)
+    return referenced_objects
+
+
+
+#
+# @return the settings of all the modifiers of the object. Referenced datablocks
+# are represented by their name, referenced objects (e.g. the boolean cutter) in
+# addition by their transform and mesh, as these change the modifiers' result.
+#
+def get_modifier_stack_fingerprint(o):
+    if (o.modifier_count == 0):
+        return None
+    fingerprint = []
+    for modifier in o.object.modifiers:
+        for rna_property in modifier.bl_rna.properties:
+            if (rna_property.identifier == 'rna_type'):
+                continue
+            value = getattr(modifier, rna_property.identifier)
+            if (isinstance(value, bpy.types.Object)):
+                mesh_content_hash = None
+                if (value.type == 'MESH' and value.data is not None):
+                    mesh_content_hash = get_mesh_datablock_content_hash(value.data)
+                value = (value.name, flatten(value.matrix_world), mesh_content_hash)
+            elif (rna_property.type == 'POINTER' or rna_property.type == 'COLLECTION'):
+                value = getattr(value, 'name', None)
+            elif (isinstance(value, set)):
+                value = tuple(sorted(value))
+            elif (not isinstance(value, (bool, int, float, str))):
+                value = tuple(value)
+            fingerprint.append((rna_property.identifier, value))
+    return tuple(fingerprint)
+
+
+
+#
+# The dimensions inherit the scale of the owning group instances. As the dimensions
+# are the extents of the local bounding box times the absolute scale (per local axis),
+# scaling an object by the inherited scale scales its dimensions per axis too.
+# This holds for objects, resolved (joined) dupli groups and cached dimensions alike.
+#
+# @param dimensions The dimensions (the object's own scale included).
+# @param scale The scale inherited from the matrix_basis chain, see build_bom_entry.
+#
+def inherit_scale(dimensions, scale):
+    return Vector([dimensions[axis] * abs(scale[axis]) for axis in range(3)])
+
+
+
+#
+# The legacy path of inheriting the scale: The scale is applied to the object (or to
+# a temporary object that is given the dimensions), then the inherited scale is set
+# and the dimensions are refreshed by toggling the edit mode.
+# The scale is never applied to the original object (nor to the data it may share with
+# linked duplicates), but to a temporary linked duplicate with a copy of the data.
+# NOTE Only used to check for regressions as it adds and removes temporary objects.
+#
+# @return The dimensions the inherited scale is applied to.
+#
+def inherit_scale_legacy(context, o, resulting_o, x, y, z, scale):
+    # Derive delta dimensions because there is no to the coder known way to derive world coordinate frame dimension coordinates other than examining each vertex:
+    # NOTE This trick does not work for "empty" objects because there are no dimensions, thus then a dummy object must be set up:
+    object_for_calculating_dimensions = o.object
+    show_all_layers(context)
+    #objects_to_be_deleted = []
+    # Store state:
+    active_object_pre_calculating_dimensions = context.scene.objects.active
+    selected_objects_pre_scale = list(context.selected_objects)
+    if o.type != 'EMPTY':
+        object_for_calculating_dimensions = o.object.copy()
+        if (o.object.data is not None):
+            # The mesh of a scratch object is removed with it (if no longer used):
+            object_for_calculating_dimensions.data = o.object.data.copy()
+        context.scene.objects.link(object_for_calculating_dimensions)
+        register_scratch_objects([object_for_calculating_dimensions])
+    else:
+        object_for_calculating_dimensions = resulting_o
+
+        if not resulting_o or resulting_o == o.object:
+            if debug:
+                print("active before adding new: ", context.scene.objects.active)
+            #Object not found? bpy.ops.object.add_named(name="object_for_calculating_dimensions")
+            bpy.ops.object.add(type='MESH')
+            if debug:
+                print("active after adding new: ", context.scene.objects.active)
+            object_for_calculating_dimensions = context.scene.objects.active
+            register_scratch_objects([object_for_calculating_dimensions])
+            # synchronize rotation and other transformations because else the mobile/local frame will be different from the newly created object's mobile/local frame.
+            if debug:
+                print("Matrix basis before: ", object_for_calculating_dimensions.matrix_basis)
+            object_for_calculating_dimensions.matrix_basis = to_matrix(o.matrix_basis)
+            if debug:
+                print("Matrix basis after: ", object_for_calculating_dimensions.matrix_basis)
+            # init with the cached assembly/dupli group overall dimensions (world frame):
+            object_for_calculating_dimensions.dimensions[0] = x
+            object_for_calculating_dimensions.dimensions[1] = y
+            object_for_calculating_dimensions.dimensions[2] = z
+            #objects_to_be_deleted.append(object_for_calculating_dimensions)
+
+    ## Even the scale of the original object must be applied, because its scale must be assumed as 1 because the determined owning group instances' scale is relative to the child object, and this means the scale needs be chained - which is difficult to do without matrices, thus temporarily apply the scale to make it appear as if it'd not be scaled at all.
+    #if not resulting_o or resulting_o != o:
+    # Applying the scale is not required in all cases because the scale is overridden. Scale is relative to the dimensions, it must be overridden if the reference dimensions shall take the scale into account. Here that is the case, therefore it is overriden for the resolved dupli group (because its scale may differ from 1 and yet its dimensions are valid and the reference) and the newly created object (because assigning to the dimensions property may indirectly change the object's scale):
+        ## NOTE In both cases where the scale transformation is applied, the object (or the scale thereof) is no longer needed, thus no restoration/cancelling of the then applied scale is performed.
+    # Operate on the active object only, i.e. to be sure deselect all first:
+    bpy.ops.object.select_all(action='DESELECT')
+    context.scene.objects.active = object_for_calculating_dimensions
+    context.scene.objects.active.select = True
+    bpy.ops.object.transform_apply(scale = True)
+
+    # Restore previous state:
+    for selected_obj in selected_objects_pre_scale:
+        selected_obj.select = True
+    context.scene.objects.active = active_object_pre_calculating_dimensions
+
+
+    o_scale_old = Vector(object_for_calculating_dimensions.scale)#Vector(o.scale)
+    ## Reset to 1 because the dimensions are relative. NOTE The scale is relative to the leaf object! This means the scale must be assumed to be zero, and if it is not zero then it must be "applied" to become zero (which is ensured above).
+    #object_for_calculating_dimensions.scale = Vector([1.0, 1.0, 1.0])
+    ## Trigger a recalculation of the dimensions:
+    #bpy.ops.object.mode_set(mode='OBJECT')
+    #bpy.ops.object.mode_set(mode='EDIT')
+    #bpy.ops.object.mode_set(mode='OBJECT')
+    o_dimensions_old = Vector(object_for_calculating_dimensions.dimensions)
+    object_for_calculating_dimensions.scale = scale
+    # Trigger a recalculation of the dimensions:
+    active_object_pre_scale = context.scene.objects.active
+    context.scene.objects.active = object_for_calculating_dimensions
+    bpy.ops.object.mode_set(mode='OBJECT')
+    bpy.ops.object.mode_set(mode='EDIT')
+    bpy.ops.object.mode_set(mode='OBJECT')
+    context.scene.objects.active = active_object_pre_scale
+    # Determine overall dimensions:
+    # Becomes negative if scale has been smaller than 1:
+    delta_x = object_for_calculating_dimensions.dimensions[0] - o_dimensions_old[0]
+    delta_y = object_for_calculating_dimensions.dimensions[1] - o_dimensions_old[1]
+    delta_z = object_for_calculating_dimensions.dimensions[2] - o_dimensions_old[2]
+    if debug:
+        print("object_for_calculating_dimensions: ", object_for_calculating_dimensions, " => delta: ", delta_x, delta_y, delta_z)
+    #x *= abs(scale[0])
+    #y *= abs(scale[1])
+    #z *= abs(scale[2])
+    x += delta_x
+    y += delta_y
+    z += delta_z
+    object_for_calculating_dimensions.scale = o_scale_old
+
+    # Is the newly created temporary object?
+    if object_for_calculating_dimensions and object_for_calculating_dimensions != resulting_o and object_for_calculating_dimensions != o.object:
+        delete_objects(context, [object_for_calculating_dimensions])
+    return [x, y, z]
+
+
+
+#
+# Logs if the analytic dimensions deviate from the legacy path's dimensions.
+#
+SCALE_INHERITANCE_REGRESSION_TOLERANCE = 0.0001
+def check_dimensions_regression(o, dimensions, dimensions_legacy, description='Inherited scale dimensions'):
+    for axis in range(3):
+        if (abs(dimensions[axis] - dimensions_legacy[axis]) > SCALE_INHERITANCE_REGRESSION_TOLERANCE * max(1.0, abs(dimensions_legacy[axis]))):
+            log_warning('Regression: ', description, ' ', tuple(dimensions), ' differ from the legacy dimensions ', tuple(dimensions_legacy), ' of object: ', o.name)
+            return False
+    return True
+
+
+
+#
+# @return The join result of the group instance's objects (the group instance itself
+# if nothing was joined). The caller removes the join result.
+#
+def resolve_and_join_dupli_group(context, o):
+    show_all_layers(context)
+    context.scene.objects.active = o.object
+    bpy.ops.object.resolve_and_join()
+    return context.scene.objects.active
+
+
+
+#
+# The dimensions of the group instance's joined objects, see check_analytic_dimensions_regression.
+# The join result is removed again.
+#
+def calculate_joined_dupli_group_dimensions(context, o):
+    resulting_o = resolve_and_join_dupli_group(context, o)
+    dimensions = Vector(resulting_o.dimensions)
+    if resulting_o != o.object:
+        delete_objects(context, [resulting_o])
+    context.scene.objects.active = o.object
+    return dimensions
+
+
+
+
+#
+# Constructing an entry for the bill of materials,
+# i.e. figuring properties.
+#
+cache_resolved_dupli_group_dimensions_map = None
+cache_resolved_dupli_group_volume_map = None
+@measured_phase('naming')
+def build_bom_entry(context, o, owning_group_instance_objects, filelink=None, delete_join_result_if_differs=True):
+    if debug:
+        print('build_bom_entry: o:', o, ' owning_group_instance_objects:', owning_group_instance_objects)
+    #build BoM entry: using http://www.blender.org/documentation/blender_python_api_2_69_release/bpy.types.Object.html
+    # The label without the material given explicitly and without the atomar and optional indicators:
+    parsed_name = parse_name(o.name)
+    dupli_group = get_dupli_group(o)
+
+    material = None
+    if (o.material is not None):
+        material = getBaseName(o.material)
+    group_name = None
+    group_materials = None
+    if (not (dupli_group is None)):
+        if dupli_group.name:
+            group_name = getBaseName(dupli_group.name)
+        # Lazily, as the first differing material decides:
+        group_materials = (getBaseName(group_object.material) if group_object.material else '-'
+                for group_object in dupli_group.objects if group_object.type != 'EMPTY')
+    entry, material = get_entry_label_and_material(parsed_name, material, group_name, group_materials)
+    if debug:
+        print('build_bom_entry(): label: ', entry, ' material: ', material)
+
+
+    #keep track of the longest material label
+    is_longest_material_then_store_len(material_label=material)
+
+    #dimensions
+    if (run_statistics):
+        run_statistics.switch_phase('dimensions')
+    context.scene.objects.active = o.object
+
+
+    #######
+    # DIMENSIONS
+    #######
+    # Dimension already takes dimension-influencing modifiers like array, skin, solidify into account (applying all modifiers is thus not required).
+    # TODO don't take the absolute bounding_box dimensions - instead calculate from a hull of the object?
+
+    #undo_count = 0 #now working with a copy of the initially selected_objects (no longer a live copy/reference)
+    # If empties not had the dimensions property, then it leads to an error because an empty does not have dimensions in general. TODO Are dimensions for empties just zero as of current blender?
+    x = o.dimensions[0] # As it's in object context, the scale is taken into account in the bounding box already.
+    y = o.dimensions[1]
+    z = o.dimensions[2]
+    # If provided inherit parent group instances' transforms:
+    # If o owning_o equality and skip if equal (see performance hack, it's done to avoid removing element from the list which is live and still needed later).
+
+
+    resulting_o = o.object
+
+    global cache_resolved_dupli_group_dimensions_map
+    dimensions_cached = None
+    if dupli_group:
+        dimensions_cached = cache_resolved_dupli_group_dimensions_map.get(get_dupli_group_cache_key(context, o))
+    if dimensions_cached is not None:
+        if debug:
+            print('Skipping time costly resolving due to dupli group dimensions cache ... (for an environmental friendly planet)')
+        x = dimensions_cached[0]
+        y = dimensions_cached[1]
+        z = dimensions_cached[2]
+
+    elif (not (dupli_group is None) and len(dupli_group.objects) > 0
+            and is_dimension_derivation_analytic(context)):
+        # Pure math, i.e. the objects of the group are neither duplicated nor made real nor joined:
+        dimensions = calculate_dupli_group_dimensions(context, o)
+        if check_analytic_dimensions_regression:
+            check_dimensions_regression(o, dimensions, calculate_joined_dupli_group_dimensions(context, o), 'Analytic dimensions')
+        x = dimensions[0]
+        y = dimensions[1]
+        z = dimensions[2]
+        cache_resolved_dupli_group_dimensions_map.put(get_dupli_group_cache_key(context, o), dimensions)
+
+    elif (not (dupli_group is None) and len(dupli_group.objects) > 0):
+
+        #if debug:
+        if debug:
+            print('o ', o, ' dupli_group: ', dupli_group)
+        show_all_layers(context)
+        context.scene.objects.active = o.object
+        bpy.ops.object.resolve_and_join()
+        resulting_o = context.scene.objects.active
+
+        if debug:
+            print('Adopting total dimensions of the complete assembly (joined): ', context.scene.objects.active)
+        # Inherit the dimensions.
+        x = context.active_object.dimensions[0]
+        y = context.active_object.dimensions[1]
+        z = context.active_object.dimensions[2]
+        cache_resolved_dupli_group_dimensions_map.put(get_dupli_group_cache_key(context, o), resulting_o.dimensions.copy())  # <-- Can't store the reference as this object is just temporary. Might require recheck of validity, though such invalidation while executing the selection2bom script is impossible in blender as of now (check revision time) because the objects can't be manipulated while the operator (addon) is executing.
+    #else: # no dupli group.
+
+
+    # Duplicates_make_real already makes the resulting objects inherit the scale! If that ever changes, then enable the following commented lines that then would be required for group instances/empties only, because the dimensions of mesh and curve objects already include the scale. Thus both when the dupli group is resolved and when its dimension is read from the cache - then the group instance's scale needs to be applied (if duplicates_make_real operator functionality no longer takes scale into account):
+    #if o.dupli_group:
+    #    # Apply scale of this (empty) object as it might be scaled itself:
+    #    x *= o.scale[0]
+    #    y *= o.scale[1]
+    #    z *= o.scale[2]
+    #    x *= o.delta_scale[0]
+    #    y *= o.delta_scale[1]
+    #    z *= o.delta_scale[2]
+
+
+
+    #if resulting_o.name == "Nut.012":
+    if debug:
+        print("scale: ", resulting_o.scale, " dimensions: ", resulting_o.dimensions)
+    # TODO => Resolve scale, it's not included after make duplicates real python call?!!
+
+    # Apply inherited delta transforms:
+    # The rotation is no longer cancelled out, thus the matrices must be chained/multiplied:
+
+    # NOTE In blender, the scale is stored in the rotation matrix. Each rotation vector/column usually has amount/length of 1, i.e. is normalized. The difference is the scale. => The amount of a rotation vector is the scale along this (local/object frame) axis.
+    # What is needed though is the bare rotation matrix, i.e. the one made of normalized vectors. This means the scale must be canceled:
+    # Note it is assumed the to_3x3() not uses a reference to the original matrix, else it could lead to problems because the normalize_matrix_3x3() function operates directly on the given matrix.
+    rotation_matrix = None # <- The matrix that transforms the world frame scale vector into the local frame (to be compatible with the object's scale which also is in this frame and this is the object that inherits the owning group instance objects' scale which makes the transformation necessary).
+    rotation_matrix = to_matrix(o.matrix_basis).to_3x3()
+    if debug:
+        print("o: ", o, " o.scale: ", o.scale)
+
+    # The object o itself might reside at the last position in the list (for performance reasons it was not removed), then it's optional, but not its transform, is inherited:
+    owning_group_instance_objects_key = tuple(owning_group_instance_objects)
+    owning_group_instance_objects_length = len(owning_group_instance_objects_key)
+    if (owning_group_instance_objects_length > 0 and owning_group_instance_objects_key[owning_group_instance_objects_length - 1] == o):
+        rotation_matrix_for_deriving_scale, is_optional = get_transform_chain(owning_group_instance_objects_key[0:owning_group_instance_objects_length - 1])
+        # Not via the chain of the whole path, which is not discarded if o is not resolved:
+        is_optional = is_optional or is_object_optional(o)
+    else:
+        rotation_matrix_for_deriving_scale, is_optional = get_transform_chain(owning_group_instance_objects_key)
+    if debug:
+        print("Overall owning group instance objects' scale: ", rotation_matrix_for_deriving_scale.to_scale())
+
+    rotation_matrix_normalized = Matrix(rotation_matrix)
+    normalize_matrix_3x3(rotation_matrix_normalized)
+    # The inverse is still needed for the reverse rotation because the from resolving a group instance to its objects resulting joined object does not have the same transform, i.e. not the same local/mobile/object coordinate frame, therefore the scale is wrong and must be rotated (or alternatively the transformations must be copied to the object for calculating the dimensions via the scale trick, see a bit below):
+    rotation_matrix_normalized_inverted = rotation_matrix_normalized.inverted()
+    # Note the rotation matrix may be a reference (apparently it is) and thus normalizing it directly leads to cleared scale for non-empty objects, which is why a copy is used now.
+    if o.type != 'EMPTY': # because else the assembly scale will not be included. For MESH and CURVE objects the scale is included in the dimensions already, which is not the case for empties.
+        # Apply the transformation, especially rotation and scale:
+        rotation_matrix_for_deriving_scale = rotation_matrix_for_deriving_scale * rotation_matrix_normalized
+    else:
+        rotation_matrix_for_deriving_scale = rotation_matrix_for_deriving_scale * rotation_matrix
+
+    # Is resolved group instance/assembly?
+    if resulting_o and resulting_o != o.object:
+        # Revert the rotation but keep the scale:
+        scale = (rotation_matrix_for_deriving_scale * rotation_matrix_normalized_inverted).to_scale()
+        if debug:
+            print("Overall group instance objects' scale to inherit (global): ", scale)
+    else:
+        # Right multiplication due to mobile/local frame (right multiplication) to finally get the scale in the object's local coordinate frame:
+        scale = rotation_matrix_for_deriving_scale.to_scale()
+        if debug:
+            print("Overall group instance objects' scale to inherit (local): ", scale)
+    # The scale is inherited analytically, i.e. neither a temporary object is added
+    # nor is the scale applied nor is the edit mode toggled to refresh the dimensions:
+    dimensions_inherited = inherit_scale([x, y, z], scale)
+    if check_scale_inheritance_regression:
+        check_dimensions_regression(o, dimensions_inherited, inherit_scale_legacy(context, o, resulting_o, x, y, z, scale))
+    x = dimensions_inherited[0]
+    y = dimensions_inherited[1]
+    z = dimensions_inherited[2]
+
+    # TODO Where is the delta scale stored in the blender object's transformation matrix, in the camera scale slots at the very bottom?
+    #delta_scale = rotation_matrix_for_deriving_scale.to_delta_scale()
+    #x *= abs(delta_scale[0])
+    #y *= abs(delta_scale[1])
+    #z *= abs(delta_scale[2])
+
+
+    #determine units using the unit scale of the scene's unit/world settings
+    dimensions = [
+            getMeasureString(x, context.scene.unit_settings, context.scene.selection2bom_in_precision),
+            getMeasureString(y, context.scene.unit_settings, context.scene.selection2bom_in_precision),
+            getMeasureString(z, context.scene.unit_settings, context.scene.selection2bom_in_precision),
+    ]
+
+
+
+    #undo - restore the modifiers #if no active object then no modifiers have been applied hence nothing to be undone.
+    #if ( not (context.active_object is None) and not (result == {'CANCELLED'}) ):
+    #    operations_undone_count = 0
+    #    while (operations_undone_count < operations_to_undo_count):
+    #        result = bpy.ops.ed.undo()#undo_history()
+    #        if (result):
+    #            operations_undone_count = operations_undone_count + 1
+    #    if debug:
+    #        print('operations_undone count: ', operations_undone_count)
+
+    bom_entry = BomKey(entry, material, dimensions, is_optional)
+
+    #NOT RELEVANT: + '\t \t[object is in group: ' o.users_group ', in Scenes: ' o.users_scene ']'
+
+
+    #######
+    # VOLUME VARIANTS (as independent additional information)
+    #######
+    #global cache_resolved_dupli_group_volume_map
+    # Note: When generating the quantitieslist, the keys of the variant map are read
+    #       to determine the volume variants. With the volume known, the filelink to
+    #       the corresponding generated blueprint can be assembled and the count and
+    #       images of the variants included in the BOM.
+    volume_bounding_box = x * y * z
+    # NOTE The effort to calculate the real volume has been moved to the calling function because volume currently is not included in the bom entry directly.
+
+    # NOTE The calling function is responsible for deleting the join result if the join result is still needed afterwards, which may not be intuitive, nevertheless currently is required due to technical reasons (namely allowing this function to be called for assembly entry generation without having it to generate engineering drawings, volume again and again).
+    if not delete_join_result_if_differs:
+        context.scene.objects.active = resulting_o
+        return bom_entry
+
+    # TIDY UP:
+    # Delete the join target if it is not the object that has to be resolved itself, which must be handled by the calling function that gave this object as a parameter to this function.
+    if resulting_o != o.object:
+        # still valid?
+        if resulting_o:
+            if debug:
+                print("deleting resulting_o: ", resulting_o)
+            delete_objects(context, [resulting_o])
+
+    return bom_entry
+
+
+
+class OBJECT_OT_ResolveRecursively(bpy.types.Operator):
+    """Resolves dupli group/ instance / assembly recursively."""
+    #=======ATTRIBUTES=========================================================#
+    bl_idname = "object.resolve_recursively"
+    bl_label = "Resolve recursively"
+    bl_context = "objectmode"
+    bl_register = True
+    bl_undo = True
+    #bl_options = {'REGISTER', 'UNDO'}
+
+    #=======CONSTRUCTION=======================================================#
+    #def __init__(self):
+    #=======METHODS============================================================#
+    @classmethod
+    def poll(self, context):
+        # check the context:
+        return context.scene and context.scene.objects.active
+
+    #
+    # Command base function (outline).
+    #
+    def execute(self, context):
+        time_start = time.time()
+        #print("Storing selected objects ...")
+        #selected_objects = list(context.selected_objects)
+
+        log_info("Initiating resolve of", context.scene.objects.active, "...")
+        objects_to_be_deleted = []
+        objects_to_be_joined = []
+
+        try:
+            resolve_all_joinable_objects_recursively(context, context.scene.objects.active, objects_to_be_joined, objects_to_be_deleted)
+        except GroupCycleError as e:
+            self.report({'ERROR'}, str(e))
+            delete_objects(context, objects_to_be_deleted + objects_to_be_joined)
+            if (not is_run_active):
+                remove_scratch_objects()
+            return {'CANCELLED'}
+        # TODO As resolving group instances recursively is costly, it would be nice to use more of the info gained.
+        # TODO When to apply modifiers?
+        log_info("*done* Resulting objects: ", objects_to_be_joined)
+        # Tidy up:
+        if debug:
+            print("Tidying up ...")
+        delete_objects(context, objects_to_be_deleted, exceptions=context.selected_objects)
+        # The results of this operator:
+        unregister_scratch_objects(objects_to_be_joined + context.selected_objects)
+        if (not is_run_active):
+            remove_scratch_objects()
+
+        #print("Restoring selected objects ...")
+        #bpy.ops.object.select_all(action='DESELECT')
+        #for o in selected_objects:
+        #   o.select = True
+        #print("*done*")
+
+        # Ensure nothing is selected:
+        deselect_all(context)
+        # Select the joined objects:
+        for o in objects_to_be_joined:
+            o.select
+
+        log_info("Resolve finished, required:", round(time.time() - time_start, 4), "sec")
+        return {'FINISHED'}
+
+
+
+class OBJECT_OT_ResolveAndJoin(bpy.types.Operator):
+    """Resolves dupli group/ instance / assembly recursively. Then joins all objects into one which then is available as active object."""
+    #=======ATTRIBUTES=========================================================#
+    bl_idname = "object.resolve_and_join"
+    bl_label = "Resolve and join"
+    bl_context = "objectmode"
+    bl_register = True
+    bl_undo = True
+    #bl_options = {'REGISTER', 'UNDO'}
+
+    #=======CONSTRUCTION=======================================================#
+    #def __init__(self):
+    #=======METHODS============================================================#
+    @classmethod
+    def poll(self, context):
+        # check the context:
+        return context.scene and context.scene.objects.active
+
+    #
+    # Command base function (outline).
+    #
+    def execute(self, context):
+        time_start = time.time()
+
+        log_info("Initiating resolve of", context.scene.objects.active, "and join ...")
+        objects_to_be_deleted = []
+        objects_to_be_joined = []
+        object_to_resolve = context.scene.objects.active
+        try:
+            resolve_and_join(context, object_to_resolve, objects_to_be_joined, objects_to_be_deleted)
+        except GroupCycleError as e:
+            self.report({'ERROR'}, str(e))
+            delete_objects(context, objects_to_be_deleted + objects_to_be_joined)
+            if (not is_run_active):
+                remove_scratch_objects()
+            return {'CANCELLED'}
+        resulting_object = context.scene.objects.active
+        # The result of this operator:
+        unregister_scratch_objects([resulting_object])
+        log_info("*done* Resulting object: ", resulting_object)
+        # Tidy up:
+        if debug:
+            print("Tidying up ...")
+        #leads to segmentation fault probably to missing pointer validity check in 'to string' function: print("Deleting objects: ", objects_to_be_deleted, " exceptions: ", objects_to_be_joined)
+        objects_to_be_deleted_now = []
+        for o in objects_to_be_deleted:
+            if o in objects_to_be_joined:
+                if debug:
+                    print('Skipping object to be deleted because it may (rather should) have been joined: ', o)
+                continue
+            # Let the decision about when to delete the join target/resulting object and the original object (note if the original object is of type MESH and the join objects are mesh too (or all are CURVE objects consistently), then the resulting object may be the object to resolve (this is currently prevented in code, but it may be at a later point both be allowed to join curves too and to let the object to be resolved be the join target at the same time. Also note the object to be resolved is duplicated before it is resolved/made real.).
+            if o == resulting_object or o == object_to_resolve:
+                if debug:
+                    print("Skipping object to be deleted because it is the resulting object or initial object to resolve.")
+                continue
+            objects_to_be_deleted_now.append(o)
+        delete_objects(context, objects_to_be_deleted_now)
+        # Within a run the scratch objects are removed at the end of the run:
+        if (not is_run_active):
+            remove_scratch_objects()
+        if debug:
+            print("*done*")
+
+        log_info("Resolve and join finished, required:", round(time.time() - time_start, 4), "sec")
+        return {'FINISHED'}
+
+
+
+
+def resolve_and_join(context, o, objects_to_be_joined=[], objects_to_be_deleted=[]):
+    resolve_all_joinable_objects_recursively(context, o, objects_to_be_joined, objects_to_be_deleted)
+
+    # Ensure nothing is selected:
+    deselect_all(context)
+
+    # TODO As resolving group instances recursively is costly, it would be nice to use more of the info gained.
+    # TODO When to apply modifiers?
+
+    objects_to_be_joined_length = len(objects_to_be_joined)
+    if objects_to_be_joined_length > 0:
+        for objects_to_be_joined_index in range(0, objects_to_be_joined_length):
+            object_to_be_joined = objects_to_be_joined[objects_to_be_joined_index]
+            object_to_be_joined.select = True
+            # The join target needs a mesh of its own as joining changes it. The other
+            # objects' (linked) meshes are only read, unless modifiers are to be applied:
+            if (len(object_to_be_joined.modifiers) > 0 or objects_to_be_joined_index == objects_to_be_joined_length - 1):
+                use_evaluated_mesh(context, object_to_be_joined)
+
+        # Arbitrarily choose the last object as target:
+        context.scene.objects.active = objects_to_be_joined[objects_to_be_joined_length - 1]
+        if debug:
+            print(context.selected_objects, '\r\nactive_object: ', context.active_object)
+            print('joining ...')
+        # Attention: Poll may fail because a context of joining into an empty is not valid!
+        if (not bpy.ops.object.join()):
+            log_warning('Joining the temporary selection (all group instances within this group instance duplicated, made real and its dupli groups\' objects recursively treated the same too) failed. Check for unjoinable object types.')
+            #break
+        else:
+            # All but the target are freed by joining:
+            unregister_scratch_objects(objects_to_be_joined[0:objects_to_be_joined_length - 1])
+        #else:
+        #    if context.active_object and (not context.active_object == o):
+        #        objects_to_be_deleted.append(context.scene.objects.active)
+        if (not context.scene.objects.active):
+            log_warning('WARNING: Active object not set after join operation.')
+        else:
+            context.scene.objects.active.select = True
+    else:
+        log_warning('WARNING: Might have found nothing to join ...')
+        # TODO Use the dimension of the greatest object within its dupligroup (this includes CURVE objects). Only adopt if greater than the currenty evaluated object's dimensions.
+        o.select = True # If the above functionality isn't, then this may be simplified. This is obsolete as it's the default dimension anyway.
+        context.scene.objects.active = o
+    return context.scene.objects.active
+
+
+
+@measured_phase('blueprints')
+def generate_engineering_drawing(context, obj):
+    if debug:
+        print("-Generate engineering drawing. obj: ", obj)
+    global execution_round
+    execution_round += 1
+    #if execution_round > execution_round_max:
+    #    raise Error
+    show_all_layers(context)
+    active_old = context.scene.objects.active
+    bpy.ops.object.select_all(action='DESELECT')
+
+    context.scene.objects.active = obj
+    obj_select = obj.select
+    obj.select = True
+    #print("active old: ", active_old, " obj: ", obj, " select: ", obj.select)
+    #print("selected_objects: ", context.selected_objects)
+    context.scene.objects.active.select = True
+    bpy.ops.object.mode_set(mode='OBJECT')
+    # Invoke operator of selection2blueprint addon:
+    bpy.ops.object.selection2blueprint()
+    obj.select = obj_select
+
+    # restore active object:
+    context.scene.objects.active = active_old
+
+    if debug:
+        print(execution_round, " x generate engineering drawing for BoM finished")
+
+execution_round = 0
+execution_round_max = 2
+
+#
+# Replaces the data of the (temporary!) object by a throw-away copy of its evaluated
+# mesh, i.e. with all modifiers applied, and removes the modifiers. Neither is the
+# original mesh made single user nor is a modifier applied to the scene.
+#
+def use_evaluated_mesh(context, obj):
+    obj.data = obj.to_mesh(context.scene, True, 'PREVIEW')
+    register_scratch_mesh(obj.data)
+    for modifier in list(obj.modifiers):
+        obj.modifiers.remove(modifier)
+
+
+
+#
+# Triangles of a mesh as (N, 3) array of vertex indices.
+# Polygons are triangulated as fans, which is exact for the signed volume
+# (also for concave polygons) as long as the mesh is closed.
+#
+def get_mesh_triangles(mesh):
+    # Blender 2.80+:
+    if hasattr(mesh, 'loop_triangles'):
+        mesh.calc_loop_triangles()
+        triangle_count = len(mesh.loop_triangles)
+        triangles = numpy.empty(triangle_count * 3, dtype=numpy.int32)
+        mesh.loop_triangles.foreach_get('vertices', triangles)
+        return triangles.reshape(triangle_count, 3)
+
+    loop_count = len(mesh.loops)
+    loop_vertices = numpy.empty(loop_count, dtype=numpy.int32)
+    mesh.loops.foreach_get('vertex_index', loop_vertices)
+
+    polygon_count = len(mesh.polygons)
+    loop_starts = numpy.empty(polygon_count, dtype=numpy.int32)
+    loop_totals = numpy.empty(polygon_count, dtype=numpy.int32)
+    mesh.polygons.foreach_get('loop_start', loop_starts)
+    mesh.polygons.foreach_get('loop_total', loop_totals)
+
+    # A polygon of n vertices is made of n - 2 triangles:
+    triangle_counts = numpy.maximum(loop_totals - 2, 0)
+    triangle_loop_starts = numpy.repeat(loop_starts, triangle_counts)
+    # Index of each triangle within its polygon's fan:
+    triangle_offsets = numpy.arange(triangle_loop_starts.size, dtype=numpy.int32) - numpy.repeat(numpy.cumsum(triangle_counts) - triangle_counts, triangle_counts)
+
+    triangles = numpy.empty((triangle_loop_starts.size, 3), dtype=numpy.int32)
+    triangles[:, 0] = loop_vertices[triangle_loop_starts]
+    triangles[:, 1] = loop_vertices[triangle_loop_starts + triangle_offsets + 1]
+    triangles[:, 2] = loop_vertices[triangle_loop_starts + triangle_offsets + 2]
+    return triangles
+
+
+
+#
+# Volume from the signed tetrahedra spanned by the origin and each triangle.
+# Neither is the object duplicated nor is the mode switched.
+#
+def calculate_volume_vectorized(context, obj):
+    mesh = obj.data
+    is_mesh_temporary = False
+    if len(obj.modifiers) > 0:
+        # Modifiers evaluated into a throw-away mesh datablock:
+        mesh = obj.to_mesh(context.scene, True, 'PREVIEW')
+        is_mesh_temporary = True
+
+    vertex_count = len(mesh.vertices)
+    # foreach_get requires the item size of the RNA property (single precision):
+    coordinates = numpy.empty(vertex_count * 3, dtype=numpy.float32)
+    mesh.vertices.foreach_get('co', coordinates)
+    coordinates = coordinates.reshape(vertex_count, 3).astype(numpy.float64)
+    triangles = get_mesh_triangles(mesh)
+
+    if is_mesh_temporary:
+        bpy.data.meshes.remove(mesh)
+
+    a = coordinates[triangles[:, 0]]
+    b = coordinates[triangles[:, 1]]
+    c = coordinates[triangles[:, 2]]
+    volume = numpy.einsum('ij,ij->i', a, numpy.cross(b, c)).sum() / 6.0
+    if debug:
+        print("*done* Volume (vectorized, %d triangles): %s" % (len(triangles), volume))
+    return abs(float(volume))
+
+
+
+def calculate_volume(context, obj):
+    if obj.type != 'MESH':
+        if debug:
+            print("Calculation of volume not (yet) supported for object of type: ", obj.type)
+        return -1
+    if numpy is not None:
+        return calculate_volume_vectorized(context, obj)
+    if debug:
+        print("calculating volume of object %s ..." % obj)
+    mesh = obj.data
+    is_mesh_temporary = False
+    if len(obj.modifiers) > 0:
+        # Modifiers evaluated into a throw-away mesh datablock:
+        mesh = obj.to_mesh(context.scene, True, 'PREVIEW')
+        is_mesh_temporary = True
+
+    # Signed tetrahedra spanned by the origin and the triangles of each polygon's fan:
+    vertices = mesh.vertices
+    volume = 0
+    for polygon in mesh.polygons:
+        polygon_vertices = polygon.vertices
+        a = vertices[polygon_vertices[0]].co
+        for i in range(1, len(polygon_vertices) - 1):
+            volume += a.dot(vertices[polygon_vertices[i]].co.cross(vertices[polygon_vertices[i + 1]].co))
+    volume /= 6.0
+
+    if is_mesh_temporary:
+        bpy.data.meshes.remove(mesh)
+
+    if debug:
+        print("*done* Volume: ", volume)
+    return abs(volume)
+
+
+
+#------- SCRATCH OBJECTS ------------------------------------------------------#
+#
+# The temporary objects (duplicates, objects made real, join results, helper objects)
+# are registered when they are created. Deleting one only unlinks it from the scene,
+# which requires neither a selection nor an operator. The registered objects are
+# removed at once through bpy.data, together with the meshes they leave without
+# users, at the end of the run (or of a standalone operator). To keep the memory
+# bounded during long runs, the unlinked objects are removed in batches in between.
+#
+SCRATCH_OBJECTS_REMOVE_COUNT = 256
+scratch_objects = set()
+scratch_objects_unlinked = set()
+scratch_meshes = set()
+def register_scratch_objects(objects):
+    scratch_objects.update(objects)
+
+
+
+def register_scratch_mesh(mesh):
+    scratch_meshes.add(mesh)
+
+
+
+#
+# The objects are no longer temporary (e.g. the result of an operator) or were freed
+# by an operator (e.g. the objects joined into another).
+#
+def unregister_scratch_objects(objects):
+    scratch_objects.difference_update(objects)
+    scratch_objects_unlinked.difference_update(objects)
+
+
+
+def delete_objects(context, objects_to_be_deleted, exceptions=[]):
+    for o in objects_to_be_deleted:
+        if (not o or o in exceptions):
+            continue
+        if (context.scene.objects.get(o.name) == o):
+            context.scene.objects.unlink(o)
+        scratch_objects.add(o)
+        scratch_objects_unlinked.add(o)
+    if (len(scratch_objects_unlinked) >= SCRATCH_OBJECTS_REMOVE_COUNT):
+        remove_scratch_objects(scratch_objects_unlinked)
+
+
+
+#
+# @param objects The registered objects to remove, default: all.
+#
+def remove_scratch_objects(objects=None):
+    if (objects is None):
+        objects = scratch_objects
+    objects = list(objects)
+    if debug:
+        print('Removing ', len(objects), ' scratch objects ...')
+    for o in objects:
+        if (o.type == 'MESH'):
+            scratch_meshes.add(o.data)
+        # Without users, because remove(do_unlink=True) requires blender 2.77:
+        for scene in o.users_scene:
+            scene.objects.unlink(o)
+        for group in o.users_group:
+            group.objects.unlink(o)
+        bpy.data.objects.remove(o)
+    unregister_scratch_objects(objects)
+
+    # Orphans only, i.e. not the meshes shared with the original objects:
+    orphan_meshes = [mesh for mesh in scratch_meshes if mesh.users == 0]
+    for mesh in orphan_meshes:
+        bpy.data.meshes.remove(mesh)
+    scratch_meshes.difference_update(orphan_meshes)
+    if (len(scratch_objects) == 0):
+        scratch_meshes.clear()
+
+
+
+def resolve_all_joinable_objects_recursively(context, o, objects_to_be_joined, objects_to_be_deleted, is_already_duplicate=False, recursion_depth=0):
+    # Walk on an explicit stack: deeply nested group instances neither pay python frame overhead nor hit the recursion limit.
+    # The groups on the path to an object are kept to detect cycles.
+    stack = [(o, is_already_duplicate, recursion_depth, ())]
+    while (len(stack) > 0):
+        o, is_already_duplicate, recursion_depth, group_path = stack.pop()
+        #print(str(recursion_depth) + 'resolve_all_joinable_objects_recursively: o: ',o, ' to_be_joined: ', objects_to_be_joined, ' objects_to_be_deleted: ', objects_to_be_deleted)
+        if (recursion_depth > context.scene.after_how_many_create_bom_entry_recursions_to_abort):
+            log_warning(str(recursion_depth) + ' Reached recursion depth limit: ', context.scene.after_how_many_create_bom_entry_recursions_to_abort, ' current recursion depth: ', recursion_depth)
+            continue
+
+        # Ensure nothing is selected:
+        deselect_all(context)
+
+        #undo_count = undo_count + 1
+        o.select = True
+        #undo_count = undo_count + 1
+
+        #BELOW THIS LINE NOTHING HAS TO BE UNDONE! AS THIS DUPLICATED OBJECT
+        #(GROUP INSTANCE) WILL SIMPLY BE DELETED AFTERWARDS.
+        if (not is_already_duplicate): #<-- it may be duplicated, but make_real seems to duplicate linked!
+            # Linked, the data is not copied (see use_evaluated_mesh for the join target):
+            if (not bpy.ops.object.duplicate(linked=True)):
+                log_warning('Object to be resolved not yet is duplicate, but duplicate() operator failed')
+            register_scratch_objects(context.selected_objects)
+
+        if (len(context.selected_objects) > 1):
+            log_warning('Only one object (the group instance or one of the objects within its group) should have been selected.\r\nSelection: ', context.selected_objects, '. Thus dimension will only reflect those of the dupli group objects of the first selected group instance object.')
+        elif (len(context.selected_objects) < 1):
+            log_warning('Warning: It was no object selected but exactly one object should have been selected.\r\nSelection: ', context.selected_objects, '.')
+        context.scene.objects.active = context.selected_objects[0]
+
+        # The new (copy) group instance hopefully is the active object now:
+        if (not context.scene.objects.active):
+            log_warning('Warning: No active object after duplicating object: ', o)
+        else:
+            if debug:
+                print('active object after duplication of group instance: ', context.active_object, ' or :', context.scene.objects.active)
+
+        o_duplicate = context.scene.objects.active
+
+        # If the objects are duplicated, then they still are in the same groups as the original object. This means the dupli_group suddenly has more members, which leads to endless recursion. Thus remove the duplicates from all groups:
+        #if debug:
+        #    print('Removing selected objects from all groups. ', context.selected_objects)
+        #for selected_duplicate in context.selected_objects:
+        #    for d_group in selected_duplicate.users_group:
+        #        bpy.ops.group.objects_remove(group=d_group)
+        bpy.ops.group.objects_remove_all()
+
+        # As this is a duplicate, it needs to be removed later on:
+        # Required because of joining only allows mesh or curve only - no mix!
+        if (context.scene.objects.active.type == 'MESH'):
+            # No need to delete the object because it is joined, which also removes it if it's not the join target.
+            objects_to_be_joined.append(o_duplicate)
+        else:
+            objects_to_be_deleted.append(o_duplicate) # It's safer here as joining into an active object keeps up the active object of course. Thus the object should be deleted but it is not as it has been marked for join. Thus better not even mark for deletion.
+
+        # Further decomposition possible?
+        if (not (o_duplicate.dupli_group is None)):
+            # The duplicate still instances the original group, thus nesting an instance within its own group is detected here before any object is made real:
+            if (o_duplicate.dupli_group in group_path):
+                raise GroupCycleError('Group contains an instance of itself: '
+                        + format_group_chain(group_path[group_path.index(o_duplicate.dupli_group):] + (o_duplicate.dupli_group,)))
+            group_path = group_path + (o_duplicate.dupli_group,)
+            # Store a reference because it's not certain that an operator not changes the active object.
+            group_instance_object = o_duplicate
+            if debug:
+                print('Making real ... active: ', context.scene.objects.active)
+            #the active object (group instance) should be the only selected one:
+            group_instance_object.dupli_type = 'GROUP' # Turned the function into an operator, then a bug appeared: the dupli_type was cleared, somehow set to None.
+            # The dupli group attached to this object
+            # is copied here as real value object copies (not references).
+            bpy.ops.object.duplicates_make_real(use_base_parent=True)#false because we don't set up
+                    # the empty group instance as parent of the now copied and no longer referenced group objects!
+            # The object data stays linked (also if from a library), it is only read,
+            # see use_evaluated_mesh.
+            register_scratch_objects(context.selected_objects)
+            #Note:
+            # The real objects (including the group instance's empty!) that now reside where the group instance was before
+            # should already be selected after duplicates_make_real. (Note while make_real resolves to the very bottom,
+            # this (our) algorithm also works if this feature should change in the future as it's a recursive approach.)
+            if (len(context.selected_objects) < 1):
+                log_warning('Attention: No selection after duplicates_make_real operator! active object: ', context.scene.objects.active)
+
+            bpy.ops.group.objects_remove_all() # optional (because make_real removes the objects from all groups already)
+
+            #group_objects = context.scene.objects.active.dupli_group.objects#.children
+            group_objects = context.selected_objects
+            group_objects_to_resolve = []
+            #selected_objects_count = 0
+            for group_object in group_objects:
+                # If EMPTY is a considered type, then the empty corresponding to the current object (that also resides after duplicates_make_real) must be skipped:
+                if (group_object == group_instance_object): # the 'is' operator does not work here.
+                    if debug:
+                        print('>> Skipping group object %s because it\'s the group instance object %s itself.' % (group_object, group_instance_object))
+                    continue
+                if (not is_object_type_considered(group_object.type)):
+                    log_warning('Warning: Group object\'s type is not considered: ', group_object, ' type: ', group_object.type)
+                    objects_to_be_deleted.append(group_object)
+                    continue
+                group_objects_to_resolve.append(group_object)
+                #++selected_objects_count
+            # Keep the order of the group objects (the stack is LIFO):
+            for group_object in reversed(group_objects_to_resolve):
+                stack.append((group_object, True, recursion_depth + 1, group_path))
+
+    return {'FINISHED'}
+
+
+
+
+#
+# White space for filling up to a certain length.
+#
+def getWhiteSpace(count):
+    return getCharInstances(' ', count)
+
+def getCharInstances(char, count):
+    if (count < 1):
+        return ''
+    return char * int(round(count, 0))
+
+#
+#
+#
+def processEntry(entry, column_separator=""):
+    label = entry.label
+    material = entry.material
+    dimensions = entry.format_dimensions()
+    is_optional = entry.is_optional
+
+    whitespace_count = object_longest_label_len - len(label)
+    material_whitespace_count = material_longest_label_len - len(material)
+    if debug:
+        print('object whitespace count: ', whitespace_count, '\t material whitespace count: ', material_whitespace_count)
+
+    pre = ''
+    post = ''
+    if (is_optional):
+        pre = ''#PREPEND_IF_OPTIONAL
+        post = APPEND_IF_OPTIONAL
+    entryProcessed = '\t' + pre + label + getWhiteSpace(whitespace_count) + '\t' + column_separator + material + getWhiteSpace(material_whitespace_count) + '\t' + column_separator + dimensions + post;
+    #entryProcessed_len = len(entryProcessed)
+
+    return entryProcessed
+
+
+
+#------- EXPORTERS -------------------------------------------------------------#
+#
+# The exporters of further formats reside in selection2bom_core. This one, the
+# fixed-width text table (or html table in markdown if blueprints are included),
+# depends on the column widths determined while walking the objects.
+#
+class TextBomExporter(BomExporter):
+    format_id = 'TXT'
+    label = 'Text'
+    description = 'Fixed-width text table (markdown with html table if blueprints are included)'
+
+    def get_file_ending(self, context):
+        if context.scene.selection2bom_in_include_blueprints and hasattr(context.scene, "blueprint_settings"):
+            return '.md' # Markdown format for showing images directly on the git mirror, e.g. Github. Though html also works because the syntax is html.
+        return '.txt'
+
+    def begin(self):
+        # The column widths are known from the traversal, thus each row is written as soon as it is formatted.
+        self.count_column_width = entry_count_highest_digit_count + len(PREPEND_IF_OPTIONAL)
+        self.count_column_padding = getWhiteSpace(self.count_column_width + len('x '))
+
+        # HTML / Markdown additions:
+        self.table_begin = ""
+
+        self.header_begin = ""
+        self.header_row_begin = ""
+        self.header_column_separator = ""
+        self.header_row_end = ""
+        self.header_end = ""
+
+        self.body_begin = ""
+        self.row_begin = ""
+        self.column_separator = ""
+        self.column_separator_colspan_remainder = ""
+        self.row_end = ""
+        self.row_empty = ""
+        self.body_end = ""
+
+        self.table_end = ""
+        if (self.context.scene.selection2bom_in_include_blueprints):
+            # Add html markup per entry: <tr><td></td></tr> or <td colspan="3"></td> if blueprint/image row.
+            self.table_begin = "<table>"
+
+            self.header_begin = "<thead>"
+            self.header_row_begin = "<tr><th>"
+            self.header_column_separator = "</th><th>"
+            self.header_row_end = "</th></tr>"
+            self.header_end = "</thead>"
+
+            self.body_begin = "<tbody>"
+            self.row_begin = "<tr><td>"
+            self.column_separator = "</td><td>"
+            self.column_separator_colspan_remainder = '</td><td colspan="3">'
+            self.row_end = "</td></tr>"
+            self.row_empty = '<tr><td colspan="4"></td></tr>'
+            self.body_end = "</tbody>"
+
+            self.table_end = "</table>"
+
+        write = self.f.write
+        write(self.table_begin)
+        write(self.header_begin)
+        write(self.header_row_begin + getWhiteSpace(entry_count_highest_digit_count) + '#  \t' + self.header_column_separator + 'Label' + getWhiteSpace(object_longest_label_len - 5) + '\t' + self.header_column_separator + 'Material ' + getWhiteSpace(material_longest_label_len - 8) + '\t' + self.header_column_separator + 'Dimensions' + self.header_row_end)
+        if not self.context.scene.selection2bom_in_include_blueprints:
+            write('\r\n')
+            write(getWhiteSpace(entry_count_highest_digit_count) + '-  \t-----' + getWhiteSpace(object_longest_label_len - 5) + '\t---------' + getWhiteSpace(material_longest_label_len - 8) + '\t----------')
+        write('\r\n')
+        write(self.header_end)
+
+        write(self.body_begin)
+        write(self.row_empty)
+
+    def write_count_row(self, entry, count_string, append=''):
+        pre = ''
+        if (entry.is_optional):
+            pre = PREPEND_IF_OPTIONAL
+        whitespace_count = self.count_column_width - len(count_string) - len(pre)
+        self.f.write('\r\n' + self.row_begin + pre + getWhiteSpace(whitespace_count) + count_string + 'x ' + self.column_separator + processEntry(entry, self.column_separator) + append + self.row_end)
+
+    def write_entry(self, entry, entry_count, info, variants):
+        write = self.f.write
+        self.write_count_row(entry, str(entry_count))
+
+        # Include extra information line?
+        if self.context.scene.selection2bom_in_include_info_line:
+            if info is not None:
+                write('\r\n' + self.row_begin + self.count_column_padding + '\t' + self.column_separator_colspan_remainder + info + self.row_end)
+            else:
+                if debug:
+                    print('No information for entry: ', entry)
+
+        # Include blueprints (1 per variant)?
+        if (self.context.scene.selection2bom_in_include_blueprints):
+            if variants is not None:
+                for variant_volume, variant_count in variants.items():
+                    blueprint = '<img src="'+ self.get_blueprint_filelink(entry, variant_volume) +'" title="Volume: ' + str(variant_volume) + '" alt="blueprint"/>'
+                    write('\r\n' + self.row_begin + getWhiteSpace(self.count_column_width - len(str(variant_count))) + str(variant_count) + 'x \t' + self.column_separator_colspan_remainder + blueprint + self.row_end)
+            else:
+                if debug:
+                    print('No variants for entry: ', entry)
+
+        write('\r\n' + self.row_empty) # <- Some space for clearly structuring by which entries belong together.
+
+    def begin_assemblies(self):
+        self.f.write(self.body_end)
+        self.f.write(self.body_begin)
+        self.f.write('\r\n\r\n\r\n======= ASSEMBLIES: ======')
+
+    def write_assembly(self, assembly, assembly_count):
+        self.f.write('\r\n--------------')
+        self.write_count_row(assembly, str(assembly_count), append=':')
+        self.f.write('\r\n-------')
+
+    def write_assembly_entry(self, assembly, entry, entry_count):
+        self.write_count_row(entry, str(entry_count))
+
+    def end_assembly(self, assembly):
+        self.f.write('\r\n' + self.row_begin + '--------------\r\n\r\n' + self.column_separator_colspan_remainder + '' + self.row_end)
+
+    def end(self):
+        if (self.context.scene.selection2bom_in_mode != '2'):
+            self.f.write(self.body_end)
+            self.f.write(self.body_begin)
+        self.f.write(self.body_end)
+
+
+
+bom_exporters = OrderedDict()
+def register_bom_exporter(exporter_class):
+    bom_exporters[exporter_class.format_id] = exporter_class
+
+for exporter_class in (TextBomExporter, CsvBomExporter, JsonLinesBomExporter, MarkdownBomExporter, HtmlBomExporter):
+    register_bom_exporter(exporter_class)
+
+
+
+def get_bom_export_formats(context, formats=None):
+    if formats is None:
+        formats = context.scene.selection2bom_in_formats
+    # In registration order, thus the first format determines the filelink:
+    formats = [format_id for format_id in bom_exporters.keys() if format_id in formats]
+    if (len(formats) == 0):
+        formats = [TextBomExporter.format_id]
+    return formats
+
+
+
+def get_bom_export_file_endings(context, formats=None):
+    return [bom_exporters[format_id](context, None).get_file_ending(context) for format_id in get_bom_export_formats(context, formats)]
+
+
+
+#
+# Writes the BoM in all the given formats (default: the formats selected in the scene).
+# Every format is written to the filelink with the format's file ending.
+# @return The filelinks written to.
+#
+@measured_phase('write')
+def write2file(context, bom_entry_count_map, bom_entry_info_map, assembly_count_map, assembly_bom_entry_count_map, filelink=None, formats=None):#<-- argument is a dictionary (key value pairs)!
+    if debug:
+        print('Writing bill of materials to file ...')
+
+    formats = get_bom_export_formats(context, formats)
+    if (filelink is None):
+        filelink = build_filelink(context, fileendings=get_bom_export_file_endings(context, formats))
+    if debug:
+        print('Target filelink: ', filelink, ' formats: ', formats)
+        print('Highest entry count string char count: ', entry_count_highest_digit_count)
+        print('Highest object label char count: ', object_longest_label_len)
+        print('Highest material char count: ', material_longest_label_len)
+
+    # Each exporter writes to its own file ending, the blueprint filelinks stay relative to the given filelink:
+    filelink_base = os.path.splitext(filelink)[0]
+    exporters = []
+    file_endings = set()
+    for format_id in formats:
+        exporter = bom_exporters[format_id](context, filelink)
+        file_ending = exporter.get_file_ending(context)
+        # A registered format must not overwrite the file of another one:
+        if (file_ending in file_endings):
+            file_ending = '.' + format_id.lower() + file_ending
+        file_endings.add(file_ending)
+        exporter.filelink = filelink_base + file_ending
+        exporter.blueprint_root = bpy.path.abspath('//')
+        exporters.append(exporter)
+
+    filelinks = []
+    try:
+        for exporter in exporters:
+            exporter.open()
+            exporter.begin()
+
+        # Total part (counts):
+        for entry, entry_count in bom_entry_count_map.items():
+            info = bom_entry_info_map.get(entry)
+            variants = bom_entry_variant_map.get(entry)
+            for exporter in exporters:
+                exporter.write_entry(entry, entry_count, info, variants)
+
+        # Assemblies (including count):
+        if (context.scene.selection2bom_in_mode == '2'):
+            for exporter in exporters:
+                exporter.begin_assemblies()
+            for assembly, entry_count_map in assembly_bom_entry_count_map.items():
+                # Skip atomar assemblies (as they are listed in the global list and not to be decomposed):
+                if (not (assembly in assembly_count_map)):
+                    if (not (assembly in bom_entry_count_map)):
+                        log_warning('Assembly neither found in assembly count map nor in global bom entry count map.')
+                    if debug:
+                        print('Skipping atomar assembly: ', assembly)
+                    continue
+                # it's a decomposable assembly, i.e. a non-empty and non-atomar one:
+                assembly_count = assembly_count_map[assembly]
+                for exporter in exporters:
+                    exporter.write_assembly(assembly, assembly_count)
+                for entry, entry_count in entry_count_map.items():
+                    entry_count_per_assembly = int(round(entry_count/assembly_count, 0))
+                    for exporter in exporters:
+                        exporter.write_assembly_entry(assembly, entry, entry_count_per_assembly)
+                for exporter in exporters:
+                    exporter.end_assembly(assembly)
+
+        for exporter in exporters:
+            exporter.end()
+    finally:
+        for exporter in exporters:
+            if exporter.f is None:
+                continue
+            if (exporter.close()):
+                log_info('Bill of materials created: ', exporter.filelink)
+                filelinks.append(exporter.filelink)
+            else :
+                log_error('Bill of materials: creation failed! ', exporter.filelink)
+    return filelinks
+
+
+
+# This bom entry is appended to a file.
+def append_bom_entry_to_file(context, bom_entry):
+  return append_to_file(context, '\r\n' + str(bom_entry_count_map[bom_entry]) + 'x ' + processEntry(bom_entry))
+
+
+def append_to_file(context, content):
+
+    if debug:
+        print('Target filelink: ', filelink)
+
+    #append to file
+    with open(filelink, 'a') as f:#for closing filestream automatically
+        #f.read()
+        #f.readhline()
+        if (f.write(content)):
+            if debug:
+                print('Appended to file: ', filelink, ' \t Content: ',  content)
+            return True
+
+        #f.tell()
+        #f.seek(byte) #e.g. 0123 -> 4th byte is 3
+        #http://docs.python.org/3/tutorial/inputoutput.html
+    #f.close() -- no longer necessary when using with/scope
+    #use pickle.dump(object, filestream) and pickle.load(filestream) (somewhat like serialization?)
+    return False
+
+
+
+#
+# Construct a valid output filelink.
+# Prepend may be useful for giving a context, e.g. to group the file with a scene it belongs to.
+# Or e.g. to group blueprints with a Bill of materials.
+#
+def build_filelink(context, prepend='', fileendings=None):
+    if debug:
+        print('Building filelink ...')
+
+    # Build filelink:
+    root = bpy.path.abspath('//')
+    if (output_directory):
+        root = output_directory
+    if (root == ''):
+        if debug:
+            print('.blend File not saved yet. Storing BOM to HOME or current directory.')
+        root = './'#using relative paths -> to home directory
+        #root = os.getcwd()#<-- current working directory, so where the blender was launched from.
+    if debug:
+        print('Root: ' + root)
+    #root = dirname(pathname(__FILE__))#http://stackoverflow.com/questions/5137497/find-current-directory-and-files-directory
+    filename = output_filename_prepend + prepend + 'BoM-' # TODO How to determine this blend file's name?
+    # One file per export format, all sharing the same name:
+    if fileendings is None:
+        fileendings = get_bom_export_file_endings(context)
+    fileending = fileendings[0]
+
+    #objectname = getBaseName(context.selected_objects[0].name)
+    objectname = None
+    if context.active_object:
+        objectname = getBaseName(context.active_object.name)
+    if context.scene.name:
+        objectname = context.scene.name
+    if (not objectname or objectname is None):
+        objectname = 'neither_active_object_nor_scene_name'
+
+    filename = filename + objectname
+    filelink = root + '/' + filename
+
+    # Don't overwrite existing files because for several subsequent selections made,
+    # individual (and persisting) files could be desired.
+    number = 0
+    while (any([os.path.isfile(filelink + ending) for ending in fileendings])):#alternatively: try: with (open(filelink)): ... except IOError: print('file not found')
+        number = number + 1              #http://stackoverflow.com/questions/82831/how-do-i-check-if-a-file-exists-using-python
+        filename_ = filename + str(number)
+        filelink = root + '/' + filename_
+    filelink = filelink + fileending
+
+    # A non-existant filelink was found.
+    return filelink
+
+
+
+
+
+
+#HELPER - TIDYUPNAMES
+def tidyUpNames():
+    ############
+    #fetch active object
+    ############
+    active_obj = isThereActiveObjectThenGet(context)
+    if (not active_obj or active_obj is None):
+        if debug:
+            print('Aborting tidying up names because there is no active object.'
+            ' So nothing was left after the joining or grouping?')
+        return False
+    ############
+    #tidy up - dismiss the .001, .002, .. endings if necessary
+    ############
+    if debug:
+        print('Object-name before refactoring: ', active_obj.name)
+    cleanname = getBaseName(active_obj.name)
+    if (cleanname and cleanname != active_obj.name):
+        if debug:
+            print('renaming')
+        active_obj.name = cleanname
+        if debug:
+            print('renaming *done*')
+    #debug
+    if debug:
+        print('Object-name after refactoring: ', active_obj.name)
+    return True
+
+
+
+
+#
+# Helper for checking if a selection is made and retrieving it (for single source principle).
+#
+def isThereSelectionThenGet(context):
+    #opt. check if selection only one object (as is to be expectat after join)
+    sel = context.selected_objects
+    if (debug):
+        print('Count of objects in selection (hopefully 1): ', len(sel))
+    if (sel is None or not sel):
+        if debug:
+            print('No selection! Is there nothing left by join action? *worried*',
+            '\n\raborting renaming ...')
+        return False
+    #deliver the selection
+    return sel
+
+
+
+#
+# Helper for checking for an active object and retrieving it (for single source principle).
+#
+def isThereActiveObjectThenGet(context):
+    #get active object of context
+    active_obj = context.active_object
+    if (active_obj is None or not active_obj):
+        if debug:
+            print('No active object -',
+            ' trying to make the first object of the selection the active one.')
+        #check if selection and get
+        sel = isThereSelectionThenGet(context)
+        #make first object active (usually it should only be 1 object)
+        context.scene.objects.active = sel[0]
+    active_obj = context.active_object
+    if (active_obj is None or not active_obj):
+        if debug:
+            print('Still no active object! Aborting renaming ...')
+        return False
+    #deliver the active object
+    return active_obj
+
+
+
+#
+# Helper for getting basename, i.e. cutting off endings like .001, .002, ...
+# @return string:basename aka cleanname
+#
+def getBaseName(s):
+    return parse_name(s).base_name
+
+
+
+
+
+
+
+#------- LIVE -----------------------------------------------------------------#
+#
+# Opt-in live mode: A full run keeps the contributions (i.e. the recorded count
+# increments, see add_count) of each selected top level object. A scene update
+# handler marks those top level objects dirty whose object or any of the (nested)
+# groups and group objects they depend on changed. The next run then subtracts the
+# contributions of the dirty objects, walks only these again and writes the BoM.
+#
+# Blender 2.7x has no depsgraph_update_post handler, scene_update_post together
+# with the is_updated flags is its counterpart. As the flags are also set by mere
+# selection changes (and by the operators of a run), a changed fingerprint decides.
+#
+# A change of the settings, of the listed objects (the selection or, without one,
+# the candidates of the automatic selection) or of the live mode itself requires a
+# full run again, as does undo or loading a file (the kept object references
+# become invalid). Thus added, removed or (un)hidden objects are listed as by a full run.
+#
+live_contributions_map = None # top level object -> contributions. None if there is no live BoM.
+live_dependents_map = {} # object or group -> top level objects depending on it.
+live_fingerprint_map = {} # object or group -> fingerprint when it was walked.
+live_dirty_objects = set()
+live_settings = None
+live_are_hidden_layers_included = False # As determined by the full run.
+is_run_active = False
+def init_live(context):
+    global live_contributions_map
+    global live_dependents_map
+    global live_fingerprint_map
+    global live_dirty_objects
+    global live_settings
+    live_contributions_map = None
+    if (context.scene.selection2bom_in_live):
+        live_contributions_map = {}
+        set_live_handler(True)
+    live_dependents_map = {}
+    live_fingerprint_map = {}
+    live_dirty_objects = set()
+    live_settings = get_live_settings(context)
+
+
+
+def clear_live():
+    global live_contributions_map
+    global live_dependents_map
+    global live_fingerprint_map
+    global live_dirty_objects
+    live_contributions_map = None
+    # The maps hold object and group references, which undo or loading a file invalidates:
+    live_dependents_map = {}
+    live_fingerprint_map = {}
+    live_dirty_objects = set()
+
+
+
+#
+# The settings and the objects that influence the BoM entries. The formats only
+# influence writing.
+#
+def get_live_settings(context):
+    s = context.scene
+    return (s.name, s.selection2bom_in_mode, s.selection2bom_in_precision, s.selection2bom_in_include_blueprints,
+            s.unit_settings.system, s.unit_settings.scale_length, get_listed_objects_key(context))
+
+
+
+#
+# The objects a full run would list, see create_bill_of_materials.
+#
+def get_listed_objects_key(context):
+    if (len(context.selected_objects) > 0):
+        return ('selected', frozenset(context.selected_objects))
+    return ('auto-selected', frozenset(o for o in context.scene.objects if is_candidate_object(o)))
+
+
+
+def is_live_update_possible(context):
+    return (context.scene.selection2bom_in_live and live_contributions_map is not None
+            and live_settings == get_live_settings(context))
+
+
+
+def set_live_handler(is_enabled):
+    for handlers, handler in ((bpy.app.handlers.scene_update_post, live_scene_update_post),
+            (bpy.app.handlers.undo_post, live_invalidated_post), (bpy.app.handlers.redo_post, live_invalidated_post),
+            (bpy.app.handlers.load_post, live_invalidated_post)):
+        if (is_enabled and not (handler in handlers)):
+            handlers.append(handler)
+        elif (not is_enabled and handler in handlers):
+            handlers.remove(handler)
+
+
+
+#
+# After undo, redo or loading a file the next run is a full run again.
+#
+@persistent
+def live_invalidated_post(scene):
+    clear_live()
+
+
+
+def on_live_toggled(scene, context):
+    set_live_handler(scene.selection2bom_in_live)
+    clear_live()
+
+
+
+def get_object_fingerprint(o, scene):
+    material = None
+    if (o.active_material is not None):
+        material = o.active_material.name
+    data = None
+    if (o.data is not None):
+        data = o.data.name
+        if (o.type == 'MESH'):
+            data = (data, len(o.data.vertices), len(o.data.polygons))
+    return (o.name, data, material, flatten(o.matrix_world), tuple(o.dimensions), len(o.modifiers),
+            o.dupli_group, o.hide, o.is_visible(scene))
+
+
+
+def get_group_fingerprint(group):
+    return (group.name, tuple(group.objects), tuple(group.dupli_offset))
+
+
+
+#
+# Each top level object depends on itself and on the groups reachable from it.
+# The objects of these groups are not indexed, their change marks their groups.
+#
+def index_live_dependencies(context, snapshot):
+    reachable_groups_map = {}
+    for top_level_object in snapshot.selected_objects:
+        o = top_level_object.object
+        live_dependents_map.setdefault(o, set()).add(o)
+        live_fingerprint_map[o] = get_object_fingerprint(o, context.scene)
+        if (top_level_object.group_index == -1):
+            continue
+        if not (top_level_object.group_index in reachable_groups_map):
+            reachable_groups_map[top_level_object.group_index] = collect_reachable_groups(snapshot.groups, top_level_object.group_index)
+        for group in reachable_groups_map[top_level_object.group_index]:
+            live_dependents_map.setdefault(group.group, set()).add(o)
+    # Every reachable group and group object once:
+    for group in snapshot.groups:
+        live_fingerprint_map[group.group] = get_group_fingerprint(group.group)
+        for group_object in group.objects:
+            live_fingerprint_map[group_object.object] = get_object_fingerprint(group_object.object, context.scene)
+
+
+
+def collect_reachable_groups(groups, group_index):
+    reachable_group_indices = set([group_index])
+    stack = [groups[group_index]]
+    while (len(stack) > 0):
+        group = stack.pop()
+        for o in group.objects:
+            if (o.group_index != -1 and not (o.group_index in reachable_group_indices)):
+                reachable_group_indices.add(o.group_index)
+                stack.append(groups[o.group_index])
+    return [groups[index] for index in reachable_group_indices]
+
+
+
+#
+# Mesh edits, modifier changes and material assignments tag the data, not the object.
+#
+def is_object_updated(o):
+    if (o.is_updated or o.is_updated_data):
+        return True
+    return o.data is not None and (o.data.is_updated or o.data.is_updated_data)
+
+
+
+def live_scene_update_post(scene):
+    if (live_contributions_map is None or is_run_active):
+        return
+    if (bpy.data.objects.is_updated or bpy.data.meshes.is_updated or bpy.data.curves.is_updated):
+        for o in bpy.data.objects:
+            if (not (o in live_fingerprint_map) or not is_object_updated(o)):
+                continue
+            if (get_object_fingerprint(o, scene) != live_fingerprint_map[o]):
+                mark_live_dependents_dirty(o)
+                for group in o.users_group:
+                    mark_live_dependents_dirty(group)
+    if (bpy.data.groups.is_updated):
+        for group in bpy.data.groups:
+            if (group.is_updated and group in live_fingerprint_map
+                    and get_group_fingerprint(group) != live_fingerprint_map[group]):
+                mark_live_dependents_dirty(group)
+
+
+
+def mark_live_dependents_dirty(dependency):
+    dependents = live_dependents_map.get(dependency)
+    if (dependents):
+        if debug:
+            print('Live: ', dependency, ' changed, dirty: ', dependents)
+        live_dirty_objects.update(dependents)
+
+
+
+#
+# All objects of a top level object are done (the work stack is LIFO).
+#
+def finish_live_object(top_level_object):
+    live_contributions_map[top_level_object.object] = pop_contribution_recorder()
+
+
+
+#
+# Removes the entries no longer counted anywhere.
+#
+def prune_bom_entries():
+    for entry in [entry for entry, variants in bom_entry_variant_map.items() if len(variants) == 0]:
+        del bom_entry_variant_map[entry]
+    for assembly in [assembly for assembly, entry_count_map in assembly_bom_entry_count_map.items() if len(entry_count_map) == 0]:
+        del assembly_bom_entry_count_map[assembly]
+    for entry in [entry for entry in bom_entry_info_map.keys() if not (entry in bom_entry_count_map or entry in assembly_count_map)]:
+        del bom_entry_info_map[entry]
+
+
+
+def is_object_in_scene(context, o):
+    try:
+        return context.scene.objects.get(o.name) == o
+    except ReferenceError: # Removed.
+        return False
+
+
+
+#
+# A live run, see act_incrementally: Only the dirty and the removed top level
+# objects are updated, by subtracting their contributions and walking them again.
+#
+def update_bill_of_materials(context):
+    global bom_filelinks
+    global scene_snapshot
+
+    selected_objects_to_restore = list(context.selected_objects)
+    active_object_to_restore = context.scene.objects.active
+
+    dirty_objects = [o for o in live_contributions_map.keys() if o in live_dirty_objects or not is_object_in_scene(context, o)]
+    live_dirty_objects.clear()
+    log_info('Live: Updating ', len(dirty_objects), ' of ', len(live_contributions_map), ' objects.')
+    for o in dirty_objects:
+        subtract_contributions(live_contributions_map.pop(o))
+    prune_bom_entries()
+    objects = [o for o in dirty_objects if is_object_in_scene(context, o)]
+
+    # The objects on hidden layers are examined as in the full run, i.e. only if it had a selection:
+    global are_hidden_layers_included
+    are_hidden_layers_included = live_are_hidden_layers_included
+    try:
+        filelink = build_filelink(context)
+        if (len(objects) > 0):
+            scene_snapshot = take_scene_snapshot(context, objects)
+            index_live_dependencies(context, scene_snapshot)
+            yield from create_bom_entries_incrementally(context, scene_snapshot.selected_objects, [], filelink=filelink)
+        bom_filelinks = write2file(context, bom_entry_count_map, bom_entry_info_map, assembly_count_map, assembly_bom_entry_count_map, filelink)
+
+    finally:
+        restore_selection(context, selected_objects_to_restore, active_object_to_restore)
+        restore_layers(context)
+
+    return {'FINISHED'}
+
+
+
+
+
+
+
+
+#------- CLASSES --------------------------------------------------------------#
+
+
+#
+# Invoked from the user interface the operator runs modal: The traversal is done
+# in time slices on a timer, in between Blender stays responsive. Esc cancels.
+# Executed (e.g. from a script) the operator runs synchronously.
+#
+MODAL_TIME_SLICE_SECONDS = 0.1
+MODAL_TIMER_INTERVAL_SECONDS = 0.05
+def format_progress(work_done, work_total, seconds):
+    text = 'Selection2BoM: %d%%' % (100 * work_done // max(1, work_total))
+    if (work_done > 0 and seconds > 0):
+        items_per_second = work_done / seconds
+        text += ' | %d items/sec | ETA %d sec' % (items_per_second, (work_total - work_done) / items_per_second)
+    return text + ' | Esc to cancel'
+
+
+
+#
+# JoinOrGroupMatchingObjects
+#
+# Wraps some general attributes and some specific ones
+# like the actual content of the regex input field.
+#
+class OBJECT_OT_Selection2BOM(bpy.types.Operator):
+    """Performs the operation (i.e. creating a bill of materials) according to the settings."""
+    #=======ATTRIBUTES=========================================================#
+    bl_idname = "object.selection2bom"
+    bl_label = "Create a Bill of Materials out of selected objects."
+    " If no 'Material:<Material>' is given, the blender material is taken"
+    " as the desired material. By default Group instances are resolved to"
+    " their original group and from there to the therein contained objects"
+    " - a group or instance thereof is no individual standalone part by default."
+    " Application: Hide objects that shall be excluded from the BoM or select"
+    " objects to be included in the BoM explicitely. If no selection is given"
+    " then all the not hidden objects and groups are examined."
+    bl_context = "objectmode"
+    bl_register = True
+    bl_undo = True
+    #bl_options = {'REGISTER', 'UNDO'}
+
+    #=======CONSTRUCTION=======================================================#
+    #def __init__(self):
+    #=======METHODS============================================================#
+    is_running_modal = False
+
+    @classmethod
+    def poll(self, context):#it's the same without self (always inserted before)
+        # check the context:
+        if not context.scene:
+            log_error("Wrong context: No scene.")
+            return False
+        # One run at a time, the state of a run is global:
+        if OBJECT_OT_Selection2BOM.is_running_modal:
+            return False
+        if context.scene.selection2bom_in_include_blueprints and not hasattr(context.scene, "blueprint_settings"):
+            log_error("Wrong context: No blueprint settings, i.e. no engineering drawing functionality found.\r\nNote the blueprint addon is not provided because interest was low and support was basically non-existent. There is not enough done for a better world, the world is spiralling (once again) into war/cruelty (organized kidnapping of 10 to 16 years old girls!) and chaos.\r\nThe blueprint functionality has been created for non-profit overall world development aid (free, open automated machines/hardware) over the course of several months non-stop coding and testing. We want a world of magic, fantasy and harmony. We must step up our actions for a better overall world (neither egoism, nor group egoism e.g. my/our nation/belief/... is the only/the best/...).\r\nA solution/chance might be to increase base living standard globally and to encourage philosophical questioning.\r\nNote this bill of materials addon version that includes the blueprint functionality has several issues fixed, like wrong assembly hierarchy derived dimensions due to mismatched rotation (which is often is the case in engineering models that use assemblies).")
+            return False
+        return True  # <-- context does not matter here
+        # The following condition no longer is required as auto-detection of mechanical objects is supported.
+        # Also the following is not compatible with the possibility to either select objects for the bom
+        # or hide objects that shall be exluded.
+        #return context.selected_objects is not None && len(context.selected_objects) > 0
+
+    #
+    # Command base function (outline).
+    #
+    def execute(self, context):
+        time_start = time.time()
+        #processInput(context)
+        try:
+            act(context)
+        except GroupCycleError as e:
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        log_info("Selection2BoM finished:", round(time.time() - time_start, 4), "sec")
+        return {'FINISHED'}
+
+    def invoke(self, context, event):
+        self.time_start = time.time()
+        self.run = act_incrementally(context)
+        next(self.run)
+        run_statistics.pause()
+        self.area = context.area
+        wm = context.window_manager
+        self.timer = wm.event_timer_add(MODAL_TIMER_INTERVAL_SECONDS, context.window)
+        wm.progress_begin(0, 100)
+        wm.modal_handler_add(self)
+        OBJECT_OT_Selection2BOM.is_running_modal = True
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if (event.type == 'ESC'):
+            self.run.close() # Restores the layers and the selection.
+            self.finish(context)
+            log_warning("Selection2BoM cancelled after", round(time.time() - self.time_start, 4), "sec")
+            self.report({'WARNING'}, 'Bill of materials cancelled.')
+            return {'CANCELLED'}
+
+        if (event.type != 'TIMER'):
+            return {'PASS_THROUGH'}
+
+        # One time slice:
+        work_done, work_total = 0, 1
+        time_slice_end = time.time() + MODAL_TIME_SLICE_SECONDS
+        run_statistics.resume()
+        try:
+            while True:
+                work_done, work_total = next(self.run)
+                if (time.time() >= time_slice_end):
+                    break
+        except StopIteration:
+            self.finish(context)
+            log_info("Selection2BoM finished:", round(time.time() - self.time_start, 4), "sec")
+            return {'FINISHED'}
+        except GroupCycleError as e:
+            self.finish(context)
+            self.report({'ERROR'}, str(e))
+            return {'CANCELLED'}
+        except Exception:
+            self.finish(context)
+            raise
+        finally:
+            run_statistics.pause()
+
+        context.window_manager.progress_update(100 * work_done // max(1, work_total))
+        if (self.area):
+            self.area.header_text_set(format_progress(work_done, work_total, time.time() - self.time_start))
+        return {'RUNNING_MODAL'}
+
+    def finish(self, context):
+        wm = context.window_manager
+        wm.event_timer_remove(self.timer)
+        wm.progress_end()
+        if (self.area):
+            self.area.header_text_set()
+        OBJECT_OT_Selection2BOM.is_running_modal = False
+
+
+
+
+
+#
+# GUI Panel
+#
+# Extends Panel.
+#
+class VIEW3D_PT_tools_selection2bom(bpy.types.Panel):
+    bl_space_type = 'VIEW_3D'
+    bl_region_type = 'TOOLS'
+    bl_label = 'Selection to Bill of Materials'
+    bl_context = 'objectmode'
+    bl_options = {'DEFAULT_CLOSED'}
+    #DRAW
+    def draw(self, context):
+        s = context.scene
+        in_mode_str = 'Objects'
+        #get a string representation of enum button
+        if debug:
+            print('Mode: ', s.selection2bom_in_mode)
+        layout = self.layout
+        col = layout.column(align = True)
+        col.row().prop(s, 'selection2bom_in_mode', expand = True)
+        #splitbutton for enums (radio buttons) ...
+
+        row = layout.row(align=True)
+        row.prop(s, 'selection2bom_in_precision')
+
+        row = layout.row(align=True)
+        row.prop(s, 'selection2bom_in_cache_size')
+
+        row = layout.row(align=True)
+        row.prop(s, 'selection2bom_in_log_level')
+
+        row = layout.row(align=True)
+        row.prop(s, 'selection2bom_in_include_info_line')
+
+        row = layout.row(align=True)
+        row.prop(s, 'selection2bom_in_include_blueprints')
+
+        row = layout.row(align=True)
+        row.prop(s, 'selection2bom_in_live')
+        if (s.selection2bom_in_live and live_contributions_map is not None):
+            row.label(text='%d of %d changed' % (len(live_dirty_objects), len(live_contributions_map)))
+
+        col = layout.column(align=True)
+        col.label(text='Formats:')
+        col.row().prop(s, 'selection2bom_in_formats', expand=True)
+
+        #col = layout.column(align=True)
+        #col.row().prop(s, 'selection2bom_in_scale_factor')#better use the unit settings in scene tab
+
+
+        #textfield
+        #layout.prop(s, 'joinorgroupbypattern_in_pattern', text = 'Pattern')
+        #splitbutton for enums (radio buttons) ...
+        #row = layout.row(align = True)
+        #only relevant if mode set to join => active (additional option)
+        #row.active = (in_mode_str == 'Join')
+        #row.prop(s, 'joinorgroupbypattern_in_tidyupnames')
+
+        #if (len(s.selected_objects) == 0):
+            #col = layout.column(align = True)
+            #col.label(text = 'Include hidden objects:')
+            #col.row().prop(s, 'joinorgroupbypattern_in_auto_expansion_index_start')
+            #col.row().prop(s, 'joinorgroupbypattern_in_auto_expansion_index_end')
+            #col.row().prop(s, 'joinorgroupbypattern_in_a_e_digits_total_max')
+            #row = layout.row(align = True)
+            #row.prop(s, 'selection2bom_in_include_hidden')
+
+
+        row = layout.row(align = True)
+        label = in_mode_str + " 2 BOM!"
+        if (s.selection2bom_in_mode == '0'):
+            label = '(Treat assemblies as complete parts.)' + label
+        elif (s.selection2bom_in_mode == '1'):
+            label = '(Resolve group instances)' + label
+        else:#if (s.selection2bom_in_mode == '2'):
+            label = '(Both/Hybrid)' + label
+
+        row.operator('object.selection2bom', icon='FILE_TICK', text = label)
+
+        # Where the last run spent its time:
+        if (run_statistics and run_statistics.total_seconds > 0):
+            box = layout.box()
+            col = box.column(align=True)
+            col.label(text='Last run: %.3f sec' % run_statistics.total_seconds)
+            for phase, seconds in run_statistics.phase_seconds.items():
+                if (seconds > 0):
+                    col.label(text='  %s: %.3f sec' % (phase, seconds))
+            col = box.column(align=True)
+            col.label(text='Calls:')
+            for name, count in sorted(run_statistics.call_count_map.items(), key=lambda item: -item[1])[0:PANEL_CALL_COUNT_MAX]:
+                col.label(text='  %s: %d' % (name, count))
+
+
+
+
+
+
+
+
+
+
+#------- COMMAND LINE ---------------------------------------------------------#
+#
+# blender -b file.blend --python object_selection2bom/__main__.py -- --mode 2 --format csv --out dir
+#   Creates the BoM of the loaded .blend file.
+# blender -b --python object_selection2bom/__main__.py -- --mode 2 --format csv --out dir --jobs 4 a.blend b.blend ...
+#   Spreads the given .blend files over the given count of worker blender processes.
+#
+# The exit code is 0 if the BoMs of all files were created, 1 otherwise.
+#
+CLI_RESULT_PREFIX = 'SELECTION2BOM_RESULT '
+CLI_SCRIPT_FILELINK = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__main__.py')
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(prog='blender -b [file.blend] --python object_selection2bom/__main__.py --',
+            description='Creates bills of materials of .blend files.')
+    parser.add_argument('files', nargs='*', metavar='file.blend',
+            help='The .blend files to create BoMs of (each in its own blender process). Default: the loaded file.')
+    parser.add_argument('--mode', choices=['0', '1', '2'], default='1',
+            help='0: group instances are parts, 1: group instances are resolved, 2: hybrid. Default: 1')
+    parser.add_argument('--format', action='append', default=None,
+            help='Export format(s), comma separated or repeated: ' + ', '.join([format_id.lower() for format_id in bom_exporters.keys()]) + '. Default: txt')
+    parser.add_argument('--out', default=None,
+            help='Output directory. Default: next to the .blend file.')
+    parser.add_argument('--jobs', type=int, default=os.cpu_count() or 1,
+            help='Count of worker blender processes. Default: count of CPUs')
+    parser.add_argument('--blender', default=bpy.app.binary_path,
+            help='The blender executable for the worker processes. Default: this blender.')
+    parser.add_argument('--log-level', choices=[level.lower() for level in LOG_LEVELS], default=LOG_LEVELS[LOG_LEVEL_WARNING].lower(),
+            help='Messages up to this level are shown. Default: warning')
+    arguments = parser.parse_args(argv)
+
+    formats = []
+    for format_list in (arguments.format or ['txt']):
+        for format_id in format_list.split(','):
+            format_id = format_id.strip().upper()
+            if (not format_id in bom_exporters):
+                parser.error('Unknown format: ' + format_id.lower())
+            formats.append(format_id)
+    arguments.format = formats
+    arguments.log_level = arguments.log_level.upper()
+    return arguments
+
+
+
+def main(argv):
+    arguments = parse_arguments(argv)
+    set_log_level(arguments.log_level)
+    if (len(arguments.files) > 0):
+        return run_workers(arguments)
+    return run_worker(bpy.context, arguments)
+
+
+
+#
+# Creates the BoM of the loaded file and reports the result as one line on stdout.
+#
+def run_worker(context, arguments):
+    global output_directory
+    global output_filename_prepend
+    time_start = time.time()
+    blend_name = os.path.splitext(os.path.basename(bpy.data.filepath))[0]
+    error = None
+    try:
+        if (arguments.out):
+            if (not os.path.isdir(arguments.out)):
+                os.makedirs(arguments.out)
+            output_directory = arguments.out
+            # Several files' BoMs may share a directory:
+            if (blend_name):
+                output_filename_prepend = blend_name + '-'
+
+        context.scene.selection2bom_in_mode = arguments.mode
+        context.scene.selection2bom_in_formats = set(arguments.format)
+        context.scene.selection2bom_in_log_level = arguments.log_level
+
+        act(context)
+    except GroupCycleError as e:
+        error = str(e)
+    # Before 2.78 blender has no --python-exit-code, an escaping exception would exit with 0:
+    except Exception as e:
+        log_error(traceback.format_exc())
+        error = type(e).__name__ + ': ' + str(e)
+    if (error is None and len(bom_filelinks) == 0):
+        error = 'No BoM written (nothing to list?)'
+
+    result = OrderedDict([
+            ('file', bpy.data.filepath),
+            ('ok', error is None),
+            ('error', error),
+            ('seconds', round(time.time() - time_start, 3)),
+            ('outputs', bom_filelinks)
+    ])
+    print(CLI_RESULT_PREFIX + json.dumps(result))
+    if (error is None):
+        return 0
+    return 1
+
+
+
+def run_worker_process(arguments, filelink):
+    time_start = time.time()
+    command = [arguments.blender, '-b', filelink, '--python', CLI_SCRIPT_FILELINK, '--',
+            '--mode', arguments.mode, '--format', ','.join(arguments.format), '--log-level', arguments.log_level.lower()]
+    if (arguments.out):
+        command += ['--out', arguments.out]
+    result = None
+    try:
+        process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True)
+        output = process.communicate()[0]
+        for line in output.splitlines():
+            if (line.startswith(CLI_RESULT_PREFIX)):
+                result = json.loads(line[len(CLI_RESULT_PREFIX):])
+        if (result is None):
+            result = OrderedDict([('file', filelink), ('ok', False),
+                    ('error', 'Worker exited with code ' + str(process.returncode) + ' without result: ' + output[-500:]), ('outputs', [])])
+        elif (process.returncode != 0):
+            result['ok'] = False
+    except OSError as e:
+        result = OrderedDict([('file', filelink), ('ok', False), ('error', str(e)), ('outputs', [])])
+    # Including the blender start up and the file loading:
+    result['seconds_total'] = round(time.time() - time_start, 3)
+    return result
+
+
+
+#
+# Spreads the files over worker blender processes, then prints the timing summary.
+#
+def run_workers(arguments):
+    time_start = time.time()
+    jobs = max(1, min(arguments.jobs, len(arguments.files)))
+    with ThreadPoolExecutor(max_workers=jobs) as executor:
+        results = list(executor.map(lambda filelink: run_worker_process(arguments, filelink), arguments.files))
+
+    failure_count = 0
+    filelink_len_max = max([len(result['file']) for result in results])
+    print('Selection2BoM summary:')
+    for result in results:
+        status = 'ok    '
+        if (not result['ok']):
+            status = 'FAILED'
+            failure_count += 1
+        print('  ' + status + '  ' + result['file'] + getWhiteSpace(filelink_len_max - len(result['file']))
+                + '  %8.3f sec' % result['seconds_total'])
+        if (not result['ok']):
+            print('          ' + str(result.get('error')))
+        for output in result['outputs']:
+            print('          -> ' + output)
+    print('%d of %d files failed, %d jobs, %.3f sec' % (failure_count, len(results), jobs, time.time() - time_start))
+
+    if (arguments.out):
+        if (not os.path.isdir(arguments.out)):
+            os.makedirs(arguments.out)
+        with open(os.path.join(arguments.out, 'selection2bom-summary.json'), 'w') as f:
+            json.dump(results, f, indent=2)
+
+    if (failure_count > 0):
+        return 1
+    return 0
+
+
+
+#------- GENERAL BLENDER SETUP FUNCTIONS --------------------------------------#
+#REGISTER
+def register():
+    bpy.utils.register_module(__name__)
+    #bpy.utils.register_class(OBJECT_OT_Selection2BOM)
+    #bpy.utils.register_class(VIEW3D_PT_tools_selection2bom)
+
+    ## Both independent, for the input-globals see register()!
+    #bpy.types.Scene.case_sensitive = True
+
+    ## Difficult to guess unless animation or rendering-related:
+    #bpy.types.Scene.skip_non_mechanical_objects = True
+
+    # Whether to resolve groups and create BoM entries for contained objects
+    # is set in context view 3d panel.
+    bpy.types.Scene.after_how_many_create_bom_entry_recursions_to_abort = 100#kind a century :)
+
+    #mode
+    bpy.types.Scene.selection2bom_in_mode = EnumProperty(
+        name = "Mode",
+        description = "Select whether to resolve groups & group instances to its"
+                " underlaying group's contained objects or if a group"
+                " is a standalone part on its own too.",
+        items = [
+            ("0", "All group instances are atomar, i.e. a complete part on its own.", ""),
+            ("1", "Group instances are resolved recursively, only objects are complete parts.", ""),
+            ("2", "Hybrid Mode: Group instances both are parts and are resolved into the objects it contains.", "")
+        ],
+        default='0'
+    )
+    #tidyupnames
+    #bpy.types.Scene.selection2bom_in_include_hidden = BoolProperty(
+    #    name = "Include hidden objects?",
+    #    description = "Whether to include hidden objects or not.",
+    #    default = True
+    #)
+    #precision
+    bpy.types.Scene.selection2bom_in_precision = IntProperty(
+        name = "Precision ",
+        description = "Precision, i.e. digits after the comma. (e.g. 3 at default metric unit settings results in a resolution of .001m = 1mm.)"
+        #,options = {'HIDDEN'}
+        ,min = 0
+        ,max = 10   #TODO Is it true what I am telling here?
+        ,default = 3#mm <- ,001 m = 1 mm => 1 mm resolution we have using 3 digits of floating point precision.
+    )
+    #scale factor
+    bpy.types.Scene.selection2bom_in_scale_factor = IntProperty(
+        name = "Scale factor",
+        description = "Dimensions in the BoM are multiplied by this scale factor."
+        #,options = {'HIDDEN'}
+        ,min = 0
+        ,max = 1000000
+        ,default = 1#keep scale
+    )
+    # Upper bound of the count of cached dupli group dimensions and volumes:
+    bpy.types.Scene.selection2bom_in_cache_size = IntProperty(
+        name = "Cache size",
+        description = "Maximum count of group + transform combinations whose resolved dimensions and volume are cached (least recently used are dropped first), also in the cache file next to the .blend file. 0 means unbounded."
+        ,min = 0
+        ,max = 1000000
+        ,default = 4096
+    )
+    # Messages up to this level are shown in the console:
+    bpy.types.Scene.selection2bom_in_log_level = EnumProperty(
+        name = "Log level",
+        description = "Messages up to this level are shown in the console. Debug output slows down large scenes considerably.",
+        items = [(level, level.capitalize(), "") for level in LOG_LEVELS],
+        default = LOG_LEVELS[LOG_LEVEL_INFO],
+        update = lambda self, context: set_log_level(self.selection2bom_in_log_level)
+    )
+    # Shall include extra information (description, URI, ..) line:
+    bpy.types.Scene.selection2bom_in_include_info_line = BoolProperty(
+        name = "Include datablock label?",
+        description = "Whether to include an extra line per BoM entry for e.g. URI, part number, description, ...",
+        default = True
+    )
+    # Shall (generate) and include engineering drawings:
+    bpy.types.Scene.selection2bom_in_include_blueprints = BoolProperty(
+        name = "Include blueprints?",
+        description = "Whether to (generate) and inline-include blueprint for each variant of each bom entry.",
+        default = False
+    )
+    # Export formats, several may be selected (e.g. scene.selection2bom_in_formats = {'CSV', 'JSONL'}):
+    bpy.types.Scene.selection2bom_in_formats = EnumProperty(
+        name = "Formats",
+        description = "The formats the BoM is written in. All are written in one pass, each to its own file.",
+        items = [(format_id, exporter_class.label, exporter_class.description) for format_id, exporter_class in bom_exporters.items()],
+        options = {'ENUM_FLAG'},
+        default = {TextBomExporter.format_id}
+    )
+    # Update only the changed objects' contributions (see LIVE):
+    bpy.types.Scene.selection2bom_in_live = BoolProperty(
+        name = "Live",
+        description = "Keep the BoM after a run and track changes of the listed objects, the next run then only updates the changed objects. Another selection or settings cause a full run.",
+        default = False,
+        update = on_live_toggled
+    )
+    #pass
+
+
+#UNREGISTER
+def unregister():
+    bpy.utils.unregister_module(__name__)
+    #bpy.utils.unregister_class(OBJECT_OT_Selection2BOM)
+    #bpy.utils.unregister_class(VIEW3D_PT_tools_selection2bom)
+    #please tidy up
+    del bpy.types.Scene.after_how_many_create_bom_entry_recursions_to_abort
+    del bpy.types.Scene.selection2bom_in_mode
+    #del bpy.types.Scene.selection2bom_in_include_hidden
+    del bpy.types.Scene.selection2bom_in_precision
+    del bpy.types.Scene.selection2bom_in_include_info_line
+    del bpy.types.Scene.selection2bom_in_include_blueprints
+    del bpy.types.Scene.selection2bom_in_cache_size
+    del bpy.types.Scene.selection2bom_in_log_level
+    del bpy.types.Scene.selection2bom_in_formats
+    del bpy.types.Scene.selection2bom_in_live
+    set_live_handler(False)
+    #del bpy.types.Scene.selection2bom_in_scale_factor
+    #pass
+
+
+# ########################################################
+# Written by macouno for the amazing caliper measurement addon:
+# ########################################################
+
+
+# Add the distance to a string!
+def addDistance(distance, length, unit):
+    if distance:
+        return distance+' '+str(int(length))+unit
+    return str(int(length))+unit
+
+
+
+# FUNCTION FOR MAKING A NEAT METRIC SYSTEM MEASUREMENT STRING
+def getMeasureString(distance, unit_settings, precision):
+
+    system = unit_settings.system
+    # Whether or not so separate the measurement into multiple units
+    separate = unit_settings.use_separate
+    # The current measurement (multiplied by scale to get meters as a starting point)
+    m = distance * unit_settings.scale_length
+    fM = 0
+    distance = False
+
+    # From chosen to standard international (SI) conversion factors:
+    if system == 'METRIC':
+        table = [['km', 0.001], ['m', 1000], ['cm', 100], ['mm', 10]]
+    elif system == 'IMPERIAL':
+        table = [['mi', 0.000621371], ['ft', 5280], ['in', 12], ['thou', 1000]]
+
+    # Figure out where to end measuring
+    last = len(table)
+    if precision < last:
+        last = precision
+
+    for i, t in enumerate(table):
+        step = i
+        unit = t[0]
+        factor = t[1]
+        m = (m - fM) * factor
+        fM = math.floor(m)
+
+        if fM and not separate:
+            rounded = round(m, precision)
+            if precision < 1:
+                rounded = int(rounded)
+            return str(rounded) + unit
+        elif fM:
+	    # Make sure the very last measurement is rounded and not floored
+            if step > last - 1:
+                return addDistance(distance, round(m), unit)
+            distance = addDistance(distance, fM, unit)
+
+    if not distance:
+        return '-' + unit
+
+    return distance
@@ -0,0 +1,51 @@
+#-------------------------------------------------------------------------------
+#!/usr/bin/env python
+# ========= SELECTION 2 BILL OF MATERIALS - COMMAND LINE =======================
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+
+# ------- DESCRIPTION ----------------------------------------------------------
+#
+# blender -b file.blend --python object_selection2bom/__main__.py -- --mode 2 --format csv --out dir
+#
+# Run as a script, the add-on package is not imported as a package, thus this
+# file imports it (from the directory containing it), see main() of the add-on.
+#
+# ------------------------------------------------------------------------------
+
+
+
+#------- IMPORTS --------------------------------------------------------------#
+import bpy
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+import object_selection2bom
+
+
+
+#------- PROCEDURAL -----------------------------------------------------------#
+if __name__ == "__main__":
+    # Unless installed and enabled as add-on already:
+    if not hasattr(bpy.types.Scene, 'selection2bom_in_mode'):
+        object_selection2bom.register()
+    # Started from the command line, e.g. blender -b file.blend --python object_selection2bom/__main__.py -- --mode 2?
+    if ('--' in sys.argv):
+        sys.exit(object_selection2bom.main(sys.argv[sys.argv.index('--') + 1:]))
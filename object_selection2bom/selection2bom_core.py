@@ -0,0 +1,623 @@
+#-------------------------------------------------------------------------------
+#!/usr/bin/env python
+# ========= SELECTION 2 BILL OF MATERIALS - CORE ===============================
+# ##### BEGIN GPL LICENSE BLOCK #####
+#
+#  This program is free software; you can redistribute it and/or
+#  modify it under the terms of the GNU General Public License
+#  as published by the Free Software Foundation; either version 2
+#  of the License, or (at your option) any later version.
+#
+#  This program is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU General Public License for more details.
+#
+#  You should have received a copy of the GNU General Public License
+#  along with this program; if not, write to the Free Software Foundation,
+#  Inc., 51 Franklin Street, Fifth Floor, Boston, MA 02110-1301, USA.
+#
+# ##### END GPL LICENSE BLOCK #####
+
+
+# ------- DESCRIPTION ----------------------------------------------------------
+#
+# The part of the add-on that does not depend on blender: name parsing, BoM keys,
+# count maps, transform chains, caches and exporters. The objects are duck typed
+# (e.g. anything with a name), thus this can be used and tested in plain python.
+#
+# ------------------------------------------------------------------------------
+
+
+
+#------- IMPORTS --------------------------------------------------------------#
+import re
+import sys
+import csv
+import html
+import json
+
+from collections import OrderedDict
+
+
+
+#------- NAMES ----------------------------------------------------------------#
+PATTERN_OPTIONAL = '(optional' + '[-_ ]+|[-_ ]+optional)'
+PATTERN_ATOM = '(atom' + '[-_ ]+|[-_ ]+atom)'
+REGEX_OPTIONAL = re.compile(PATTERN_OPTIONAL)
+REGEX_ATOM = re.compile(PATTERN_ATOM)
+REGEX_NUMBER_ENDING = re.compile('[0-9]{3}$')
+# A material given explicitly in the name, e.g. 'Frame material:Wood'. If several are given, the first of these wins:
+MATERIAL_INDICATORS = ('material:', 'Material:', 'mat:', 'Mat:', 'M:', 'm:')
+REGEX_MATERIAL_INDICATOR = re.compile('|'.join([re.escape(indicator) for indicator in MATERIAL_INDICATORS]))
+def is_object_atomar(o):
+    return parse_name(o.name).is_atomar
+
+def is_object_optional(o):
+    return parse_name(o.name).is_optional
+
+
+
+#
+# What a name tells, see parse_name.
+#
+class ParsedName:
+    __slots__ = ('base_name', 'label', 'material', 'is_atomar', 'is_optional')
+
+    def __init__(self, base_name, label, material, is_atomar, is_optional):
+        self.base_name = base_name
+        self.label = label
+        self.material = material
+        self.is_atomar = is_atomar
+        self.is_optional = is_optional
+
+    def __repr__(self):
+        return '<ParsedName %s %s>' % (self.label, self.material)
+
+
+
+#
+# Each distinct name is parsed once into the base name (without an ending like .001),
+# the label of the BoM entry (without the material given explicitly and without the
+# atomar and optional indicators), the material given explicitly (or None) and
+# whether it is atomar or optional. All stages share this name table.
+#
+# NOTE The flags match PATTERN_ATOM and PATTERN_OPTIONAL case-insensitively in the
+# whole name (as is_object_atomar and is_object_optional always did). build_bom_entry
+# used to test for a case-sensitive 'atom' substring of the label instead, which
+# differs for names like 'ATOM_ frame' or 'Anatomy'. That test only chose the debug
+# message, thus the BoM is the same. The label is still cleaned of the indicators
+# only if it contains them in lower case.
+#
+name_table = {}
+def parse_name(name):
+    parsed_name = name_table.get(name)
+    if (parsed_name is not None):
+        return parsed_name
+
+    parts = name.rsplit('.', 1)
+    base_name = name
+    if (len(parts) > 1 and REGEX_NUMBER_ENDING.match(parts[1])):
+        base_name = parts[0]
+
+    label = base_name
+    material = None
+    indicators = REGEX_MATERIAL_INDICATOR.findall(name)
+    if (len(indicators) > 0):
+        indicator = min(indicators, key=MATERIAL_INDICATORS.index)
+        parts = name.split(indicator)
+        material = parts[1]     #material given explicitely, e.g. Aluminium (Isotope XY)
+        label = parts[0]
+
+    # Remove indicators:
+    if (label.find('atom') != -1):
+        label = REGEX_ATOM.sub('', label)
+    if (label.find('optional') != -1):
+        label = REGEX_OPTIONAL.sub('', label)
+
+    name_lower = name.lower()
+    parsed_name = ParsedName(base_name, label, material,
+            REGEX_ATOM.search(name_lower) is not None,
+            REGEX_OPTIONAL.search(name_lower) is not None)
+    name_table[name] = parsed_name
+    return parsed_name
+
+
+
+#
+# The label and the material of a BoM entry. The material given explicitly in the
+# name wins. A group instance without a material of its own takes the material all
+# the objects of its group share, or 'MIXED'. While the optional and atomar
+# indicators can be set per group instance, the label consistently is the group
+# name. Otherwise the entry counts of assemblies may be 0 if the group instance
+# naming differs from the group name.
+#
+# @param material The base name of the object's material or None.
+# @param group_name The base name of the dupli group or None.
+# @param group_materials The base names of the materials of the group's objects
+#        ('-' if one has none) or None.
+#
+def get_entry_label_and_material(parsed_name, material=None, group_name=None, group_materials=None):
+    if (material is None and group_materials is not None):
+        for group_material in group_materials:
+            if material is None:
+                material = group_material
+            elif group_material != material:
+                # Can not take over a material other than 'mixed':
+                material = 'MIXED'
+                break
+    if material is None:
+        material = '-'
+    if (parsed_name.material is not None):
+        material = parsed_name.material
+
+    label = parsed_name.label
+    if group_name:
+        label = group_name
+    return (label, material)
+
+
+
+#------- BOM KEY --------------------------------------------------------------#
+#
+# Identifies a BoM entry in all the count, info and variant maps. The fields are
+# interned and the hash is computed once, formatting happens only when writing.
+# The dimensions are the measure strings, i.e. already quantized to the
+# precision and units of the scene.
+#
+class BomKey:
+    __slots__ = ('label', 'material', 'dimensions', 'is_optional', 'hash')
+
+    def __init__(self, label, material, dimensions, is_optional=False):
+        label = sys.intern(label)
+        material = sys.intern(material)
+        dimensions = tuple([sys.intern(dimension) for dimension in dimensions])
+        is_optional = bool(is_optional)
+        object.__setattr__(self, 'label', label)
+        object.__setattr__(self, 'material', material)
+        object.__setattr__(self, 'dimensions', dimensions)
+        object.__setattr__(self, 'is_optional', is_optional)
+        object.__setattr__(self, 'hash', hash((label, material, dimensions, is_optional)))
+
+    def __setattr__(self, attribute, value):
+        raise AttributeError('BoM keys are immutable.')
+
+    def __hash__(self):
+        return self.hash
+
+    def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not BomKey or self.hash != other.hash:
+            return False
+        # Interned, thus comparing identities suffices:
+        return (self.label is other.label and self.material is other.material
+                and self.dimensions == other.dimensions and self.is_optional == other.is_optional)
+
+    def __ne__(self, other):
+        return not self.__eq__(other)
+
+    def format_dimensions(self):
+        return '[' + ' x '.join(self.dimensions) + ']'
+
+    def __repr__(self):
+        optional = ''
+        if (self.is_optional):
+            optional = ' (optional)'
+        return '<BomKey ' + self.label + ' ' + self.material + ' ' + self.format_dimensions() + optional + '>'
+
+
+
+#------- COUNT MAPS -----------------------------------------------------------#
+#
+# Every count increment goes through here, so that the contributions of a group
+# instance's objects can be recorded and replayed for further occurrences.
+# Only the innermost recorder records, the enclosing ones get the aggregated
+# increments when it is popped, see pop_contribution_recorder.
+#
+group_instance_contribution_recorders = []
+def add_count(count_map, key, amount=1):
+    if (not (key in count_map)):
+        count_map[key] = 0
+    count_map[key] += amount
+    if (len(group_instance_contribution_recorders) > 0):
+        group_instance_contribution_recorders[-1].append((count_map, key, amount))
+
+
+
+#
+# Ends the innermost recording and passes its increments on to the enclosing one.
+# @return the recorded increments, aggregated.
+#
+def pop_contribution_recorder():
+    contributions = aggregate_contributions(group_instance_contribution_recorders.pop())
+    if (len(group_instance_contribution_recorders) > 0):
+        group_instance_contribution_recorders[-1].extend(contributions)
+    return contributions
+
+
+
+#
+# Sums up the recorded increments per count map and key.
+#
+def aggregate_contributions(contributions):
+    contributions_aggregated = {}
+    for count_map, key, amount in contributions:
+        contribution_key = (id(count_map), key)
+        if (contribution_key in contributions_aggregated):
+            contributions_aggregated[contribution_key][2] += amount
+        else:
+            contributions_aggregated[contribution_key] = [count_map, key, amount]
+    return list(contributions_aggregated.values())
+
+
+
+def subtract_contributions(contributions):
+    for count_map, key, amount in contributions:
+        count_map[key] -= amount
+        if (count_map[key] <= 0):
+            del count_map[key]
+
+
+
+#------- TRANSFORM CHAINS -----------------------------------------------------#
+#
+# The chained rotation and scale matrix and the optional flag of the owning group
+# instances on the recursion path. Siblings share the same path, thus each path
+# prefix is calculated only once: one level deeper costs one matrix multiplication.
+#
+class TransformChains:
+
+    # @param identity The identity matrix.
+    # @param get_matrix Returns the 3x3 matrix (basis) of an owning group instance object.
+    # @param is_optional Returns whether an owning group instance object is optional.
+    def __init__(self, identity, get_matrix, is_optional):
+        self.identity = identity
+        self.get_matrix = get_matrix
+        self.is_optional = is_optional
+        self.cache = {}
+
+    #
+    # @param owning_group_instance_objects_key The path, i.e. the tuple of the owning group instance objects.
+    # @return (the matrix, whether any of the owning group instance objects is optional)
+    #
+    def get(self, owning_group_instance_objects_key):
+        transform_chain = self.cache.get(owning_group_instance_objects_key)
+        if (transform_chain is not None):
+            return transform_chain
+
+        owning_group_instance_objects_length = len(owning_group_instance_objects_key)
+        if (owning_group_instance_objects_length == 0):
+            return (self.identity, False)
+
+        matrix, is_optional = self.get(owning_group_instance_objects_key[0:owning_group_instance_objects_length - 1])
+        owning_group_instance_object = owning_group_instance_objects_key[owning_group_instance_objects_length - 1]
+        # Right multiplication because its reference is the mobile coordinate frame:
+        transform_chain = (
+                matrix * self.get_matrix(owning_group_instance_object),
+                is_optional or self.is_optional(owning_group_instance_object)
+        )
+        self.cache[owning_group_instance_objects_key] = transform_chain
+        return transform_chain
+
+    # The path is done, thus its chain is not required anymore.
+    def discard(self, owning_group_instance_objects_key):
+        self.cache.pop(owning_group_instance_objects_key, None)
+
+
+
+#------- CACHES ---------------------------------------------------------------#
+#
+# Least recently used cache of bounded size, keeping track of hits and misses.
+#
+class LRUCache:
+
+    def __init__(self, size_max=1024):
+        self.size_max = size_max
+        self.entries = OrderedDict()
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+        self.is_modified = False
+
+    def __len__(self):
+        return len(self.entries)
+
+    # @return the cached value or None if not cached.
+    def get(self, key):
+        if not (key in self.entries):
+            self.miss_count += 1
+            return None
+        self.hit_count += 1
+        # Most recently used entries reside at the end:
+        self.entries.move_to_end(key)
+        return self.entries[key]
+
+    def put(self, key, value):
+        self.entries[key] = value
+        self.is_modified = True
+        self.entries.move_to_end(key)
+        while (self.size_max > 0 and len(self.entries) > self.size_max):
+            self.entries.popitem(last=False)
+            self.eviction_count += 1
+
+    def reset_statistics(self):
+        self.hit_count = 0
+        self.miss_count = 0
+        self.eviction_count = 0
+
+    def get_statistics(self):
+        return 'hits: %d, misses: %d, evictions: %d, size: %d/%d' % (self.hit_count, self.miss_count, self.eviction_count, len(self.entries), self.size_max)
+
+
+
+#------- EXPORTERS -------------------------------------------------------------#
+#
+# All found bom entries are written in one pass over the count maps. Each row is
+# handed to every selected exporter, which formats and streams it to its own file.
+# Further formats are plugged in via register_bom_exporter() of the add-on.
+#
+PREPEND_IF_OPTIONAL = '('
+APPEND_IF_OPTIONAL = ')'
+WRITE_BUFFER_SIZE = 1024 * 1024
+class BomExporter:
+    format_id = None
+    label = None
+    description = ''
+    file_ending = '.txt'
+
+    def __init__(self, context, filelink):
+        self.context = context
+        self.filelink = filelink
+        # The blueprints are named after the filelink of the first format, see build_and_store_bom_entry:
+        self.blueprint_base_filelink = filelink
+        # The directory the blueprint filelinks are relative to (the .blend file's):
+        self.blueprint_root = ''
+        self.f = None
+
+    def get_file_ending(self, context):
+        return self.file_ending
+
+    def get_blueprint_filelink(self, entry, variant_volume):
+        return build_blueprint_filelink(self.blueprint_base_filelink, entry, variant_volume, self.blueprint_root)
+
+    def open(self):
+        self.f = open(self.filelink, 'w', buffering=WRITE_BUFFER_SIZE)
+
+    def close(self):
+        result = self.f.tell() > 0
+        self.f.close()
+        return result
+
+    def begin(self):
+        pass
+
+    # @param info Extra information line (URI, part number, ...) or None.
+    # @param variants Volume -> count map or None.
+    def write_entry(self, entry, entry_count, info, variants):
+        pass
+
+    def begin_assemblies(self):
+        pass
+
+    def write_assembly(self, assembly, assembly_count):
+        pass
+
+    # @param entry_count The count per assembly.
+    def write_assembly_entry(self, assembly, entry, entry_count):
+        pass
+
+    def end_assembly(self, assembly):
+        pass
+
+    def end(self):
+        pass
+
+
+
+#
+# @param root The directory the filelink is made relative to.
+#
+def build_blueprint_filelink(filelink, entry, variant_volume, root=''):
+    filelink_relative_to_blend = filelink
+    if (root != ''):
+        filelink_relative_to_blend = filelink.replace(root, '')
+    if filelink_relative_to_blend.startswith('/'):
+        filelink_relative_to_blend = '.' + filelink_relative_to_blend#.replace('^/', '')
+
+    # TODO This filelink might be too long for most filesystems.
+    optional = ''
+    if (entry.is_optional):
+        optional = '1'
+    # Keeps the file names of the blueprints generated so far:
+    entry_name = entry.label + '___' + entry.material + '___' + entry.format_dimensions() + '___' + optional
+    blueprint_filelink = filelink_relative_to_blend + '__entry_' + entry_name.replace(' ', '_').replace('[', '').replace(']', '') + '__volume_' + str(variant_volume) + '__blueprint.jpg'
+
+    return blueprint_filelink
+
+
+
+#
+# Comma separated values, one row per part, blueprint variant, assembly and assembly part.
+#
+class CsvBomExporter(BomExporter):
+    format_id = 'CSV'
+    label = 'CSV'
+    description = 'Comma separated values, e.g. for spreadsheets or ERP imports'
+    file_ending = '.csv'
+
+    def open(self):
+        self.f = open(self.filelink, 'w', buffering=WRITE_BUFFER_SIZE, newline='')
+        self.writer = csv.writer(self.f)
+
+    def write_row(self, section, assembly, entry_count, entry, info='', volume=''):
+        assembly_label = ''
+        if assembly is not None:
+            assembly_label = assembly.label
+        self.writer.writerow([section, assembly_label, entry_count, entry.label, entry.material]
+                + list(entry.dimensions) + [int(entry.is_optional), info, volume])
+
+    def begin(self):
+        self.writer.writerow(['section', 'assembly', 'count', 'label', 'material',
+                'dimension_x', 'dimension_y', 'dimension_z', 'optional', 'info', 'volume'])
+
+    def write_entry(self, entry, entry_count, info, variants):
+        if info is None or not self.context.scene.selection2bom_in_include_info_line:
+            info = ''
+        self.write_row('part', None, entry_count, entry, info=info)
+        if variants is not None:
+            for variant_volume, variant_count in variants.items():
+                self.write_row('variant', None, variant_count, entry, volume=variant_volume)
+
+    def write_assembly(self, assembly, assembly_count):
+        self.write_row('assembly', None, assembly_count, assembly)
+
+    def write_assembly_entry(self, assembly, entry, entry_count):
+        self.write_row('assembly_part', assembly, entry_count, entry)
+
+
+
+#
+# One JSON object per line.
+#
+class JsonLinesBomExporter(BomExporter):
+    format_id = 'JSONL'
+    label = 'JSON Lines'
+    description = 'One JSON object per part, assembly and assembly part'
+    file_ending = '.jsonl'
+
+    def write_record(self, record):
+        self.f.write(json.dumps(record, ensure_ascii=False))
+        self.f.write('\n')
+
+    def to_record(self, section, entry, entry_count):
+        return OrderedDict([
+                ('section', section),
+                ('count', entry_count),
+                ('label', entry.label),
+                ('material', entry.material),
+                ('dimensions', list(entry.dimensions)),
+                ('optional', entry.is_optional)
+        ])
+
+    def write_entry(self, entry, entry_count, info, variants):
+        record = self.to_record('part', entry, entry_count)
+        if info is not None and self.context.scene.selection2bom_in_include_info_line:
+            record['info'] = info
+        if variants is not None:
+            record['variants'] = [OrderedDict([('volume', variant_volume), ('count', variant_count)])
+                    for variant_volume, variant_count in variants.items()]
+        self.write_record(record)
+
+    def write_assembly(self, assembly, assembly_count):
+        self.write_record(self.to_record('assembly', assembly, assembly_count))
+
+    def write_assembly_entry(self, assembly, entry, entry_count):
+        record = self.to_record('assembly_part', entry, entry_count)
+        record['assembly'] = assembly.label
+        self.write_record(record)
+
+
+
+#
+# Markdown pipe tables, one for the parts and one per assembly.
+#
+class MarkdownBomExporter(BomExporter):
+    format_id = 'MD'
+    label = 'Markdown'
+    description = 'Markdown pipe tables'
+    file_ending = '.markdown' # '.md' is taken by the text table if blueprints are included.
+
+    def cell(self, text):
+        return text.replace('|', '\\|')
+
+    def format_count(self, entry, count):
+        if (entry.is_optional):
+            return PREPEND_IF_OPTIONAL + str(count) + APPEND_IF_OPTIONAL
+        return str(count)
+
+    def write_table_header(self):
+        self.f.write('| # | Label | Material | Dimensions |\n|--:|---|---|---|\n')
+
+    def write_row(self, entry, entry_count):
+        self.f.write('| ' + self.format_count(entry, entry_count) + ' | ' + self.cell(entry.label) + ' | '
+                + self.cell(entry.material) + ' | ' + entry.format_dimensions() + ' |\n')
+
+    def begin(self):
+        self.f.write('# Bill of Materials\n\n')
+        self.write_table_header()
+
+    def write_entry(self, entry, entry_count, info, variants):
+        self.write_row(entry, entry_count)
+        if info is not None and self.context.scene.selection2bom_in_include_info_line:
+            self.f.write('| | ' + self.cell(info) + ' | | |\n')
+        if variants is not None and self.context.scene.selection2bom_in_include_blueprints:
+            for variant_volume, variant_count in variants.items():
+                self.f.write('| ' + str(variant_count) + ' | ![blueprint](' + self.get_blueprint_filelink(entry, variant_volume)
+                        + ' "Volume: ' + str(variant_volume) + '") | | |\n')
+
+    def begin_assemblies(self):
+        self.f.write('\n## Assemblies\n')
+
+    def write_assembly(self, assembly, assembly_count):
+        self.f.write('\n### ' + self.format_count(assembly, assembly_count) + 'x ' + self.cell(assembly.label) + ' '
+                + self.cell(assembly.material) + ' ' + assembly.format_dimensions() + '\n\n')
+        self.write_table_header()
+
+    def write_assembly_entry(self, assembly, entry, entry_count):
+        self.write_row(entry, entry_count)
+
+
+
+#
+# A self-contained html document.
+#
+class HtmlBomExporter(BomExporter):
+    format_id = 'HTML'
+    label = 'HTML'
+    description = 'HTML document with one table for the parts and one per assembly'
+    file_ending = '.html'
+
+    def format_count(self, entry, count):
+        if (entry.is_optional):
+            return PREPEND_IF_OPTIONAL + str(count) + APPEND_IF_OPTIONAL
+        return str(count)
+
+    def write_table_begin(self):
+        self.f.write('<table>\n<thead><tr><th>#</th><th>Label</th><th>Material</th><th>Dimensions</th></tr></thead>\n<tbody>\n')
+
+    def write_row(self, entry, entry_count):
+        self.f.write('<tr><td>' + self.format_count(entry, entry_count) + '</td><td>' + html.escape(entry.label)
+                + '</td><td>' + html.escape(entry.material) + '</td><td>' + html.escape(entry.format_dimensions()) + '</td></tr>\n')
+
+    def begin(self):
+        self.f.write('<!DOCTYPE html>\n<html>\n<head><meta charset="utf-8"/><title>Bill of Materials</title></head>\n<body>\n<h1>Bill of Materials</h1>\n')
+        self.write_table_begin()
+
+    def write_entry(self, entry, entry_count, info, variants):
+        self.write_row(entry, entry_count)
+        if info is not None and self.context.scene.selection2bom_in_include_info_line:
+            self.f.write('<tr><td></td><td colspan="3">' + html.escape(info) + '</td></tr>\n')
+        if variants is not None and self.context.scene.selection2bom_in_include_blueprints:
+            for variant_volume, variant_count in variants.items():
+                self.f.write('<tr><td>' + str(variant_count) + '</td><td colspan="3"><img src="' + html.escape(self.get_blueprint_filelink(entry, variant_volume))
+                        + '" title="Volume: ' + str(variant_volume) + '" alt="blueprint"/></td></tr>\n')
+
+    def begin_assemblies(self):
+        self.f.write('</tbody>\n</table>\n<h2>Assemblies</h2>\n')
+
+    def write_assembly(self, assembly, assembly_count):
+        self.f.write('<h3>' + self.format_count(assembly, assembly_count) + 'x ' + html.escape(assembly.label) + ' '
+                + html.escape(assembly.material) + ' ' + html.escape(assembly.format_dimensions()) + '</h3>\n')
+        self.write_table_begin()
+
+    def write_assembly_entry(self, assembly, entry, entry_count):
+        self.write_row(entry, entry_count)
+
+    def end_assembly(self, assembly):
+        self.f.write('</tbody>\n</table>\n')
+
+    def end(self):
+        if (self.context.scene.selection2bom_in_mode != '2'):
+            self.f.write('</tbody>\n</table>\n')
+        self.f.write('</body>\n</html>\n')
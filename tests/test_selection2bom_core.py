@@ -0,0 +1,274 @@
+import os
+import sys
+import csv
+import json
+
+from types import SimpleNamespace
+
+import pytest
+
+# The package itself requires blender, its blender independent part does not:
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'object_selection2bom'))
+import selection2bom_core as core
+from selection2bom_core import (
+        parse_name, get_entry_label_and_material, BomKey, add_count, pop_contribution_recorder,
+        subtract_contributions, TransformChains, LRUCache, build_blueprint_filelink,
+        CsvBomExporter, JsonLinesBomExporter, MarkdownBomExporter, HtmlBomExporter)
+
+
+
+@pytest.fixture(autouse=True)
+def clear_state():
+    core.name_table.clear()
+    del core.group_instance_contribution_recorders[:]
+    yield
+    core.name_table.clear()
+    del core.group_instance_contribution_recorders[:]
+
+
+
+def make_context(mode='0', include_info_line=True, include_blueprints=False):
+    return SimpleNamespace(scene=SimpleNamespace(
+            selection2bom_in_mode=mode,
+            selection2bom_in_include_info_line=include_info_line,
+            selection2bom_in_include_blueprints=include_blueprints))
+
+
+
+#------- NAMES ----------------------------------------------------------------#
+def test_parse_name_strips_the_number_ending():
+    parsed_name = parse_name('Bolt.012')
+    assert parsed_name.base_name == 'Bolt'
+    assert parsed_name.label == 'Bolt'
+    assert parsed_name.material is None
+    assert not parsed_name.is_atomar
+    assert not parsed_name.is_optional
+
+
+
+def test_parse_name_keeps_other_endings():
+    assert parse_name('Bolt.M8').base_name == 'Bolt.M8'
+    assert parse_name('Bolt.0123').base_name == 'Bolt.0123'
+
+
+
+def test_parse_name_material_indicator():
+    parsed_name = parse_name('Frame material:Wood')
+    assert parsed_name.label == 'Frame '
+    assert parsed_name.material == 'Wood'
+
+
+
+def test_parse_name_first_material_indicator_wins():
+    # 'material:' takes precedence over 'M:' regardless of the position:
+    assert parse_name('Plate M:Steel material:Brass').material == 'Brass'
+
+
+
+def test_parse_name_indicators():
+    parsed_name = parse_name('Wheel_atom_optional')
+    assert parsed_name.is_atomar
+    assert parsed_name.is_optional
+    assert parsed_name.label == 'Wheel'
+
+
+
+def test_parse_name_indicators_are_case_insensitive():
+    parsed_name = parse_name('ATOM_Frame')
+    assert parsed_name.is_atomar
+    # The label is cleaned of the lower case indicators only:
+    assert parsed_name.label == 'ATOM_Frame'
+    assert not parse_name('Anatomy').is_atomar
+
+
+
+def test_parse_name_is_memoized():
+    assert parse_name('Nut.001') is parse_name('Nut.001')
+
+
+
+def test_object_flags_read_the_name():
+    o = SimpleNamespace(name='Cover_optional')
+    assert core.is_object_optional(o)
+    assert not core.is_object_atomar(o)
+
+
+
+def test_entry_label_and_material():
+    assert get_entry_label_and_material(parse_name('Bolt.001'), 'Steel') == ('Bolt', 'Steel')
+    assert get_entry_label_and_material(parse_name('Bolt')) == ('Bolt', '-')
+    assert get_entry_label_and_material(parse_name('Bolt material:Brass'), 'Steel') == ('Bolt ', 'Brass')
+
+
+
+def test_entry_label_and_material_of_group_instance():
+    parsed_name = parse_name('Wheel.003')
+    assert get_entry_label_and_material(parsed_name, None, 'WheelGroup', iter(['Rubber', 'Rubber'])) == ('WheelGroup', 'Rubber')
+    assert get_entry_label_and_material(parsed_name, None, 'WheelGroup', iter(['Rubber', 'Steel'])) == ('WheelGroup', 'MIXED')
+    # The group instance's own material wins over the group's:
+    assert get_entry_label_and_material(parsed_name, 'Steel', 'WheelGroup', iter(['Rubber'])) == ('WheelGroup', 'Steel')
+
+
+
+#------- BOM KEY --------------------------------------------------------------#
+def test_bom_key_equality():
+    key = BomKey('Bolt', 'Steel', ('8 mm', '8 mm', '40 mm'))
+    assert key == BomKey('Bo' + 'lt', 'Steel', ['8 mm', '8 mm', '40 mm'])
+    assert hash(key) == hash(BomKey('Bolt', 'Steel', ('8 mm', '8 mm', '40 mm')))
+    assert key != BomKey('Bolt', 'Steel', ('8 mm', '8 mm', '40 mm'), is_optional=True)
+    assert key.format_dimensions() == '[8 mm x 8 mm x 40 mm]'
+
+
+
+def test_bom_key_is_immutable():
+    key = BomKey('Bolt', 'Steel', ('1', '2', '3'))
+    with pytest.raises(AttributeError):
+        key.label = 'Nut'
+
+
+
+#------- COUNT MAPS -----------------------------------------------------------#
+def test_add_count_records_contributions():
+    count_map = {}
+    contributions = []
+    core.group_instance_contribution_recorders.append(contributions)
+    add_count(count_map, 'a')
+    add_count(count_map, 'a', 2)
+    add_count(count_map, 'b')
+    contributions = pop_contribution_recorder()
+    add_count(count_map, 'c')
+    assert count_map == {'a': 3, 'b': 1, 'c': 1}
+    assert sorted([(key, amount) for _, key, amount in contributions]) == [('a', 3), ('b', 1)]
+
+
+
+def test_nested_recorders_pass_on_aggregated_contributions():
+    count_map = {}
+    outer = []
+    inner = []
+    core.group_instance_contribution_recorders.append(outer)
+    add_count(count_map, 'a')
+    core.group_instance_contribution_recorders.append(inner)
+    add_count(count_map, 'b')
+    add_count(count_map, 'b')
+    assert len(outer) == 1
+    assert [(key, amount) for _, key, amount in pop_contribution_recorder()] == [('b', 2)]
+    assert sorted([(key, amount) for _, key, amount in pop_contribution_recorder()]) == [('a', 1), ('b', 2)]
+
+
+
+def test_subtract_contributions_removes_entries_no_longer_counted():
+    count_map = {'a': 3, 'b': 1}
+    subtract_contributions([(count_map, 'a', 1), (count_map, 'b', 1)])
+    assert count_map == {'a': 2}
+
+
+
+#------- TRANSFORM CHAINS -----------------------------------------------------#
+class Part:
+
+    def __init__(self, name, scale):
+        self.name = name
+        self.scale = scale
+
+
+
+def test_transform_chains():
+    # Scale only chains, thus numbers will do as matrices:
+    a = Part('A', 2.0)
+    b = Part('B_optional', 3.0)
+    transform_chains = TransformChains(1.0, lambda o: o.scale, core.is_object_optional)
+    assert transform_chains.get(()) == (1.0, False)
+    assert transform_chains.get((a,)) == (2.0, False)
+    assert transform_chains.get((a, b)) == (6.0, True)
+    assert set(transform_chains.cache.keys()) == set([(a,), (a, b)])
+    transform_chains.discard((a, b))
+    assert set(transform_chains.cache.keys()) == set([(a,)])
+
+
+
+#------- CACHES ---------------------------------------------------------------#
+def test_lru_cache_evicts_the_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    assert cache.get('a') == 1
+    cache.put('c', 3)
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert (cache.hit_count, cache.miss_count, cache.eviction_count) == (3, 1, 1)
+
+
+
+#------- EXPORTERS -------------------------------------------------------------#
+def test_build_blueprint_filelink():
+    entry = BomKey('Bolt M8', 'Steel', ('1', '2', '3'), is_optional=True)
+    assert build_blueprint_filelink('/models/BoM-Scene.txt', entry, 0.5, root='/models/') == \
+            'BoM-Scene.txt__entry_Bolt_M8___Steel___1_x_2_x_3___1__volume_0.5__blueprint.jpg'
+
+
+
+def export(exporter_class, tmp_path, context):
+    bolt = BomKey('Bolt', 'Steel', ('1', '2', '3'))
+    wheel = BomKey('Wheel', 'Rubber', ('4', '5', '6'), is_optional=True)
+    exporter = exporter_class(context, str(tmp_path / ('BoM' + exporter_class.file_ending)))
+    exporter.open()
+    exporter.begin()
+    exporter.write_entry(bolt, 4, 'http://example.org/bolt', {1.5: 4})
+    exporter.write_entry(wheel, 2, None, None)
+    if (context.scene.selection2bom_in_mode == '2'):
+        exporter.begin_assemblies()
+        exporter.write_assembly(wheel, 2)
+        exporter.write_assembly_entry(wheel, bolt, 2)
+        exporter.end_assembly(wheel)
+    exporter.end()
+    assert exporter.close()
+    with open(exporter.filelink) as f:
+        return f.read()
+
+
+
+def test_csv_exporter(tmp_path):
+    rows = list(csv.reader(export(CsvBomExporter, tmp_path, make_context(mode='2')).splitlines()))
+    assert rows[0][0:3] == ['section', 'assembly', 'count']
+    assert rows[1] == ['part', '', '4', 'Bolt', 'Steel', '1', '2', '3', '0', 'http://example.org/bolt', '']
+    assert rows[2] == ['variant', '', '4', 'Bolt', 'Steel', '1', '2', '3', '0', '', '1.5']
+    assert rows[3][0:5] == ['part', '', '2', 'Wheel', 'Rubber']
+    assert rows[4][0:4] == ['assembly', '', '2', 'Wheel']
+    assert rows[5][0:4] == ['assembly_part', 'Wheel', '2', 'Bolt']
+
+
+
+def test_json_lines_exporter(tmp_path):
+    records = [json.loads(line) for line in export(JsonLinesBomExporter, tmp_path, make_context(include_info_line=False)).splitlines()]
+    assert len(records) == 2
+    assert records[0]['label'] == 'Bolt'
+    assert records[0]['variants'] == [{'volume': 1.5, 'count': 4}]
+    assert not ('info' in records[0])
+    assert records[1]['optional'] is True
+
+
+
+def test_markdown_exporter(tmp_path):
+    text = export(MarkdownBomExporter, tmp_path, make_context(mode='2', include_blueprints=True))
+    assert '| 4 | Bolt | Steel | [1 x 2 x 3] |' in text
+    assert '| (2) | Wheel | Rubber | [4 x 5 x 6] |' in text
+    assert '### (2)x Wheel' in text
+    # The blueprints are named after the filelink the exporter was given:
+    assert 'BoM.markdown__entry_Bolt___Steel___1_x_2_x_3_____volume_1.5__blueprint.jpg "Volume: 1.5")' in text
+
+
+
+def test_html_exporter_escapes(tmp_path):
+    context = make_context()
+    exporter = HtmlBomExporter(context, str(tmp_path / 'BoM.html'))
+    exporter.open()
+    exporter.begin()
+    exporter.write_entry(BomKey('<Bolt>', 'Steel & Iron', ('1', '2', '3')), 1, None, None)
+    exporter.end()
+    exporter.close()
+    text = (tmp_path / 'BoM.html').read_text()
+    assert '&lt;Bolt&gt;' in text
+    assert 'Steel &amp; Iron' in text
+    assert text.rstrip().endswith('</html>')